@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function
+
+import platform
+import timeit
+
+from pendulum import helpers
+
+
+def header(title):
+    """
+    Prints the title of a benchmark with the interpreter it runs on
+    and whether the C extensions are used.
+
+    :param title: The title of the benchmark
+    :type title: str
+    """
+    print('{} ({} {}, {} extensions)'.format(
+        title,
+        platform.python_implementation(),
+        platform.python_version(),
+        'without' if helpers.scan_iso8601 is not None else 'with C'
+    ))
+
+
+def bench(name, func, number=10000, repeat=5, items=1):
+    """
+    Prints and returns the best time of a function,
+    in microseconds per processed item.
+
+    :param name: The name of the case
+    :type name: str
+
+    :param func: The function to time
+    :type func: callable
+
+    :param number: The number of calls per run
+    :type number: int
+
+    :param repeat: The number of runs
+    :type repeat: int
+
+    :param items: The number of items processed by a call
+    :type items: int
+
+    :rtype: float
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    best *= 1e6 / (number * items)
+    print('  {:<40} {:>8.3f} us'.format(name, best))
+
+    return best
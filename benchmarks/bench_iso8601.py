@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parsing ISO 8601 strings: the pure Python scanner used without
+the C extension against the COMMON regular expression it replaced.
+
+    PYTHONPATH=. python benchmarks/bench_iso8601.py
+"""
+
+from __future__ import print_function
+
+import pendulum
+
+from pendulum._extensions import helpers as pure
+from pendulum.parsing.parser import Parser
+
+from _timing import header, bench
+
+try:
+    from pendulum._extensions import _helpers as native
+except ImportError:
+    native = None
+
+STRINGS = [
+    '2016-10-06',
+    '20161006',
+    '2016-10-06T12:34:56',
+    '2016-10-06T12:34:56.123456',
+    '2016-10-06T12:34:56+02:00',
+    '2016-10-06 12:34:56.123456Z',
+    '20161006T123456-0530',
+    '2008-W39-6',
+]
+
+
+def main():
+    parser = Parser()
+    n = len(STRINGS)
+
+    def each(parse):
+        def run():
+            for text in STRINGS:
+                parse(text)
+
+        return run
+
+    header('ISO 8601 parsing per string')
+    bench('COMMON regex (previous)', each(parser.parse_common), 2000, items=n)
+    bench('pure Python scanner', each(pure.scan_iso8601), 2000, items=n)
+
+    if native is not None:
+        bench(
+            'C parse_iso8601()',
+            each(lambda text: native.parse_iso8601(text, False)), 2000, items=n
+        )
+
+    bench('pendulum.parse()', each(pendulum.parse), 2000, items=n)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+Breaking down UNIX times in the pure Python fallback:
+the closed-form local_time() and the batched local_times()
+against the previous implementation walking years in chunks.
+
+    PYTHONPATH=. python benchmarks/bench_local_time.py
+"""
+
+from __future__ import print_function
+
+import random
+
+from pytzdata import timezones
+
+from pendulum._extensions import helpers as pure
+from pendulum.tz.loader import Loader
+from pendulum.constants import (
+    EPOCH_YEAR, SECS_PER_DAY, SECS_PER_HOUR, SECS_PER_MIN,
+    SECS_PER_400_YEARS, SECS_PER_100_YEARS, SECS_PER_4_YEARS, SECS_PER_YEAR,
+    MONTHS_OFFSETS, TM_JANUARY, TM_DECEMBER
+)
+
+from _timing import header, bench
+
+try:
+    from pendulum._extensions import _helpers as native
+except ImportError:
+    native = None
+
+
+def chunked_local_time(unix_time, utc_offset, microseconds):
+    """
+    The previous pure Python implementation, for reference.
+    """
+    year = EPOCH_YEAR
+    seconds = int(unix_time)
+
+    if seconds >= 0:
+        seconds -= 10957 * SECS_PER_DAY
+        year += 30
+    else:
+        seconds += (146097 - 10957) * SECS_PER_DAY
+        year -= 370
+
+    seconds += utc_offset
+
+    year += 400 * (seconds // SECS_PER_400_YEARS)
+    seconds %= SECS_PER_400_YEARS
+    if seconds < 0:
+        seconds += SECS_PER_400_YEARS
+        year -= 400
+
+    leap_year = 1
+
+    sec_per_100years = SECS_PER_100_YEARS[leap_year]
+    while seconds >= sec_per_100years:
+        seconds -= sec_per_100years
+        year += 100
+        leap_year = 0
+        sec_per_100years = SECS_PER_100_YEARS[leap_year]
+
+    sec_per_4years = SECS_PER_4_YEARS[leap_year]
+    while seconds >= sec_per_4years:
+        seconds -= sec_per_4years
+        year += 4
+        leap_year = 1
+        sec_per_4years = SECS_PER_4_YEARS[leap_year]
+
+    sec_per_year = SECS_PER_YEAR[leap_year]
+    while seconds >= sec_per_year:
+        seconds -= sec_per_year
+        year += 1
+        leap_year = 0
+        sec_per_year = SECS_PER_YEAR[leap_year]
+
+    month = TM_DECEMBER + 1
+    day = seconds // SECS_PER_DAY + 1
+    seconds %= SECS_PER_DAY
+    while month != TM_JANUARY + 1:
+        month_offset = MONTHS_OFFSETS[leap_year][month]
+        if day > month_offset:
+            day -= month_offset
+            break
+
+        month -= 1
+
+    hour = seconds // SECS_PER_HOUR
+    seconds %= SECS_PER_HOUR
+    minute = seconds // SECS_PER_MIN
+    second = seconds % SECS_PER_MIN
+
+    return (
+        year, month, day,
+        hour, minute, second, microseconds
+    )
+
+
+def main():
+    rng = random.Random(0)
+    # From 1900 to 2100
+    times = [rng.randint(-2208988800, 4102444800) for _ in range(10000)]
+    sorted_times = sorted(times)
+
+    assert [pure.local_time(t, 3600, 0) for t in times] == [
+        chunked_local_time(t, 3600, 0) for t in times
+    ]
+
+    header('local_time() per time, from 1900 to 2100')
+
+    def each(local_time, values):
+        def run():
+            for t in values:
+                local_time(t, 3600, 0)
+
+        return run
+
+    n = len(times)
+    bench('chunked (previous)', each(chunked_local_time, times), 5, items=n)
+    bench('closed-form', each(pure.local_time, times), 5, items=n)
+    bench('local_times()', lambda: pure.local_times(times, 3600), 5, items=n)
+    bench(
+        'local_times(), sorted',
+        lambda: pure.local_times(sorted_times, 3600), 5, items=n
+    )
+
+    if native is not None:
+        bench('C local_time()', each(native.local_time, times), 5, items=n)
+
+    def load_all():
+        for name in timezones:
+            Loader.load(name)
+
+    header('Loading timezones, per zone')
+    bench('Loader.load()', load_all, 1, 3, items=len(timezones))
+
+
+if __name__ == '__main__':
+    main()
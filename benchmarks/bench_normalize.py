@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Throughput of the normalize command on a generated CSV export,
+in one process and in a process pool.
+
+    PYTHONPATH=. python benchmarks/bench_normalize.py
+"""
+
+from __future__ import print_function
+
+import io
+import multiprocessing
+import random
+import timeit
+
+from pendulum import Pendulum
+from pendulum.normalizer import Normalizer, normalize_files
+
+from _timing import header
+
+LINES = 200000
+
+
+def generate(lines):
+    rng = random.Random(0)
+    output = io.BytesIO()
+    output.write(b'id,ts,value\n')
+    for i in range(lines):
+        ts = 946684800 + rng.randint(0, 20 * 365 * 86400)
+        output.write('{},{}Z,{}\n'.format(
+            i, _iso8601(ts), rng.random()
+        ).encode('ascii'))
+
+    return output.getvalue()
+
+
+def _iso8601(ts):
+    return Pendulum.utcfromtimestamp(ts).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def main():
+    data = generate(LINES)
+    cpus = multiprocessing.cpu_count()
+
+    header('normalize, {} CSV lines ({:.1f} MB) to Europe/Paris'.format(
+        LINES, len(data) / 1e6
+    ))
+
+    # The pool is always measured, even on a single CPU
+    for jobs in sorted({1, max(cpus, 2)}):
+        def run():
+            normalize_files(
+                [io.BytesIO(data)], io.BytesIO(),
+                Normalizer(1, to='Europe/Paris'),
+                header=True, jobs=jobs
+            )
+
+        best = min(timeit.repeat(run, number=1, repeat=3))
+        name = '{} process{}'.format(jobs, 'es' if jobs > 1 else '')
+        print('  {:<40} {:>8.0f} lines/s {:>6.1f} MB/s'.format(
+            name, LINES / best, len(data) / best / 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
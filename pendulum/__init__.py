@@ -6,6 +6,8 @@ from .date import Date
 from .time import Time
 from .interval import Interval
 from .period import Period
+from .clock import Clock
+from .array import PendulumArray
 
 # Mimicking standard library
 datetime = Pendulum
@@ -45,7 +47,13 @@ set_formatter = Global.set_formatter
 get_formatter = Global.get_formatter
 
 # Helpers
-from .parser import parse
+from .parser import (
+    parse, try_parse, parse_many, parse_timestamp, parse_timestamps,
+    parse_timestamp_column, parse_duration, parse_durations,
+    parse_interval, parse_intervals
+)
+from ._numpy import to_datetime64
+from .formatting import compile_format
 
 instance = Pendulum.instance
 now = Pendulum.now
@@ -57,10 +65,17 @@ create = Pendulum.create
 from_format = Pendulum.create_from_format
 strptime = Pendulum.strptime
 from_timestamp = Pendulum.create_from_timestamp
+from_timestamps = Pendulum.from_timestamps
+from_fields = Pendulum.from_fields
+from_datetime64 = Pendulum.from_datetime64
 set_to_string_format = Pendulum.set_to_string_format
 reset_to_string_format = Pendulum.reset_to_string_format
 set_transition_rule = Pendulum.set_transition_rule
 get_transition_rule = Pendulum.get_transition_rule
+floor_timestamps = Pendulum.floor_timestamps
+ceil_timestamps = Pendulum.ceil_timestamps
+round_timestamps = Pendulum.round_timestamps
+isoformat_many = Pendulum.isoformat_many
 
 # Standard helpers
 min = Pendulum.min
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import argparse
+import io
+import sys
+
+from .normalizer import Normalizer, normalize_files, read_header
+
+
+def _open(path, mode):
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+
+        return getattr(stream, 'buffer', stream)
+
+    return io.open(path, mode)
+
+
+def _column(args, f):
+    """
+    Returns the column to normalize
+    and the header line read to find it, if any.
+
+    :rtype: tuple
+    """
+    if args.input_format == 'ndjson':
+        return args.column, None
+
+    if args.column.isdigit():
+        return int(args.column), None
+
+    if args.no_header:
+        raise ValueError(
+            'Columns must be given by index for files without header'
+        )
+
+    header_line, columns = read_header(f, args.delimiter)
+    if args.column not in columns:
+        raise ValueError('Unknown column "{}"'.format(args.column))
+
+    return columns.index(args.column), header_line
+
+
+def normalize(args):
+    files = [_open(path, 'rb') for path in args.files]
+    output = _open(args.output, 'wb')
+
+    try:
+        column, header_line = _column(args, files[0])
+        normalizer = Normalizer(
+            column,
+            input_format=args.input_format,
+            tz=args.tz,
+            to=args.to,
+            fmt=args.format,
+            formatter=args.formatter,
+            locale=args.locale,
+            day_first=args.day_first,
+            sniff=args.sniff,
+            errors=args.errors,
+            delimiter=args.delimiter
+        )
+
+        normalize_files(
+            files, output, normalizer,
+            header=args.input_format == 'csv' and not args.no_header,
+            header_line=header_line,
+            jobs=args.jobs,
+            chunk_size=args.chunk_size
+        )
+    finally:
+        output.flush()
+        for path, f in zip(args.files + [args.output], files + [output]):
+            if path != '-':
+                f.close()
+
+
+def main(argv=None):
+    """
+    Runs the command line interface.
+
+    :param argv: The arguments, sys.argv[1:] by default
+    :type argv: list or None
+
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog='python -m pendulum')
+    subparsers = parser.add_subparsers(dest='command')
+
+    normalize_parser = subparsers.add_parser(
+        'normalize',
+        help='Normalize the timestamps of CSV or NDJSON files.'
+    )
+    normalize_parser.add_argument(
+        'files', nargs='*', default=['-'],
+        help='The input files, the standard input by default.'
+    )
+    normalize_parser.add_argument(
+        '-c', '--column', required=True,
+        help='The CSV column name or index, or the NDJSON key.'
+    )
+    normalize_parser.add_argument(
+        '-i', '--input-format', choices=Normalizer.FORMATS, default='csv',
+        help='The format of the input files.'
+    )
+    normalize_parser.add_argument(
+        '--tz', default='UTC',
+        help='The timezone of the timestamps without offset.'
+    )
+    normalize_parser.add_argument(
+        '--day-first', action='store_true',
+        help='Parse ambiguous dates day first.'
+    )
+    normalize_parser.add_argument(
+        '--sniff', action='store_true',
+        help='Try the format of the last parsed timestamp first.'
+    )
+    normalize_parser.add_argument(
+        '--to', default='UTC',
+        help='The timezone of the normalized timestamps.'
+    )
+    normalize_parser.add_argument(
+        '-f', '--format',
+        help='The output format, RFC 3339 by default.'
+    )
+    normalize_parser.add_argument(
+        '--formatter', choices=['classic', 'alternative'], default='classic',
+        help='The formatter of the output format.'
+    )
+    normalize_parser.add_argument(
+        '--locale',
+        help='The locale of the output format.'
+    )
+    normalize_parser.add_argument(
+        '--errors', choices=Normalizer.ERRORS, default='raise',
+        help='What to do with invalid timestamps.'
+    )
+    normalize_parser.add_argument(
+        '-d', '--delimiter', default=',',
+        help='The CSV delimiter.'
+    )
+    normalize_parser.add_argument(
+        '--no-header', action='store_true',
+        help='The CSV files have no header line.'
+    )
+    normalize_parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='The number of processes, all CPUs by default.'
+    )
+    normalize_parser.add_argument(
+        '--chunk-size', type=int, default=1 << 20,
+        help='The approximate size in bytes of the chunks of lines.'
+    )
+    normalize_parser.add_argument(
+        '-o', '--output', default='-',
+        help='The output file, the standard output by default.'
+    )
+
+    args = parser.parse_args(argv)
+    if args.command != 'normalize':
+        parser.print_usage(sys.stderr)
+
+        return 2
+
+    try:
+        normalize(args)
+    except (ValueError, IOError) as e:
+        sys.stderr.write('error: {}\n'.format(e))
+
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
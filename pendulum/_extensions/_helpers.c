@@ -56,6 +56,9 @@ const int32_t SECS_PER_YEAR[2] = {
 
 #define MONTHS_PER_YEAR 12
 
+// Maximum length of the strings parsed from buffers
+#define MAX_TEXT_LENGTH 64
+
 // The month lengths in non-leap and leap years respectively.
 const int32_t DAYS_PER_MONTHS[2][13] = {
     {-1, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31},
@@ -124,6 +127,59 @@ int days_in_year(int year) {
     return DAYS_PER_N_YEAR;
 }
 
+int64_t floor_div(int64_t a, int64_t b) {
+    int64_t q = a / b;
+
+    if ((a % b != 0) && ((a < 0) != (b < 0))) {
+        q -= 1;
+    }
+
+    return q;
+}
+
+/*
+ * Converts a proleptic Gregorian date
+ * to the number of days elapsed since 1970-01-01.
+ */
+int64_t days_from_civil(int64_t year, int64_t month, int64_t day) {
+    int64_t era;
+    int64_t yoe;
+    int64_t doy;
+    int64_t doe;
+
+    year -= month <= 2;
+    era = floor_div(year, 400);
+    yoe = year - era * 400;
+    doy = (153 * ((month + 9) % 12) + 2) / 5 + day - 1;
+    doe = yoe * 365 + yoe / 4 - yoe / 100 + doy;
+
+    return era * DAYS_PER_400_YEARS + doe - 719468;
+}
+
+/*
+ * Converts a number of days elapsed since 1970-01-01
+ * to a proleptic Gregorian date.
+ */
+void civil_from_days(int64_t days, int *year, int *month, int *day) {
+    int64_t z;
+    int64_t era;
+    int64_t doe;
+    int64_t yoe;
+    int64_t doy;
+    int64_t mp;
+
+    z = days + 719468;
+    era = floor_div(z, DAYS_PER_400_YEARS);
+    doe = z - era * DAYS_PER_400_YEARS;
+    yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365;
+    doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+    mp = (5 * doy + 2) / 153;
+
+    *day = (int) (doy - (153 * mp + 2) / 5 + 1);
+    *month = (int) (mp < 10 ? mp + 3 : mp - 9);
+    *year = (int) (yoe + era * 400 + (*month <= 2));
+}
+
 /* ------------------------ Custom Types ------------------------------- */
 
 #if defined(PY_MAJOR_VERSION)
@@ -397,16 +453,391 @@ PyObject* local_time(PyObject *self, PyObject *args) {
 }
 
 
-PyObject* parse_iso8601(PyObject *self, PyObject *args) {
-    char* str;
-    char* c;
-    PyObject *obj;
+/*
+ * class PreciseDiff(tuple):
+ */
+static PyStructSequence_Field PreciseDiff_fields[] = {
+    {"years", "The number of years"},
+    {"months", "The number of months"},
+    {"days", "The number of days"},
+    {"hours", "The number of hours"},
+    {"minutes", "The number of minutes"},
+    {"seconds", "The number of seconds"},
+    {"microseconds", "The number of microseconds"},
+    {NULL}
+};
+
+static PyStructSequence_Desc PreciseDiff_desc = {
+    "_helpers.PreciseDiff",
+    "Precise difference between two datetimes.",
+    PreciseDiff_fields,
+    7
+};
+
+static PyTypeObject PreciseDiff_type;
+
+PyObject* precise_diff(PyObject *self, PyObject *args) {
+    PyObject *d1;
+    PyObject *d2;
+    PyObject *tmp;
+    PyObject *diff;
+    int sign = 1;
+    int cmp;
+    int year;
+    int month;
+    int leap;
+    int days_in_last_month;
+    int days_in_month;
+    int y_diff = 0;
+    int m_diff = 0;
+    int d_diff = 0;
+    int hour_diff = 0;
+    int min_diff = 0;
+    int sec_diff = 0;
+    int mic_diff = 0;
+
+    if (!PyArg_ParseTuple(args, "OO", &d1, &d2)) {
+        return NULL;
+    }
+
+    if (!PyDate_Check(d1) || !PyDate_Check(d2)) {
+        PyErr_SetString(
+            PyExc_TypeError, "precise_diff() expects date or datetime instances"
+        );
+        return NULL;
+    }
+
+    cmp = PyObject_RichCompareBool(d1, d2, Py_EQ);
+    if (cmp < 0) {
+        return NULL;
+    }
+
+    if (!cmp) {
+        cmp = PyObject_RichCompareBool(d1, d2, Py_GT);
+        if (cmp < 0) {
+            return NULL;
+        }
+
+        if (cmp) {
+            tmp = d1;
+            d1 = d2;
+            d2 = tmp;
+            sign = -1;
+        }
+
+        y_diff = PyDateTime_GET_YEAR(d2) - PyDateTime_GET_YEAR(d1);
+        m_diff = PyDateTime_GET_MONTH(d2) - PyDateTime_GET_MONTH(d1);
+        d_diff = PyDateTime_GET_DAY(d2) - PyDateTime_GET_DAY(d1);
+
+        if (PyDateTime_Check(d1) && PyDateTime_Check(d2)) {
+            hour_diff = PyDateTime_DATE_GET_HOUR(d2) - PyDateTime_DATE_GET_HOUR(d1);
+            min_diff = PyDateTime_DATE_GET_MINUTE(d2) - PyDateTime_DATE_GET_MINUTE(d1);
+            sec_diff = PyDateTime_DATE_GET_SECOND(d2) - PyDateTime_DATE_GET_SECOND(d1);
+            mic_diff = PyDateTime_DATE_GET_MICROSECOND(d2) - PyDateTime_DATE_GET_MICROSECOND(d1);
+
+            if (mic_diff < 0) {
+                mic_diff += USECS_PER_SEC;
+                sec_diff -= 1;
+            }
+
+            if (sec_diff < 0) {
+                sec_diff += SECS_PER_MIN;
+                min_diff -= 1;
+            }
+
+            if (min_diff < 0) {
+                min_diff += 60;
+                hour_diff -= 1;
+            }
+
+            if (hour_diff < 0) {
+                hour_diff += 24;
+                d_diff -= 1;
+            }
+        }
+
+        if (d_diff < 0) {
+            year = PyDateTime_GET_YEAR(d2);
+            month = PyDateTime_GET_MONTH(d2);
+
+            if (month == 1) {
+                month = 12;
+                year -= 1;
+            } else {
+                month -= 1;
+            }
+
+            leap = is_leap(year);
+
+            days_in_last_month = DAYS_PER_MONTHS[leap][month];
+            days_in_month = DAYS_PER_MONTHS[is_leap(PyDateTime_GET_YEAR(d2))][PyDateTime_GET_MONTH(d2)];
+
+            if (d_diff < days_in_month - days_in_last_month) {
+                // We don't have a full month, we calculate days
+                if (days_in_last_month < PyDateTime_GET_DAY(d1)) {
+                    d_diff += PyDateTime_GET_DAY(d1);
+                } else {
+                    d_diff += days_in_last_month;
+                }
+            } else if (d_diff == days_in_month - days_in_last_month) {
+                // We have exactly a full month
+                // We remove the days difference
+                // and add one to the months difference
+                d_diff = 0;
+                m_diff += 1;
+            } else {
+                // We have a full month
+                d_diff += days_in_last_month;
+            }
+
+            m_diff -= 1;
+        }
+
+        if (m_diff < 0) {
+            m_diff += MONTHS_PER_YEAR;
+            y_diff -= 1;
+        }
+    }
+
+    diff = PyStructSequence_New(&PreciseDiff_type);
+    if (diff == NULL) {
+        return NULL;
+    }
+
+    PyStructSequence_SET_ITEM(diff, 0, PyLong_FromLong(sign * y_diff));
+    PyStructSequence_SET_ITEM(diff, 1, PyLong_FromLong(sign * m_diff));
+    PyStructSequence_SET_ITEM(diff, 2, PyLong_FromLong(sign * d_diff));
+    PyStructSequence_SET_ITEM(diff, 3, PyLong_FromLong(sign * hour_diff));
+    PyStructSequence_SET_ITEM(diff, 4, PyLong_FromLong(sign * min_diff));
+    PyStructSequence_SET_ITEM(diff, 5, PyLong_FromLong(sign * sec_diff));
+    PyStructSequence_SET_ITEM(diff, 6, PyLong_FromLong(sign * mic_diff));
+
+    if (PyErr_Occurred()) {
+        Py_DECREF(diff);
+        return NULL;
+    }
+
+    return diff;
+}
+
+// Durations beyond this magnitude, in any unit up to weeks,
+// cannot give a valid date and would overflow the computations.
+#define MAX_DURATION_MAGNITUDE 1000000000000LL
+
+PyObject* add_duration(PyObject *self, PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {
+        "dt", "years", "months", "weeks", "days",
+        "hours", "minutes", "seconds", "microseconds", NULL
+    };
+    PyObject *dt;
     PyObject *tzinfo;
+    long long years = 0;
+    long long months = 0;
+    long long weeks = 0;
+    long long days = 0;
+    long long hours = 0;
+    long long minutes = 0;
+    long long seconds = 0;
+    long long microseconds = 0;
+    int64_t month_index;
+    int64_t total_seconds;
+    int64_t ordinal;
+    int year;
+    int month;
+    int day;
+    int hour = 0;
+    int minute = 0;
+    int second = 0;
+    int microsecond = 0;
+    int is_datetime;
 
-    // day_first is only here for compatibility
-    // It will be removed in the next major version
-    // since it's not ISO 8601 compliant.
-    int day_first;
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwargs, "O|LLLLLLLL", kwlist,
+            &dt, &years, &months, &weeks, &days,
+            &hours, &minutes, &seconds, &microseconds)) {
+        return NULL;
+    }
+
+    if (!PyDate_Check(dt)) {
+        PyErr_SetString(
+            PyExc_TypeError, "add_duration() expects a date or datetime instance"
+        );
+        return NULL;
+    }
+
+    is_datetime = PyDateTime_Check(dt);
+    if (is_datetime) {
+        hour = PyDateTime_DATE_GET_HOUR(dt);
+        minute = PyDateTime_DATE_GET_MINUTE(dt);
+        second = PyDateTime_DATE_GET_SECOND(dt);
+        microsecond = PyDateTime_DATE_GET_MICROSECOND(dt);
+    }
+
+    // Years and months apply to the calendar date,
+    // the day being clamped to the end of the resulting month.
+    if (llabs(years) > MAX_DURATION_MAGNITUDE || llabs(months) > MAX_DURATION_MAGNITUDE) {
+        PyErr_SetString(PyExc_ValueError, "year is out of range");
+        return NULL;
+    }
+
+    month_index = (
+        (PyDateTime_GET_YEAR(dt) + years) * MONTHS_PER_YEAR
+        + PyDateTime_GET_MONTH(dt) - 1 + months
+    );
+    if (month_index < MONTHS_PER_YEAR || month_index >= 10000 * MONTHS_PER_YEAR) {
+        PyErr_Format(
+            PyExc_ValueError, "year %lld is out of range",
+            (long long) floor_div(month_index, MONTHS_PER_YEAR)
+        );
+        return NULL;
+    }
+
+    year = (int) (month_index / MONTHS_PER_YEAR);
+    month = (int) (month_index % MONTHS_PER_YEAR) + 1;
+    day = PyDateTime_GET_DAY(dt);
+    if (day > DAYS_PER_MONTHS[is_leap(year)][month]) {
+        day = DAYS_PER_MONTHS[is_leap(year)][month];
+    }
+
+    // The remaining units are added as an absolute duration.
+    if (llabs(weeks) > MAX_DURATION_MAGNITUDE
+            || llabs(days) > MAX_DURATION_MAGNITUDE
+            || llabs(hours) > MAX_DURATION_MAGNITUDE
+            || llabs(minutes) > MAX_DURATION_MAGNITUDE
+            || llabs(seconds) > MAX_DURATION_MAGNITUDE) {
+        PyErr_SetString(PyExc_OverflowError, "date value out of range");
+        return NULL;
+    }
+
+    microseconds += microsecond;
+    total_seconds = (
+        (weeks * 7 + days) * SECS_PER_DAY
+        + (hours + hour) * SECS_PER_HOUR
+        + (minutes + minute) * SECS_PER_MIN
+        + seconds + second
+        + floor_div(microseconds, USECS_PER_SEC)
+    );
+    microseconds -= floor_div(microseconds, USECS_PER_SEC) * USECS_PER_SEC;
+
+    ordinal = days_from_civil(year, month, day) + floor_div(total_seconds, SECS_PER_DAY);
+    if (ordinal < days_from_civil(1, 1, 1) || ordinal > days_from_civil(9999, 12, 31)) {
+        PyErr_SetString(PyExc_OverflowError, "date value out of range");
+        return NULL;
+    }
+
+    civil_from_days(ordinal, &year, &month, &day);
+
+    if (!is_datetime) {
+        return PyDateTimeAPI->Date_FromDate(
+            year, month, day, PyDateTimeAPI->DateType
+        );
+    }
+
+    total_seconds -= floor_div(total_seconds, SECS_PER_DAY) * SECS_PER_DAY;
+
+    tzinfo = Py_None;
+    if (((PyDateTime_DateTime *) dt)->hastzinfo) {
+        tzinfo = ((PyDateTime_DateTime *) dt)->tzinfo;
+    }
+
+    return PyDateTimeAPI->DateTime_FromDateAndTime(
+        year, month, day,
+        (int) (total_seconds / SECS_PER_HOUR),
+        (int) (total_seconds % SECS_PER_HOUR / SECS_PER_MIN),
+        (int) (total_seconds % SECS_PER_MIN),
+        (int) microseconds,
+        tzinfo,
+        PyDateTimeAPI->DateTimeType
+    );
+}
+
+
+/*
+ * Gets a NUL-terminated string from a str
+ * or from a slice of a bytes-like object.
+ *
+ * Slices are copied to the given buffer,
+ * which must hold MAX_TEXT_LENGTH + 1 chars,
+ * so that no intermediate object is created.
+ */
+static int get_text(PyObject *obj, Py_ssize_t offset, Py_ssize_t length, char *buffer, char **str) {
+    Py_buffer view;
+
+#if PY_MAJOR_VERSION >= 3
+    if (PyUnicode_Check(obj)) {
+#else
+    if (PyUnicode_Check(obj) || (PyString_Check(obj) && offset == 0 && length < 0)) {
+#endif
+        if (offset != 0 || length >= 0) {
+            PyErr_SetString(
+                PyExc_TypeError, "Offset and length are only supported for bytes-like objects"
+            );
+
+            return -1;
+        }
+
+        return PyArg_Parse(obj, "s", str) ? 0 : -1;
+    }
+
+    if (PyObject_GetBuffer(obj, &view, PyBUF_SIMPLE) < 0) {
+        return -1;
+    }
+
+    if (length < 0) {
+        length = view.len - offset;
+    }
+
+    if (offset < 0 || length < 0 || offset + length > view.len) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(
+            PyExc_ValueError, "Offset and length are out of bounds"
+        );
+
+        return -1;
+    }
+
+    if (length > MAX_TEXT_LENGTH || memchr((char *) view.buf + offset, '\0', length) != NULL) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid ISO8601 string"
+        );
+
+        return -1;
+    }
+
+    memcpy(buffer, (char *) view.buf + offset, length);
+    buffer[length] = '\0';
+    PyBuffer_Release(&view);
+
+    *str = buffer;
+
+    return 0;
+}
+
+
+typedef struct {
+    int year;
+    int month;
+    int day;
+    int hour;
+    int minute;
+    int second;
+    int subsecond;
+    int offset;
+    int has_time;
+    int has_offset;
+    int ambiguous_date;
+    const char *error;
+} Iso8601;
+
+/*
+ * Scans an ISO 8601 string without creating any Python object.
+ *
+ * Returns -1 and sets the error message of parsed
+ * if the string is invalid, without raising any exception.
+ */
+static int _parse_iso8601(char *str, int day_first, Iso8601 *parsed) {
+    char* c;
 
     int year = 0;
     int month = 1;
@@ -430,13 +861,6 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
     int i;
     int j;
 
-    if (!PyArg_ParseTuple(args, "si", &str, &day_first)) {
-        PyErr_SetString(
-            PyExc_ValueError, "Invalid parameters"
-        );
-        return NULL;
-    }
-
     c = str;
 
     // Year
@@ -444,11 +868,9 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
         if (*c >= '0' && *c <= '9') {
             year = 10 * year + *c++ - '0';
         } else {
-            PyErr_SetString(
-                PyExc_ValueError, "Invalid ISO8601 string"
-            );
+            parsed->error = "Invalid ISO8601 string";
 
-            return NULL;
+            return -1;
         }
     }
 
@@ -485,11 +907,9 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 // Week with weekday
                 if (!(separators == 0 || separators == 2)) {
                     // We should have 2 or no separator
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid week date"
-                    );
+                    parsed->error = "Invalid week date";
 
-                    return NULL;
+                    return -1;
                 }
 
                 weekday = week % 10;
@@ -498,28 +918,22 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 break;
             default:
                 // Any other case is wrong
-                PyErr_SetString(
-                    PyExc_ValueError, "Invalid week date"
-                );
+                parsed->error = "Invalid week date";
 
-                return NULL;
+                return -1;
         }
 
         // Checks
         if (week > 53) {
-            PyErr_SetString(
-                PyExc_ValueError, "Invalid week number"
-            );
+            parsed->error = "Invalid week number";
 
-            return NULL;
+            return -1;
         }
 
         if (weekday > 7) {
-            PyErr_SetString(
-                PyExc_ValueError, "Invalid weekday number"
-            );
+            parsed->error = "Invalid weekday number";
 
-            return NULL;
+            return -1;
         }
 
         // Calculating ordinal day
@@ -564,11 +978,9 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
             }
 
             if (!(*c >= '0' && *c <='9')) {
-                PyErr_SetString(
-                    PyExc_ValueError, "Invalid date"
-                );
+                parsed->error = "Invalid date";
 
-                return NULL;
+                return -1;
             }
 
             monthday = 10 * monthday + *c++ - '0';
@@ -593,19 +1005,15 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
             case 3:
                 // Ordinal day
                 if (separators > 1) {
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid date"
-                    );
+                    parsed->error = "Invalid date";
 
-                    return NULL;
+                    return -1;
                 }
 
                 if (monthday < 1 || monthday > MONTHS_OFFSETS[leap][13]) {
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid ordinal day for year"
-                    );
+                    parsed->error = "Invalid ordinal day for year";
 
-                    return NULL;
+                    return -1;
                 }
 
                 for (j = 1; j < 14; j++) {
@@ -629,47 +1037,37 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 }
                 break;
             default:
-                PyErr_SetString(
-                    PyExc_ValueError, "Invalid month and/or day"
-                );
+                parsed->error = "Invalid month and/or day";
 
-                return NULL;
+                return -1;
         }
     }
 
     // Checks
     if (separators && !monthday && !week) {
-        PyErr_SetString(
-            PyExc_ValueError, "Invalid date"
-        );
+        parsed->error = "Invalid date";
 
-        return NULL;
+        return -1;
     }
 
     if (month > 12) {
-        PyErr_SetString(
-            PyExc_ValueError, "Invalid month"
-        );
+        parsed->error = "Invalid month";
 
-        return NULL;
+        return -1;
     }
 
     if (day > DAYS_PER_MONTHS[leap][month]) {
-        PyErr_SetString(
-            PyExc_ValueError, "Day is invalid for month"
-        );
+        parsed->error = "Day is invalid for month";
 
-        return NULL;
+        return -1;
     }
 
     separators = 0;
     if (*c == 'T' || *c == ' ') {
         if (ambiguous_date) {
-            PyErr_SetString(
-                PyExc_ValueError, "Invalid date"
-            );
+            parsed->error = "Invalid date";
 
-            return NULL;
+            return -1;
         }
 
         has_time = 1;
@@ -685,11 +1083,9 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
             }
 
             if (!(*c >= '0' && *c <='9')) {
-                PyErr_SetString(
-                    PyExc_ValueError, "Invalid time"
-                );
+                parsed->error = "Invalid time";
 
-                return NULL;
+                return -1;
             }
 
             time = 10 * time + *c++ - '0';
@@ -701,11 +1097,9 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 // Hours only
                 if (separators > 0) {
                     // Extraneous separators
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid time"
-                    );
+                    parsed->error = "Invalid time";
 
-                    return NULL;
+                    return -1;
                 }
 
                 hour = time;
@@ -714,11 +1108,9 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 // Hours and minutes
                 if (separators > 1) {
                     // Extraneous separators
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid time"
-                    );
+                    parsed->error = "Invalid time";
 
-                    return NULL;
+                    return -1;
                 }
 
                 hour = time / 100;
@@ -728,11 +1120,9 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 // Hours, minutes and seconds
                 if (!(separators == 0 || separators == 2)) {
                     // We should have either two separators or none
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid time"
-                    );
+                    parsed->error = "Invalid time";
 
-                    return NULL;
+                    return -1;
                 }
                 hour = time / 10000;
                 minute = time / 100 % 100;
@@ -740,36 +1130,28 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 break;
             default:
                 // Any other case is wrong
-                PyErr_SetString(
-                    PyExc_ValueError, "Invalid time"
-                );
+                parsed->error = "Invalid time";
 
-                return NULL;
+                return -1;
         }
 
         // Checks
         if (hour > 23) {
-            PyErr_SetString(
-                PyExc_ValueError, "Invalid hour"
-            );
+            parsed->error = "Invalid hour";
 
-            return NULL;
+            return -1;
         }
 
         if (minute > 59) {
-            PyErr_SetString(
-                PyExc_ValueError, "Invalid minute"
-            );
+            parsed->error = "Invalid minute";
 
-            return NULL;
+            return -1;
         }
 
         if (second > 59) {
-            PyErr_SetString(
-                PyExc_ValueError, "Invalid second"
-            );
+            parsed->error = "Invalid second";
 
-            return NULL;
+            return -1;
         }
 
         // Subsecond
@@ -780,10 +1162,8 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
             i = 0;
             while (*c != '\0' && *c != 'Z' && *c != '+' && *c != '-') {
                 if (!(*c >= '0' && *c <='9')) {
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid subsecond"
-                    );
-                    return NULL;
+                    parsed->error = "Invalid subsecond";
+                    return -1;
                 }
 
                 time = 10 * time + *c++ - '0';
@@ -821,10 +1201,8 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                 }
 
                 if (!(*c >= '0' && *c <= '9')) {
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid timezone offset"
-                    );
-                    return NULL;
+                    parsed->error = "Invalid timezone offset";
+                    return -1;
                 }
 
                 time = 10 * time + *c++ - '0';
@@ -836,10 +1214,8 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                     // hh Format
                     if (separators) {
                         // Extraneous separators
-                        PyErr_SetString(
-                            PyExc_ValueError, "Invalid timezone offset"
-                        );
-                        return NULL;
+                        parsed->error = "Invalid timezone offset";
+                        return -1;
                     }
 
                     offset = tz_sign * (time * 3600);
@@ -848,59 +1224,116 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
                     // hhmm Format
                     if (separators > 1) {
                         // Extraneous separators
-                        PyErr_SetString(
-                            PyExc_ValueError, "Invalid timezone offset"
-                        );
-                        return NULL;
+                        parsed->error = "Invalid timezone offset";
+                        return -1;
                     }
 
                     offset = tz_sign * ((time / 100 * 3600) + (time % 100 * 60));
                     break;
                 default:
                     // Wrong format
-                    PyErr_SetString(
-                        PyExc_ValueError, "Invalid timezone offset"
-                    );
-                    return NULL;
+                    parsed->error = "Invalid timezone offset";
+                    return -1;
             }
         }
     }
 
-    if (!has_time) {
+    parsed->year = year;
+    parsed->month = month;
+    parsed->day = day;
+    parsed->hour = hour;
+    parsed->minute = minute;
+    parsed->second = second;
+    parsed->subsecond = subsecond;
+    parsed->offset = offset;
+    parsed->has_time = has_time;
+    parsed->has_offset = has_offset;
+    parsed->ambiguous_date = ambiguous_date;
+
+    return 0;
+}
+
+
+/*
+ * Parses an ISO 8601 string into a date, time or datetime.
+ *
+ * Invalid strings raise a ValueError or, if raise is 0,
+ * return None without creating any exception.
+ */
+static PyObject* iso8601_object(PyObject *args, int raise) {
+    char* str;
+    char buffer[MAX_TEXT_LENGTH + 1];
+    PyObject *text;
+    PyObject *obj;
+    PyObject *tzinfo;
+    Iso8601 parsed;
+    Py_ssize_t offset = 0;
+    Py_ssize_t length = -1;
+
+    // day_first is only here for compatibility
+    // It will be removed in the next major version
+    // since it's not ISO 8601 compliant.
+    int day_first;
+
+    if (!PyArg_ParseTuple(args, "Oi|nn", &text, &day_first, &offset, &length)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    if (get_text(text, offset, length, buffer, &str) < 0) {
+        if (raise || !PyErr_ExceptionMatches(PyExc_ValueError)) {
+            return NULL;
+        }
+
+        // Too long to be an ISO 8601 string
+        PyErr_Clear();
+        Py_RETURN_NONE;
+    }
+
+    if (_parse_iso8601(str, day_first, &parsed) < 0) {
+        if (!raise) {
+            Py_RETURN_NONE;
+        }
+
+        PyErr_SetString(PyExc_ValueError, parsed.error);
+
+        return NULL;
+    }
+
+    if (!parsed.has_time) {
         // Date only
-        if (ambiguous_date) {
+        if (parsed.ambiguous_date) {
             // We can "safely" assume that the ambiguous
             // date was actually a time in the form hhmmss
-            hour = year / 100;
-            minute = year % 100;
-            second = month;
-
             obj = PyDateTimeAPI->Time_FromTime(
-                hour, minute, second, subsecond / 1000,
+                parsed.year / 100, parsed.year % 100, parsed.month,
+                parsed.subsecond / 1000,
                 Py_BuildValue(""),
                 PyDateTimeAPI->TimeType
             );
         } else {
             obj = PyDateTimeAPI->Date_FromDate(
-                year, month, day,
+                parsed.year, parsed.month, parsed.day,
                 PyDateTimeAPI->DateType
             );
         }
     } else {
-        if (!has_offset) {
+        if (!parsed.has_offset) {
             tzinfo = Py_BuildValue("");
         } else {
-            tzinfo = new_fixed_offset(offset);
+            tzinfo = new_fixed_offset(parsed.offset);
         }
 
         obj = PyDateTimeAPI->DateTime_FromDateAndTime(
-            year,
-            month,
-            day,
-            hour,
-            minute,
-            second,
-            subsecond / 1000,
+            parsed.year,
+            parsed.month,
+            parsed.day,
+            parsed.hour,
+            parsed.minute,
+            parsed.second,
+            parsed.subsecond / 1000,
             tzinfo,
             PyDateTimeAPI->DateTimeType
         );
@@ -911,22 +1344,1269 @@ PyObject* parse_iso8601(PyObject *self, PyObject *args) {
     return obj;
 }
 
-PyObject* parse(PyObject *self, PyObject *args) {
-    char* str;
-    char* c;
-    int day_first;
-    int separators = 0;
-    PyObject *obj;
 
-    if (!PyArg_ParseTuple(args, "si", &str, &day_first)) {
-        PyErr_SetString(
-            PyExc_ValueError, "Invalid parameters"
-        );
-        return NULL;
-    }
+PyObject* parse_iso8601(PyObject *self, PyObject *args) {
+    return iso8601_object(args, 1);
+}
 
-    c = str;
-    c++;
+
+PyObject* try_parse_iso8601(PyObject *self, PyObject *args) {
+    return iso8601_object(args, 0);
+}
+
+
+/*
+ * Checks the fields left to the date and time constructors
+ * by _parse_iso8601(), with the same error messages.
+ *
+ * Returns -1 and sets the error message of parsed if one is out of range.
+ */
+static int _check_iso8601_fields(Iso8601 *parsed) {
+    if (parsed->year < 1 || parsed->year > 9999) {
+        parsed->error = "year is out of range";
+    } else if (parsed->month < 1 || parsed->month > 12) {
+        parsed->error = "month must be in 1..12";
+    } else if (parsed->day < 1
+            || parsed->day > DAYS_PER_MONTHS[is_leap(parsed->year)][parsed->month]) {
+        parsed->error = "day is out of range for month";
+    } else if (parsed->hour < 0 || parsed->hour > 23) {
+        parsed->error = "hour must be in 0..23";
+    } else if (parsed->minute < 0 || parsed->minute > 59) {
+        parsed->error = "minute must be in 0..59";
+    } else if (parsed->second < 0 || parsed->second > 59) {
+        parsed->error = "second must be in 0..59";
+    } else {
+        return 0;
+    }
+
+    return -1;
+}
+
+
+/*
+ * Parses an ISO 8601 string into wall clock microseconds
+ * elapsed since the epoch.
+ *
+ * Returns -1 and sets the error message of parsed
+ * for invalid strings, fields out of range and times without date.
+ */
+static int _parse_iso8601_local(char *str, int day_first, int64_t *local, Iso8601 *parsed) {
+    if (_parse_iso8601(str, day_first, parsed) < 0) {
+        return -1;
+    }
+
+    if (parsed->ambiguous_date && !parsed->has_time) {
+        // A time without date depends on the current date
+        parsed->error = "Time strings have no timestamp";
+
+        return -1;
+    }
+
+    if (_check_iso8601_fields(parsed) < 0) {
+        return -1;
+    }
+
+    *local = (
+        days_from_civil(parsed->year, parsed->month, parsed->day) * SECS_PER_DAY
+        + parsed->hour * SECS_PER_HOUR
+        + parsed->minute * SECS_PER_MIN
+        + parsed->second
+    ) * 1000000 + parsed->subsecond / 1000;
+
+    return 0;
+}
+
+
+PyObject* parse_iso8601_timestamp(PyObject *self, PyObject *args) {
+    char* str;
+    char buffer[MAX_TEXT_LENGTH + 1];
+    PyObject *text;
+    int day_first = 0;
+    Py_ssize_t offset = 0;
+    Py_ssize_t length = -1;
+    int64_t local;
+    Iso8601 parsed;
+
+    if (!PyArg_ParseTuple(args, "O|inn", &text, &day_first, &offset, &length)) {
+        return NULL;
+    }
+
+    if (get_text(text, offset, length, buffer, &str) < 0) {
+        return NULL;
+    }
+
+    if (_parse_iso8601_local(str, day_first, &local, &parsed) < 0) {
+        PyErr_SetString(PyExc_ValueError, parsed.error);
+
+        return NULL;
+    }
+
+    if (!parsed.has_offset) {
+        return Py_BuildValue("(LO)", (long long) local, Py_None);
+    }
+
+    return Py_BuildValue("(Li)", (long long) local, parsed.offset);
+}
+
+
+static int get_int64_buffer(PyObject *obj, Py_buffer *view, int flags) {
+    if (PyObject_GetBuffer(obj, view, flags | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+        return -1;
+    }
+
+    if (view->itemsize != 8 || view->format == NULL
+            || strchr("lq", view->format[strlen(view->format) - 1]) == NULL) {
+        PyBuffer_Release(view);
+        PyErr_SetString(
+            PyExc_TypeError, "Expected a contiguous buffer of int64 values"
+        );
+
+        return -1;
+    }
+
+    return 0;
+}
+
+
+/*
+ * Gets a read-only view on int64 values given as a buffer
+ * or as a sequence of integers, which are copied.
+ */
+static int get_int64_values(PyObject *obj, Py_buffer *view) {
+    PyObject *seq;
+    PyObject *copy;
+    Py_ssize_t count;
+    Py_ssize_t i;
+    int64_t *values;
+    int result;
+
+    if (PyObject_CheckBuffer(obj)) {
+        return get_int64_buffer(obj, view, PyBUF_SIMPLE);
+    }
+
+    seq = PySequence_Fast(obj, "Expected a buffer or a sequence of int64 values");
+    if (seq == NULL) {
+        return -1;
+    }
+
+    count = PySequence_Fast_GET_SIZE(seq);
+    copy = PyBytes_FromStringAndSize(NULL, count * 8);
+    if (copy == NULL) {
+        Py_DECREF(seq);
+
+        return -1;
+    }
+
+    values = (int64_t *) PyBytes_AS_STRING(copy);
+    for (i = 0; i < count; i++) {
+        values[i] = PyLong_AsLongLong(PySequence_Fast_GET_ITEM(seq, i));
+        if (values[i] == -1 && PyErr_Occurred()) {
+            Py_DECREF(seq);
+            Py_DECREF(copy);
+
+            return -1;
+        }
+    }
+
+    Py_DECREF(seq);
+
+    // The view holds the only reference to the copy
+    result = PyBuffer_FillInfo(view, copy, values, count * 8, 1, PyBUF_SIMPLE);
+    Py_DECREF(copy);
+
+    return result;
+}
+
+PyObject* parse_iso8601_column(PyObject *self, PyObject *args) {
+    PyObject *data_obj;
+    PyObject *starts_obj;
+    PyObject *locals_obj;
+    PyObject *offsets_obj;
+    Py_buffer data;
+    Py_buffer starts_view;
+    Py_buffer locals_view;
+    Py_buffer offsets_view;
+    Py_ssize_t width;
+    Py_ssize_t count;
+    Py_ssize_t invalid = 0;
+    Py_ssize_t i;
+    int64_t start;
+    int64_t *starts;
+    int64_t *locals;
+    int64_t *offsets;
+    int day_first = 0;
+    char buffer[MAX_TEXT_LENGTH + 1];
+    Iso8601 parsed;
+
+    if (!PyArg_ParseTuple(args, "OOnOO|i", &data_obj, &starts_obj, &width, &locals_obj, &offsets_obj, &day_first)) {
+        return NULL;
+    }
+
+    if (width < 0 || width > MAX_TEXT_LENGTH) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid width"
+        );
+
+        return NULL;
+    }
+
+    if (PyObject_GetBuffer(data_obj, &data, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+
+    if (get_int64_buffer(starts_obj, &starts_view, PyBUF_SIMPLE) < 0) {
+        PyBuffer_Release(&data);
+
+        return NULL;
+    }
+
+    if (get_int64_buffer(locals_obj, &locals_view, PyBUF_WRITABLE) < 0) {
+        PyBuffer_Release(&data);
+        PyBuffer_Release(&starts_view);
+
+        return NULL;
+    }
+
+    if (get_int64_buffer(offsets_obj, &offsets_view, PyBUF_WRITABLE) < 0) {
+        PyBuffer_Release(&data);
+        PyBuffer_Release(&starts_view);
+        PyBuffer_Release(&locals_view);
+
+        return NULL;
+    }
+
+    count = starts_view.len / 8;
+    if (locals_view.len / 8 < count || offsets_view.len / 8 < count) {
+        PyErr_SetString(
+            PyExc_ValueError, "The output buffers are too small"
+        );
+        count = -1;
+    }
+
+    starts = (int64_t *) starts_view.buf;
+    locals = (int64_t *) locals_view.buf;
+    offsets = (int64_t *) offsets_view.buf;
+
+    for (i = 0; i < count; i++) {
+        start = starts[i];
+        offsets[i] = 0;
+
+        if (start < 0 || start > data.len - width
+                || memchr((char *) data.buf + start, '\0', width) != NULL) {
+            locals[i] = INT64_MIN;
+            invalid++;
+
+            continue;
+        }
+
+        memcpy(buffer, (char *) data.buf + start, width);
+        buffer[width] = '\0';
+
+        if (_parse_iso8601_local(buffer, day_first, &locals[i], &parsed) < 0) {
+            locals[i] = INT64_MIN;
+            invalid++;
+
+            continue;
+        }
+
+        offsets[i] = parsed.has_offset ? parsed.offset : INT64_MIN;
+    }
+
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&starts_view);
+    PyBuffer_Release(&locals_view);
+    PyBuffer_Release(&offsets_view);
+
+    if (count < 0) {
+        return NULL;
+    }
+
+    return PyLong_FromSsize_t(invalid);
+}
+
+/* ------------------------ ISO 8601 durations -------------------------- */
+
+/* Microseconds per week, day, hour, minute and second */
+static const double DURATION_UNIT_USECS[7] = {
+    0, 0, 604800e6, 86400e6, 3600e6, 60e6, 1e6
+};
+
+typedef struct {
+    /* Years, months, weeks, days, hours, minutes, seconds */
+    int64_t units[7];
+    int64_t microseconds;
+    const char *error;
+} Duration;
+
+
+/*
+ * Parses an ISO 8601 duration like P1Y2M3DT4H5M6.5S or P2W.
+ *
+ * The components must be in order and only the last one
+ * may have a fraction, which is converted to microseconds.
+ * Fractions of years and months are not supported
+ * since their length depends on the calendar.
+ */
+static int _parse_iso8601_duration(char *str, Duration *parsed) {
+    char *c = str;
+    int sign = 1;
+    int in_time = 0;
+    int has_fraction = 0;
+    int components = 0;
+    int index;
+    int last = -1;
+    int digits;
+    int64_t value;
+    double fraction;
+    double scale;
+
+    memset(parsed, 0, sizeof(Duration));
+    parsed->error = "Invalid ISO 8601 duration";
+
+    if (*c == '-' || *c == '+') {
+        sign = *c == '-' ? -1 : 1;
+        c++;
+    }
+
+    if (*c != 'P') {
+        return -1;
+    }
+
+    c++;
+
+    while (*c) {
+        if (*c == 'T') {
+            if (in_time) {
+                return -1;
+            }
+
+            in_time = 1;
+            components = 0;
+            c++;
+
+            continue;
+        }
+
+        if (has_fraction) {
+            return -1;
+        }
+
+        value = 0;
+        digits = 0;
+        while (*c >= '0' && *c <= '9') {
+            if (++digits > 9) {
+                return -1;
+            }
+
+            value = value * 10 + (*c++ - '0');
+        }
+
+        if (!digits) {
+            return -1;
+        }
+
+        fraction = 0;
+        if (*c == '.' || *c == ',') {
+            c++;
+            scale = 0.1;
+            digits = 0;
+            while (*c >= '0' && *c <= '9') {
+                fraction += (*c++ - '0') * scale;
+                scale /= 10;
+                digits++;
+            }
+
+            if (!digits) {
+                return -1;
+            }
+
+            has_fraction = 1;
+        }
+
+        switch (*c) {
+            case 'Y':
+                index = in_time ? -1 : 0;
+                break;
+            case 'M':
+                index = in_time ? 5 : 1;
+                break;
+            case 'W':
+                index = in_time ? -1 : 2;
+                break;
+            case 'D':
+                index = in_time ? -1 : 3;
+                break;
+            case 'H':
+                index = in_time ? 4 : -1;
+                break;
+            case 'S':
+                index = in_time ? 6 : -1;
+                break;
+            default:
+                index = -1;
+        }
+
+        if (index <= last) {
+            return -1;
+        }
+
+        if (has_fraction) {
+            if (index < 2) {
+                parsed->error = "Fractional years and months are not supported";
+
+                return -1;
+            }
+
+            parsed->microseconds = sign * (int64_t) (
+                fraction * DURATION_UNIT_USECS[index] + 0.5
+            );
+        }
+
+        parsed->units[index] = sign * value;
+        last = index;
+        components++;
+        c++;
+    }
+
+    /* At least one component, and one after the time designator */
+    if (!components) {
+        return -1;
+    }
+
+    parsed->error = NULL;
+
+    return 0;
+}
+
+
+PyObject* parse_iso8601_duration(PyObject *self, PyObject *args) {
+    char* str;
+    Duration parsed;
+
+    if (!PyArg_ParseTuple(args, "s", &str)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    if (_parse_iso8601_duration(str, &parsed) < 0) {
+        PyErr_SetString(PyExc_ValueError, parsed.error);
+
+        return NULL;
+    }
+
+    return Py_BuildValue(
+        "LLLLLLLL",
+        (long long) parsed.units[0], (long long) parsed.units[1],
+        (long long) parsed.units[2], (long long) parsed.units[3],
+        (long long) parsed.units[4], (long long) parsed.units[5],
+        (long long) parsed.units[6], (long long) parsed.microseconds
+    );
+}
+
+/* ------------------------ ISO 8601 formatting ------------------------- */
+
+// No UTC offset designator
+#define NO_OFFSET INT64_MIN
+
+// Length of the longest formatted string: 0001-01-01T00:00:00.000000+00:00:00
+#define MAX_ISO8601_LENGTH 35
+
+static char* write_digits(char *p, int64_t value, int width) {
+    int i;
+
+    for (i = width - 1; i >= 0; i--) {
+        p[i] = '0' + value % 10;
+        value /= 10;
+    }
+
+    return p + width;
+}
+
+/*
+ * Writes a datetime in the ISO 8601 format
+ * and returns the number of chars written.
+ *
+ * The first precision digits of the fraction are written
+ * or, if precision is -1, all of them unless they are 0.
+ * The seconds of the offset are only written if they are not 0
+ * and the offset is left out if it is NO_OFFSET.
+ */
+static int _format_iso8601(char *buffer, int year, int month, int day,
+                           int hour, int minute, int second, int microsecond,
+                           int64_t offset, int precision, char separator, int basic) {
+    char *p = buffer;
+
+    p = write_digits(p, year, 4);
+    if (!basic) {
+        *p++ = '-';
+    }
+
+    p = write_digits(p, month, 2);
+    if (!basic) {
+        *p++ = '-';
+    }
+
+    p = write_digits(p, day, 2);
+    *p++ = separator;
+    p = write_digits(p, hour, 2);
+    if (!basic) {
+        *p++ = ':';
+    }
+
+    p = write_digits(p, minute, 2);
+    if (!basic) {
+        *p++ = ':';
+    }
+
+    p = write_digits(p, second, 2);
+
+    if (precision < 0 && microsecond) {
+        precision = 6;
+    }
+
+    if (precision > 0) {
+        *p++ = '.';
+        write_digits(p, microsecond, 6);
+        p += precision;
+    }
+
+    if (offset != NO_OFFSET) {
+        *p++ = offset < 0 ? '-' : '+';
+        if (offset < 0) {
+            offset = -offset;
+        }
+
+        p = write_digits(p, offset / SECS_PER_HOUR, 2);
+        if (!basic) {
+            *p++ = ':';
+        }
+
+        p = write_digits(p, offset / SECS_PER_MIN % 60, 2);
+        if (offset % SECS_PER_MIN) {
+            if (!basic) {
+                *p++ = ':';
+            }
+
+            p = write_digits(p, offset % SECS_PER_MIN, 2);
+        }
+    }
+
+    return (int) (p - buffer);
+}
+
+static PyObject* new_string(const char *buffer, Py_ssize_t length) {
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromStringAndSize(buffer, length);
+#else
+    return PyString_FromStringAndSize(buffer, length);
+#endif
+}
+
+/*
+ * Checks the formatting options shared by the formatting functions.
+ */
+static int get_format_options(int precision, PyObject *separator_obj, char *separator) {
+    if (precision < -1 || precision > 6) {
+        PyErr_SetString(PyExc_ValueError, "Invalid precision");
+
+        return -1;
+    }
+
+    if (separator_obj == NULL) {
+        *separator = 'T';
+
+        return 0;
+    }
+
+#if PY_MAJOR_VERSION >= 3
+    if (PyUnicode_Check(separator_obj) && PyUnicode_GET_LENGTH(separator_obj) == 1
+            && PyUnicode_READ_CHAR(separator_obj, 0) < 128) {
+        *separator = (char) PyUnicode_READ_CHAR(separator_obj, 0);
+
+        return 0;
+    }
+#else
+    if (PyString_Check(separator_obj) && PyString_GET_SIZE(separator_obj) == 1) {
+        *separator = PyString_AS_STRING(separator_obj)[0];
+
+        return 0;
+    }
+#endif
+
+    PyErr_SetString(
+        PyExc_ValueError, "The separator must be a single ASCII character"
+    );
+
+    return -1;
+}
+
+/*
+ * Gets an offset in seconds from None, an integer or a timedelta.
+ */
+static int get_offset(PyObject *obj, int64_t *offset) {
+    if (obj == Py_None) {
+        *offset = NO_OFFSET;
+
+        return 0;
+    }
+
+    if (PyDelta_Check(obj)) {
+        if (PyDateTime_DELTA_GET_MICROSECONDS(obj)) {
+            PyErr_SetString(
+                PyExc_ValueError, "Offsets with microseconds are not supported"
+            );
+
+            return -1;
+        }
+
+        *offset = (int64_t) PyDateTime_DELTA_GET_DAYS(obj) * SECS_PER_DAY
+            + PyDateTime_DELTA_GET_SECONDS(obj);
+    } else {
+        *offset = PyLong_AsLongLong(obj);
+        if (*offset == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+    }
+
+    if (*offset <= -SECS_PER_DAY || *offset >= SECS_PER_DAY) {
+        PyErr_SetString(PyExc_ValueError, "Offset out of range");
+
+        return -1;
+    }
+
+    return 0;
+}
+
+static PyObject* format_datetime(PyObject *dt, PyObject *offset_obj,
+                                 int precision, char separator, int basic) {
+    char buffer[MAX_ISO8601_LENGTH + 1];
+    int64_t offset;
+    int length;
+
+    if (!PyDateTime_Check(dt)) {
+        PyErr_SetString(PyExc_TypeError, "Expected a datetime");
+
+        return NULL;
+    }
+
+    if (get_offset(offset_obj, &offset) < 0) {
+        return NULL;
+    }
+
+    length = _format_iso8601(
+        buffer,
+        PyDateTime_GET_YEAR(dt),
+        PyDateTime_GET_MONTH(dt),
+        PyDateTime_GET_DAY(dt),
+        PyDateTime_DATE_GET_HOUR(dt),
+        PyDateTime_DATE_GET_MINUTE(dt),
+        PyDateTime_DATE_GET_SECOND(dt),
+        PyDateTime_DATE_GET_MICROSECOND(dt),
+        offset, precision, separator, basic
+    );
+
+    return new_string(buffer, length);
+}
+
+PyObject* format_iso8601(PyObject *self, PyObject *args) {
+    PyObject *dt;
+    PyObject *offset_obj;
+    PyObject *separator_obj = NULL;
+    int precision = -1;
+    int basic = 0;
+    char separator;
+
+    if (!PyArg_ParseTuple(args, "OO|iOi", &dt, &offset_obj, &precision, &separator_obj, &basic)) {
+        return NULL;
+    }
+
+    if (get_format_options(precision, separator_obj, &separator) < 0) {
+        return NULL;
+    }
+
+    return format_datetime(dt, offset_obj, precision, separator, basic);
+}
+
+/*
+ * Formats a sequence of datetimes,
+ * with the offsets returned by their utcoffset() method.
+ */
+PyObject* format_iso8601_many(PyObject *self, PyObject *args) {
+    PyObject *dts_obj;
+    PyObject *dts;
+    PyObject *separator_obj = NULL;
+    PyObject *result;
+    PyObject *dt;
+    PyObject *offset_obj;
+    PyObject *string;
+    Py_ssize_t count;
+    Py_ssize_t i;
+    int precision = -1;
+    int basic = 0;
+    char separator;
+
+    if (!PyArg_ParseTuple(args, "O|iOi", &dts_obj, &precision, &separator_obj, &basic)) {
+        return NULL;
+    }
+
+    if (get_format_options(precision, separator_obj, &separator) < 0) {
+        return NULL;
+    }
+
+    dts = PySequence_Fast(dts_obj, "Expected a sequence of datetimes");
+    if (dts == NULL) {
+        return NULL;
+    }
+
+    count = PySequence_Fast_GET_SIZE(dts);
+    result = PyList_New(count);
+    if (result == NULL) {
+        Py_DECREF(dts);
+
+        return NULL;
+    }
+
+    for (i = 0; i < count; i++) {
+        dt = PySequence_Fast_GET_ITEM(dts, i);
+        if (!PyDateTime_Check(dt)) {
+            PyErr_SetString(PyExc_TypeError, "Expected a sequence of datetimes");
+            string = NULL;
+        } else {
+            offset_obj = PyObject_CallMethod(dt, "utcoffset", NULL);
+            if (offset_obj == NULL) {
+                string = NULL;
+            } else {
+                string = format_datetime(dt, offset_obj, precision, separator, basic);
+                Py_DECREF(offset_obj);
+            }
+        }
+
+        if (string == NULL) {
+            Py_DECREF(dts);
+            Py_DECREF(result);
+
+            return NULL;
+        }
+
+        PyList_SET_ITEM(result, i, string);
+    }
+
+    Py_DECREF(dts);
+
+    return result;
+}
+
+/*
+ * Formats wall clock microseconds elapsed since the epoch,
+ * given as int64 buffers or sequences of integers,
+ * with their offsets in seconds if offsets is not None.
+ * Offsets equal to INT64_MIN are left out.
+ */
+PyObject* format_iso8601_column(PyObject *self, PyObject *args) {
+    PyObject *locals_obj;
+    PyObject *offsets_obj;
+    PyObject *separator_obj = NULL;
+    PyObject *result = NULL;
+    PyObject *string;
+    Py_buffer locals_view;
+    Py_buffer offsets_view;
+    Py_ssize_t count;
+    Py_ssize_t i;
+    int64_t *locals;
+    int64_t *offsets = NULL;
+    int64_t local;
+    int64_t days;
+    int64_t seconds;
+    int64_t offset;
+    int precision = -1;
+    int basic = 0;
+    int year;
+    int month;
+    int day;
+    int length;
+    char separator;
+    char buffer[MAX_ISO8601_LENGTH + 1];
+
+    if (!PyArg_ParseTuple(args, "OO|iOi", &locals_obj, &offsets_obj, &precision, &separator_obj, &basic)) {
+        return NULL;
+    }
+
+    if (get_format_options(precision, separator_obj, &separator) < 0) {
+        return NULL;
+    }
+
+    if (get_int64_values(locals_obj, &locals_view) < 0) {
+        return NULL;
+    }
+
+    count = locals_view.len / 8;
+    locals = (int64_t *) locals_view.buf;
+
+    if (offsets_obj != Py_None) {
+        if (get_int64_values(offsets_obj, &offsets_view) < 0) {
+            PyBuffer_Release(&locals_view);
+
+            return NULL;
+        }
+
+        offsets = (int64_t *) offsets_view.buf;
+
+        if (offsets_view.len / 8 < count) {
+            PyErr_SetString(
+                PyExc_ValueError, "The offsets buffer is too small"
+            );
+
+            goto done;
+        }
+    }
+
+    result = PyList_New(count);
+    if (result == NULL) {
+        goto done;
+    }
+
+    for (i = 0; i < count; i++) {
+        local = locals[i];
+        offset = offsets == NULL ? NO_OFFSET : offsets[i];
+
+        // 0001-01-01 and 9999-12-31 being respectively
+        // 719162 days before and 2932896 days after the epoch
+        days = floor_div(local, (int64_t) SECS_PER_DAY * USECS_PER_SEC);
+        if (days < -719162 || days > 2932896
+                || (offset != NO_OFFSET && (offset <= -SECS_PER_DAY || offset >= SECS_PER_DAY))) {
+            PyErr_SetString(PyExc_ValueError, "Timestamp or offset out of range");
+            Py_CLEAR(result);
+
+            goto done;
+        }
+
+        civil_from_days(days, &year, &month, &day);
+        seconds = floor_div(local, USECS_PER_SEC);
+
+        length = _format_iso8601(
+            buffer, year, month, day,
+            (int) ((seconds - days * SECS_PER_DAY) / SECS_PER_HOUR),
+            (int) ((seconds - days * SECS_PER_DAY) / SECS_PER_MIN % 60),
+            (int) ((seconds - days * SECS_PER_DAY) % SECS_PER_MIN),
+            (int) (local - seconds * USECS_PER_SEC),
+            offset, precision, separator, basic
+        );
+
+        string = new_string(buffer, length);
+        if (string == NULL) {
+            Py_CLEAR(result);
+
+            goto done;
+        }
+
+        PyList_SET_ITEM(result, i, string);
+    }
+
+done:
+    PyBuffer_Release(&locals_view);
+    if (offsets != NULL) {
+        PyBuffer_Release(&offsets_view);
+    }
+
+    return result;
+}
+
+/* ------------------------ RFC 2822 parsing ---------------------------- */
+
+static const char *MONTH_NAMES[12] = {
+    "jan", "feb", "mar", "apr", "may", "jun",
+    "jul", "aug", "sep", "oct", "nov", "dec"
+};
+
+static const char *DAY_NAMES[7] = {
+    "mon", "tue", "wed", "thu", "fri", "sat", "sun"
+};
+
+static const char *FULL_DAY_NAMES[7] = {
+    "monday", "tuesday", "wednesday", "thursday",
+    "friday", "saturday", "sunday"
+};
+
+typedef struct {
+    const char *name;
+    int offset;
+} ZoneName;
+
+// Zone names allowed by RFC 2822 (obs-zone), military zones excepted.
+static const ZoneName ZONE_NAMES[] = {
+    {"ut", 0}, {"utc", 0}, {"gmt", 0}, {"z", 0},
+    {"est", -5 * SECS_PER_HOUR}, {"edt", -4 * SECS_PER_HOUR},
+    {"cst", -6 * SECS_PER_HOUR}, {"cdt", -5 * SECS_PER_HOUR},
+    {"mst", -7 * SECS_PER_HOUR}, {"mdt", -6 * SECS_PER_HOUR},
+    {"pst", -8 * SECS_PER_HOUR}, {"pdt", -7 * SECS_PER_HOUR},
+    {NULL, 0}
+};
+
+#define MAX_WORD_LENGTH 10
+
+/*
+ * Reads a word, lowercased, into buffer
+ * and returns its length or 0 if it is empty or too long.
+ */
+static int read_word(char **c, char *buffer) {
+    int length = 0;
+
+    while ((**c >= 'a' && **c <= 'z') || (**c >= 'A' && **c <= 'Z')) {
+        if (length == MAX_WORD_LENGTH) {
+            return 0;
+        }
+
+        buffer[length++] = (char) (**c | 0x20);
+        (*c)++;
+    }
+
+    buffer[length] = '\0';
+
+    return length;
+}
+
+/*
+ * Reads between min and max digits
+ * and returns the number of digits read or 0.
+ */
+static int read_number(char **c, int min, int max, int *value) {
+    int length = 0;
+
+    *value = 0;
+    while (**c >= '0' && **c <= '9') {
+        if (length == max) {
+            return 0;
+        }
+
+        *value = 10 * *value + *(*c)++ - '0';
+        length++;
+    }
+
+    if (length < min) {
+        return 0;
+    }
+
+    return length;
+}
+
+static int skip_spaces(char **c) {
+    int count = 0;
+
+    while (**c == ' ' || **c == '\t') {
+        (*c)++;
+        count++;
+    }
+
+    return count;
+}
+
+static int expect(char **c, char expected) {
+    if (**c != expected) {
+        return 0;
+    }
+
+    (*c)++;
+
+    return 1;
+}
+
+static int find_name(const char *word, const char **names, int count) {
+    int i;
+
+    for (i = 0; i < count; i++) {
+        if (strcmp(word, names[i]) == 0) {
+            return i + 1;
+        }
+    }
+
+    return 0;
+}
+
+static int read_month(char **c) {
+    char word[MAX_WORD_LENGTH + 1];
+
+    if (!read_word(c, word)) {
+        return 0;
+    }
+
+    return find_name(word, MONTH_NAMES, 12);
+}
+
+/*
+ * Reads a time in the form HH:MM[:SS].
+ */
+static int read_time(char **c, int *hour, int *minute, int *second) {
+    if (!read_number(c, 1, 2, hour) || **c != ':') {
+        return 0;
+    }
+
+    (*c)++;
+    if (!read_number(c, 2, 2, minute)) {
+        return 0;
+    }
+
+    *second = 0;
+    if (**c == ':') {
+        (*c)++;
+        if (!read_number(c, 2, 2, second)) {
+            return 0;
+        }
+    }
+
+    return 1;
+}
+
+/*
+ * Reads an optional zone, either numeric (+HHMM) or named,
+ * followed by an optional comment.
+ */
+static int read_zone(char **c, int *has_offset, int *offset) {
+    char word[MAX_WORD_LENGTH + 1];
+    int sign;
+    int value;
+    int i;
+
+    *has_offset = 0;
+
+    if (!skip_spaces(c)) {
+        return **c == '\0';
+    }
+
+    if (**c == '+' || **c == '-') {
+        sign = **c == '-' ? -1 : 1;
+        (*c)++;
+
+        if (!read_number(c, 4, 4, &value) || value % 100 > 59) {
+            return 0;
+        }
+
+        *has_offset = 1;
+        *offset = sign * ((value / 100) * SECS_PER_HOUR + (value % 100) * SECS_PER_MIN);
+    } else if (read_word(c, word)) {
+        for (i = 0; ZONE_NAMES[i].name != NULL; i++) {
+            if (strcmp(word, ZONE_NAMES[i].name) == 0) {
+                *has_offset = 1;
+                *offset = ZONE_NAMES[i].offset;
+
+                break;
+            }
+        }
+
+        if (!*has_offset) {
+            return 0;
+        }
+    }
+
+    skip_spaces(c);
+
+    // Comment, like in "+0000 (UTC)"
+    if (**c == '(') {
+        while (**c != '\0' && **c != ')') {
+            (*c)++;
+        }
+
+        if (**c != ')') {
+            return 0;
+        }
+
+        (*c)++;
+        skip_spaces(c);
+    }
+
+    return 1;
+}
+
+static int expand_year(int year, int digits) {
+    // Obsolete 2 and 3 digit years
+    if (digits == 2) {
+        return year < 50 ? 2000 + year : 1900 + year;
+    }
+
+    if (digits == 3) {
+        return 1900 + year;
+    }
+
+    return year;
+}
+
+/*
+ * Scans a RFC 2822, RFC 1123, RFC 850 or asctime string
+ * without creating any Python object.
+ *
+ * Returns -1 and sets the error message of parsed
+ * if the string is invalid, without raising any exception.
+ */
+static int _parse_rfc2822(char *str, Iso8601 *parsed) {
+    char* c;
+    char word[MAX_WORD_LENGTH + 1];
+    int length;
+    int year = 0;
+    int month = 0;
+    int day = 0;
+    int hour = 0;
+    int minute = 0;
+    int second = 0;
+    int offset = 0;
+    int has_offset = 0;
+    int digits = 0;
+    int valid = 0;
+
+    c = str;
+    skip_spaces(&c);
+
+    length = read_word(&c, word);
+    if (length && find_name(word, FULL_DAY_NAMES, 7) && length > 3) {
+        // RFC 850: Sunday, 06-Nov-94 08:49:37 GMT
+        skip_spaces(&c);
+        valid = (
+            expect(&c, ',')
+            && (skip_spaces(&c), read_number(&c, 1, 2, &day))
+            && expect(&c, '-')
+            && (month = read_month(&c))
+            && expect(&c, '-')
+            && (digits = read_number(&c, 2, 4, &year))
+            && skip_spaces(&c)
+            && read_time(&c, &hour, &minute, &second)
+            && read_zone(&c, &has_offset, &offset)
+        );
+        if (valid) {
+            year = expand_year(year, digits);
+        }
+    } else if (length && find_name(word, DAY_NAMES, 7)) {
+        skip_spaces(&c);
+
+        if (*c == ',') {
+            // RFC 2822 and RFC 1123: Sun, 06 Nov 1994 08:49:37 GMT
+            c++;
+            skip_spaces(&c);
+            length = 0;
+        } else {
+            // asctime: Sun Nov  6 08:49:37 1994
+            valid = (
+                (month = read_month(&c))
+                && skip_spaces(&c)
+                && read_number(&c, 1, 2, &day)
+                && skip_spaces(&c)
+                && read_time(&c, &hour, &minute, &second)
+                && skip_spaces(&c)
+                && read_number(&c, 4, 4, &year)
+            );
+            skip_spaces(&c);
+        }
+    }
+
+    if (!length) {
+        // RFC 2822 without the day name: 06 Nov 1994 08:49:37 GMT
+        valid = (
+            read_number(&c, 1, 2, &day)
+            && skip_spaces(&c)
+            && (month = read_month(&c))
+            && skip_spaces(&c)
+            && (digits = read_number(&c, 2, 4, &year))
+            && skip_spaces(&c)
+            && read_time(&c, &hour, &minute, &second)
+            && read_zone(&c, &has_offset, &offset)
+        );
+        if (valid) {
+            year = expand_year(year, digits);
+        }
+    }
+
+    if (!valid || *c != '\0') {
+        parsed->error = "Invalid RFC 2822 string";
+
+        return -1;
+    }
+
+    if (year < 1 || day < 1 || day > DAYS_PER_MONTHS[is_leap(year)][month]
+            || hour > 23 || minute > 59 || second > 59) {
+        parsed->error = "Invalid date";
+
+        return -1;
+    }
+
+    parsed->year = year;
+    parsed->month = month;
+    parsed->day = day;
+    parsed->hour = hour;
+    parsed->minute = minute;
+    parsed->second = second;
+    parsed->subsecond = 0;
+    parsed->offset = offset;
+    parsed->has_time = 1;
+    parsed->has_offset = has_offset;
+    parsed->ambiguous_date = 0;
+
+    return 0;
+}
+
+
+/*
+ * Parses a RFC 2822 string into a tuple.
+ *
+ * Invalid strings raise a ValueError or, if raise is 0,
+ * return None without creating any exception.
+ */
+static PyObject* rfc2822_tuple(PyObject *args, int raise) {
+    char* str;
+    Iso8601 parsed;
+
+    if (!PyArg_ParseTuple(args, "s", &str)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    if (_parse_rfc2822(str, &parsed) < 0) {
+        if (!raise) {
+            Py_RETURN_NONE;
+        }
+
+        PyErr_SetString(PyExc_ValueError, parsed.error);
+
+        return NULL;
+    }
+
+    if (!parsed.has_offset) {
+        return Py_BuildValue(
+            "iiiiiiO", parsed.year, parsed.month, parsed.day,
+            parsed.hour, parsed.minute, parsed.second, Py_None
+        );
+    }
+
+    return Py_BuildValue(
+        "iiiiiii", parsed.year, parsed.month, parsed.day,
+        parsed.hour, parsed.minute, parsed.second, parsed.offset
+    );
+}
+
+PyObject* parse_rfc2822(PyObject *self, PyObject *args) {
+    return rfc2822_tuple(args, 1);
+}
+
+PyObject* try_parse_rfc2822(PyObject *self, PyObject *args) {
+    return rfc2822_tuple(args, 0);
+}
+
+PyObject* parse(PyObject *self, PyObject *args) {
+    char* str;
+    char* c;
+    int day_first;
+    int separators = 0;
+    PyObject *obj;
+
+    if (!PyArg_ParseTuple(args, "si", &str, &day_first)) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters"
+        );
+        return NULL;
+    }
+
+    c = str;
+    c++;
     separators++;
 
     obj = PyDateTimeAPI->Date_FromDate(
@@ -946,12 +2626,78 @@ static PyMethodDef helpers_methods[] = {
         METH_VARARGS,
         PyDoc_STR("Returns a UNIX time as a broken down time for a particular transition type.")
     },
+    {
+        "precise_diff",
+        (PyCFunction) precise_diff,
+        METH_VARARGS,
+        PyDoc_STR("Calculate a precise difference between two datetimes.")
+    },
+    {
+        "add_duration",
+        (PyCFunction) add_duration,
+        METH_VARARGS | METH_KEYWORDS,
+        PyDoc_STR("Adds a duration to a date or datetime instance.")
+    },
     {
         "parse_iso8601",
         (PyCFunction) parse_iso8601,
         METH_VARARGS,
         PyDoc_STR("Parses a ISO8601 string into a tuple.")
     },
+    {
+        "try_parse_iso8601",
+        (PyCFunction) try_parse_iso8601,
+        METH_VARARGS,
+        PyDoc_STR("Parses a ISO8601 string into a tuple, or returns None if it is invalid.")
+    },
+    {
+        "parse_iso8601_timestamp",
+        (PyCFunction) parse_iso8601_timestamp,
+        METH_VARARGS,
+        PyDoc_STR("Parses a ISO8601 string into wall clock microseconds since the epoch and an offset.")
+    },
+    {
+        "parse_iso8601_column",
+        (PyCFunction) parse_iso8601_column,
+        METH_VARARGS,
+        PyDoc_STR("Parses ISO8601 strings at fixed positions of a buffer into wall clock microseconds and offsets.")
+    },
+    {
+        "parse_iso8601_duration",
+        (PyCFunction) parse_iso8601_duration,
+        METH_VARARGS,
+        PyDoc_STR("Parses a ISO8601 duration into a tuple of years, months, weeks, days, hours, minutes, seconds and microseconds.")
+    },
+    {
+        "format_iso8601",
+        (PyCFunction) format_iso8601,
+        METH_VARARGS,
+        PyDoc_STR("Formats a datetime in the ISO 8601 format with a given offset.")
+    },
+    {
+        "format_iso8601_many",
+        (PyCFunction) format_iso8601_many,
+        METH_VARARGS,
+        PyDoc_STR("Formats a sequence of datetimes in the ISO 8601 format.")
+    },
+    {
+        "format_iso8601_column",
+        (PyCFunction) format_iso8601_column,
+        METH_VARARGS,
+        PyDoc_STR("Formats an int64 buffer of wall clock microseconds in the ISO 8601 format.")
+    },
+    {
+        "parse_rfc2822",
+        (PyCFunction) parse_rfc2822,
+        METH_VARARGS,
+        PyDoc_STR("Parses a RFC 2822, RFC 1123, RFC 850 or asctime string into a tuple.")
+    },
+    {
+        "try_parse_rfc2822",
+        (PyCFunction) try_parse_rfc2822,
+        METH_VARARGS,
+        PyDoc_STR("Parses a RFC 2822, RFC 1123, RFC 850 or asctime string into a tuple, or returns None if it is invalid.")
+    },
     {NULL}
 };
 
@@ -1010,7 +2756,14 @@ init_helpers(void)
 
     Py_INCREF(&FixedOffset_type);
 
+    if (PreciseDiff_type.tp_name == NULL) {
+        PyStructSequence_InitType(&PreciseDiff_type, &PreciseDiff_desc);
+    }
+
+    Py_INCREF(&PreciseDiff_type);
+
     PyModule_AddObject(module, "TZFixedOffset", (PyObject *)&FixedOffset_type);
+    PyModule_AddObject(module, "PreciseDiff", (PyObject *)&PreciseDiff_type);
 #if PY_MAJOR_VERSION >= 3
     return module;
 #endif
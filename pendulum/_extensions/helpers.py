@@ -1,17 +1,108 @@
 # -*- coding: utf-8 -*-
 
+import re
+
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta, tzinfo
+from itertools import repeat
+from math import copysign
+
+from .._compat import PY2
 from ..constants import (
-    EPOCH_YEAR,
+    DAY_OF_WEEK_TABLE,
+    DAYS_PER_L_YEAR,
+    DAYS_PER_MONTHS,
+    DAYS_PER_N_YEAR,
+    MONTHS_OFFSETS,
     SECS_PER_DAY,
-    SECS_PER_400_YEARS,
-    SECS_PER_100_YEARS,
-    SECS_PER_4_YEARS,
-    SECS_PER_YEAR,
     SECS_PER_HOUR,
-    SECS_PER_MIN,
-    MONTHS_OFFSETS,
-    TM_DECEMBER,
-    TM_JANUARY
+    SECS_PER_MIN
+)
+
+DAYS_PER_400_YEARS = 146097
+
+# Days between 0000-03-01 and 1970-01-01
+DAYS_FROM_ERA_TO_EPOCH = 719468
+
+
+_RFC_TIME = (
+    '(?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{2})(?::(?P<second>[0-9]{2}))?'
+)
+
+_RFC_ZONE = (
+    '(?:'
+    r'    [\ \t]+'
+    '    (?:(?P<sign>[-+])(?P<offset>[0-9]{4})|(?P<zone>[a-z]+))?'
+    r'    [\ \t]*'
+    r'    (?:\([^)]*\)[\ \t]*)?'  # Comment, like in "+0000 (UTC)"
+    ')?'
+)
+
+_RFC_FORMATS = [
+    # RFC 2822 and RFC 1123: Sun, 06 Nov 1994 08:49:37 GMT
+    re.compile(
+        r'^[\ \t]*'
+        r'(?:(?:mon|tue|wed|thu|fri|sat|sun)[\ \t]*,[\ \t]*)?'
+        r'(?P<day>[0-9]{1,2})[\ \t]+'
+        r'(?P<month>[a-z]+)[\ \t]+'
+        r'(?P<year>[0-9]{2,4})[\ \t]+'
+        + _RFC_TIME + _RFC_ZONE +
+        '$',
+        re.IGNORECASE | re.VERBOSE
+    ),
+    # RFC 850: Sunday, 06-Nov-94 08:49:37 GMT
+    re.compile(
+        r'^[\ \t]*'
+        '(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)'
+        r'[\ \t]*,[\ \t]*'
+        r'(?P<day>[0-9]{1,2})-(?P<month>[a-z]+)-(?P<year>[0-9]{2,4})[\ \t]+'
+        + _RFC_TIME + _RFC_ZONE +
+        '$',
+        re.IGNORECASE | re.VERBOSE
+    ),
+    # asctime: Sun Nov  6 08:49:37 1994
+    re.compile(
+        r'^[\ \t]*'
+        r'(?:mon|tue|wed|thu|fri|sat|sun)[\ \t]+'
+        r'(?P<month>[a-z]+)[\ \t]+'
+        r'(?P<day>[0-9]{1,2})[\ \t]+'
+        + _RFC_TIME +
+        r'[\ \t]+(?P<year>[0-9]{4})[\ \t]*'
+        '$',
+        re.IGNORECASE | re.VERBOSE
+    ),
+]
+
+_RFC_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Indexes of the ISO 8601 duration designators, in order,
+# before and after the time designator
+_DURATION_DATE_UNITS = {'Y': 0, 'M': 1, 'W': 2, 'D': 3}
+_DURATION_TIME_UNITS = {'H': 4, 'M': 5, 'S': 6}
+
+# Microseconds per week, day, hour, minute and second
+_DURATION_UNIT_USECS = [
+    None, None, 604800000000, 86400000000, 3600000000, 60000000, 1000000
+]
+
+_DURATION_COMPONENT = re.compile(r'([0-9]{1,9})(?:[.,]([0-9]+))?([A-Z])')
+
+# Zone names allowed by RFC 2822 (obs-zone), military zones excepted.
+_RFC_ZONES = {
+    'ut': 0, 'utc': 0, 'gmt': 0, 'z': 0,
+    'est': -5 * SECS_PER_HOUR, 'edt': -4 * SECS_PER_HOUR,
+    'cst': -6 * SECS_PER_HOUR, 'cdt': -5 * SECS_PER_HOUR,
+    'mst': -7 * SECS_PER_HOUR, 'mdt': -6 * SECS_PER_HOUR,
+    'pst': -8 * SECS_PER_HOUR, 'pdt': -7 * SECS_PER_HOUR,
+}
+
+
+PreciseDiff = namedtuple(
+    'PreciseDiff',
+    'years months days hours minutes seconds microseconds'
 )
 
 
@@ -26,68 +117,1032 @@ def local_time(unix_time, utc_offset, microseconds):
 
     :rtype: tuple
     """
-    year = EPOCH_YEAR
-    seconds = int(unix_time)
+    days, seconds = divmod(int(unix_time) + utc_offset, SECS_PER_DAY)
 
-    # Shift to a base year that is 400-year aligned.
-    if seconds >= 0:
-        seconds -= 10957 * SECS_PER_DAY
-        year += 30  # == 2000
-    else:
-        seconds += (146097 - 10957) * SECS_PER_DAY
-        year -= 370  # == 1600
-
-    seconds += utc_offset
-
-    # Handle years in chunks of 400/100/4/1
-    year += 400 * (seconds // SECS_PER_400_YEARS)
-    seconds %= SECS_PER_400_YEARS
-    if seconds < 0:
-        seconds += SECS_PER_400_YEARS
-        year -= 400
-
-    leap_year = 1  # 4-century aligned
-
-    sec_per_100years = SECS_PER_100_YEARS[leap_year]
-    while seconds >= sec_per_100years:
-        seconds -= sec_per_100years
-        year += 100
-        leap_year = 0  # 1-century, non 4-century aligned
-        sec_per_100years = SECS_PER_100_YEARS[leap_year]
-
-    sec_per_4years = SECS_PER_4_YEARS[leap_year]
-    while seconds >= sec_per_4years:
-        seconds -= sec_per_4years
-        year += 4
-        leap_year = 1  # 4-year, non century aligned
-        sec_per_4years = SECS_PER_4_YEARS[leap_year]
-
-    sec_per_year = SECS_PER_YEAR[leap_year]
-    while seconds >= sec_per_year:
-        seconds -= sec_per_year
-        year += 1
-        leap_year = 0  # non 4-year aligned
-        sec_per_year = SECS_PER_YEAR[leap_year]
-
-    # Handle months and days
-    month = TM_DECEMBER + 1
-    day = seconds // SECS_PER_DAY + 1
-    seconds %= SECS_PER_DAY
-    while month != TM_JANUARY + 1:
-        month_offset = MONTHS_OFFSETS[leap_year][month]
-        if day > month_offset:
-            day -= month_offset
-            break
+    # Days are counted in 400-year eras starting on March 1st
+    # so that leap days are at the end of the years.
+    era, doe = divmod(days + DAYS_FROM_ERA_TO_EPOCH, DAYS_PER_400_YEARS)
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
 
-        month -= 1
+    if mp < 10:
+        month = mp + 3
+        year = yoe + era * 400
+    else:
+        month = mp - 9
+        year = yoe + era * 400 + 1
 
     # Handle hours, minutes, seconds and microseconds
-    hour = seconds // SECS_PER_HOUR
-    seconds %= SECS_PER_HOUR
-    minute = seconds // SECS_PER_MIN
-    second = seconds % SECS_PER_MIN
+    hour, seconds = divmod(seconds, SECS_PER_HOUR)
+    minute, second = divmod(seconds, SECS_PER_MIN)
 
     return (
         year, month, day,
         hour, minute, second, microseconds
     )
+
+
+def local_times(unix_times, utc_offsets, microseconds=None):
+    """
+    Returns UNIX times as broken down times.
+
+    The date of the previous time is reused when it falls
+    on the same day, which makes sorted times cheaper to break down.
+
+    :param unix_times: The UNIX times
+    :type unix_times: list or tuple or numpy.ndarray
+
+    :param utc_offsets: The UTC offset of all the times
+                        or the UTC offset of each time
+    :type utc_offsets: int or list or tuple or numpy.ndarray
+
+    :param microseconds: The microseconds of each time (defaults to 0)
+    :type microseconds: list or tuple or numpy.ndarray or None
+
+    :rtype: list
+    """
+    if hasattr(unix_times, 'tolist'):
+        unix_times = unix_times.tolist()
+
+    if hasattr(utc_offsets, 'tolist'):
+        utc_offsets = utc_offsets.tolist()
+    elif not isinstance(utc_offsets, (list, tuple)):
+        utc_offsets = repeat(utc_offsets)
+
+    if microseconds is None:
+        microseconds = repeat(0)
+    elif hasattr(microseconds, 'tolist'):
+        microseconds = microseconds.tolist()
+
+    times = []
+    append = times.append
+    last_days = None
+    for unix_time, utc_offset, microsecond in zip(unix_times, utc_offsets, microseconds):
+        days, seconds = divmod(int(unix_time) + utc_offset, SECS_PER_DAY)
+
+        if days != last_days:
+            last_days = days
+
+            era, doe = divmod(days + DAYS_FROM_ERA_TO_EPOCH, DAYS_PER_400_YEARS)
+            yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+            doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+            mp = (5 * doy + 2) // 153
+            day = doy - (153 * mp + 2) // 5 + 1
+
+            if mp < 10:
+                month = mp + 3
+                year = yoe + era * 400
+            else:
+                month = mp - 9
+                year = yoe + era * 400 + 1
+
+        hour, seconds = divmod(seconds, SECS_PER_HOUR)
+        minute, second = divmod(seconds, SECS_PER_MIN)
+
+        append((year, month, day, hour, minute, second, microsecond))
+
+    return times
+
+
+def add_duration(dt, years=0, months=0, weeks=0, days=0,
+                 hours=0, minutes=0, seconds=0, microseconds=0):
+    """
+    Adds a duration to a date or datetime instance.
+
+    :param dt: The date or datetime instance
+    :type dt: datetime.date or datetime.datetime
+
+    :param years: The number of years
+    :type years: int
+
+    :param months: The number of months
+    :type months: int
+
+    :param weeks: The number of weeks
+    :type weeks: int
+
+    :param days: The number of days
+    :type days: int
+
+    :param hours: The number of hours
+    :type hours: int
+
+    :param minutes: The number of minutes
+    :type minutes: int
+
+    :param seconds: The number of seconds
+    :type seconds: int
+
+    :param microseconds: The number of microseconds
+    :type microseconds: int
+
+    :rtype: datetime.date or datetime.datetime
+    """
+    days += weeks * 7
+
+    # Normalizing
+    if abs(microseconds) > 999999:
+        s = _sign(microseconds)
+        div, mod = divmod(microseconds * s, 1000000)
+        microseconds = mod * s
+        seconds += div * s
+
+    if abs(seconds) > 59:
+        s = _sign(seconds)
+        div, mod = divmod(seconds * s, 60)
+        seconds = mod * s
+        minutes += div * s
+
+    if abs(minutes) > 59:
+        s = _sign(minutes)
+        div, mod = divmod(minutes * s, 60)
+        minutes = mod * s
+        hours += div * s
+
+    if abs(hours) > 23:
+        s = _sign(hours)
+        div, mod = divmod(hours * s, 24)
+        hours = mod * s
+        days += div * s
+
+    if abs(months) > 11:
+        s = _sign(months)
+        div, mod = divmod(months * s, 12)
+        months = mod * s
+        years += div * s
+
+    year = dt.year + years
+    month = dt.month
+
+    if months:
+        month += months
+        if month > 12:
+            year += 1
+            month -= 12
+        elif month < 1:
+            year -= 1
+            month += 12
+
+    day = min(DAYS_PER_MONTHS[int(is_leap(year))][month], dt.day)
+
+    dt = dt.replace(year=year, month=month, day=day)
+
+    return dt + timedelta(
+        days=days,
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+        microseconds=microseconds
+    )
+
+
+def precise_diff(d1, d2):
+    """
+    Calculate a precise difference between two datetimes.
+
+    :param d1: The first datetime
+    :type d1: pendulum.Pendulum or pendulum.Date
+
+    :param d2: The second datetime
+    :type d2: pendulum.Pendulum or pendulum.Date
+
+    :rtype: PreciseDiff
+    """
+    sign = 1
+
+    if d1 == d2:
+        return PreciseDiff(0, 0, 0, 0, 0, 0, 0)
+
+    if d1 > d2:
+        d1, d2 = d2, d1
+        sign = -1
+
+    y_diff = d2.year - d1.year
+    m_diff = d2.month - d1.month
+    d_diff = d2.day - d1.day
+    hour_diff = 0
+    min_diff = 0
+    sec_diff = 0
+    mic_diff = 0
+
+    if hasattr(d2, 'hour'):
+        hour_diff = d2.hour - d1.hour
+        min_diff = d2.minute - d1.minute
+        sec_diff = d2.second - d1.second
+        mic_diff = d2.microsecond - d1.microsecond
+
+        if mic_diff < 0:
+            mic_diff += 1000000
+            sec_diff -= 1
+
+        if sec_diff < 0:
+            sec_diff += 60
+            min_diff -= 1
+
+        if min_diff < 0:
+            min_diff += 60
+            hour_diff -= 1
+
+        if hour_diff < 0:
+            hour_diff += 24
+            d_diff -= 1
+
+    if d_diff < 0:
+        year = d2.year
+        month = d2.month
+
+        if month == 1:
+            month = 12
+            year -= 1
+        else:
+            month -= 1
+
+        leap = int(is_leap(year))
+
+        days_in_last_month = DAYS_PER_MONTHS[leap][month]
+        days_in_month = DAYS_PER_MONTHS[int(is_leap(d2.year))][d2.month]
+
+        if d_diff < days_in_month - days_in_last_month:
+            # We don't have a full month, we calculate days
+            if days_in_last_month < d1.day:
+                d_diff += d1.day
+            else:
+                d_diff += days_in_last_month
+        elif d_diff == days_in_month - days_in_last_month:
+            # We have exactly a full month
+            # We remove the days difference
+            # and add one to the months difference
+            d_diff = 0
+            m_diff += 1
+        else:
+            # We have a full month
+            d_diff += days_in_last_month
+
+        m_diff -= 1
+
+    if m_diff < 0:
+        m_diff += 12
+        y_diff -= 1
+
+    return PreciseDiff(
+        sign * y_diff,
+        sign * m_diff,
+        sign * d_diff,
+        sign * hour_diff,
+        sign * min_diff,
+        sign * sec_diff,
+        sign * mic_diff
+    )
+
+
+def is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _sign(x):
+    return int(copysign(1, x))
+
+
+class TZFixedOffset(tzinfo):
+    """
+    Timezone with a fixed offset of the datetimes parsed from ISO 8601 strings.
+    """
+
+    def __init__(self, offset):
+        self.offset = offset
+        self._delta = timedelta(seconds=offset)
+
+    def utcoffset(self, dt):
+        return self._delta
+
+    def dst(self, dt):
+        return self._delta
+
+    def tzname(self, dt):
+        sign = '-' if self.offset < 0 else '+'
+        hours, minutes = divmod(abs(self.offset) // 60, 60)
+
+        return '{}{:02d}:{:02d}'.format(sign, hours, minutes)
+
+    def __repr__(self):
+        return self.tzname(None)
+
+
+_DIGITS = '0123456789'
+
+# Characters which may follow the fixed-width
+# dates and times of the extended format
+_DATE_ENDS = ('', 'T', ' ')
+_TIME_ENDS = ('', '.', ',', 'Z', '+', '-')
+
+# Maximum length of the bytes-like objects, like the C extension
+_MAX_TEXT_LENGTH = 64
+
+# Offsets are few, so their tzinfo instances are shared
+_FIXED_OFFSETS = {}
+
+
+def parse_iso8601(text, day_first=False):
+    """
+    Parses an ISO 8601 string into a date, time or datetime.
+
+    This is the pure Python counterpart of the C extension's scanner,
+    with the same grammar.
+
+    :param text: The string to parse
+    :type text: str or bytes or bytearray or memoryview
+
+    :param day_first: Whether the day comes before the month
+    :type day_first: bool
+
+    :rtype: date or time or datetime
+
+    :raises: ValueError
+    """
+    parsed = _parse_iso8601(_iso8601_text(text), day_first)
+    if not isinstance(parsed, tuple):
+        raise ValueError(parsed)
+
+    return _iso8601_object(*parsed)
+
+
+def try_parse_iso8601(text, day_first=False):
+    """
+    Parses an ISO 8601 string like parse_iso8601()
+    without raising any exception if it is invalid.
+
+    :param text: The string to parse
+    :type text: str or bytes or bytearray or memoryview
+
+    :param day_first: Whether the day comes before the month
+    :type day_first: bool
+
+    :rtype: date or time or datetime or None
+    """
+    parsed = _parse_iso8601(_iso8601_text(text), day_first)
+    if not isinstance(parsed, tuple):
+        return
+
+    return _iso8601_object(*parsed)
+
+
+def scan_iso8601(text, day_first=False):
+    """
+    Scans an ISO 8601 string into its fields
+    without creating any date object.
+
+    :param text: The string to scan
+    :type text: str or bytes or bytearray or memoryview
+
+    :param day_first: Whether the day comes before the month
+    :type day_first: bool
+
+    :return: The year, month, day, hour, minute, second, microsecond,
+             UTC offset (or None), whether there is a time
+             and whether the date is actually a time in the form hhmmss,
+             or None if the string is invalid
+    :rtype: tuple or None
+
+    :raises: ValueError if the fields are out of range
+    """
+    parsed = _parse_iso8601(_iso8601_text(text), day_first)
+    if not isinstance(parsed, tuple):
+        return
+
+    # The checks left to the date and time constructors,
+    # which raise the same errors as with the C extension
+    year, month, day = parsed[:3]
+    if parsed[9]:
+        if year // 100 > 23 or year % 100 > 59:
+            _iso8601_object(*parsed)
+    elif year < 1 or day < 1:
+        _iso8601_object(*parsed)
+
+    return parsed
+
+
+def _iso8601_text(text):
+    if isinstance(text, (bytearray, memoryview)) or (not PY2 and isinstance(text, bytes)):
+        text = bytes(text)
+        if len(text) > _MAX_TEXT_LENGTH:
+            # Too long to be an ISO 8601 string
+            return ''
+
+        # Other characters than ASCII ones are invalid anyway
+        text = text.decode('latin-1')
+
+    if '\0' in text:
+        return ''
+
+    return text
+
+
+def _iso8601_object(year, month, day, hour, minute, second, microsecond,
+                    offset, has_time, ambiguous_date):
+    if not has_time:
+        if ambiguous_date:
+            # We can "safely" assume that the ambiguous
+            # date was actually a time in the form hhmmss
+            return time(year // 100, year % 100, month)
+
+        return date(year, month, day)
+
+    tz = None
+    if offset is not None:
+        tz = _FIXED_OFFSETS.get(offset)
+        if tz is None:
+            tz = _FIXED_OFFSETS.setdefault(offset, TZFixedOffset(offset))
+
+    return datetime(year, month, day, hour, minute, second, microsecond, tz)
+
+
+def _parse_iso8601(text, day_first):
+    """
+    Scans an ISO 8601 string, slicing it at its separators
+    rather than matching a regular expression.
+
+    :return: The year, month, day, hour, minute, second, microsecond,
+             UTC offset (or None), whether there is a time
+             and whether the date is ambiguous,
+             or the error message if the string is invalid
+    :rtype: tuple or str
+    """
+    length = len(text)
+
+    if (length >= 10 and text[4] == '-' and text[7] == '-' and text[10:11] in _DATE_ENDS
+            and not (text[:4] + text[5:7] + text[8:10]).strip(_DIGITS)):
+        # Fast path for the extended format (2016-10-06)
+        year = int(text[:4])
+        month = int(text[5:7])
+        day = int(text[8:10])
+        if day_first:
+            month, day = day, month
+
+        ambiguous_date = False
+        end = min(length, 10)
+    else:
+        parsed = _parse_iso8601_date(text, day_first)
+        if not isinstance(parsed, tuple):
+            return parsed
+
+        year, month, day, end, ambiguous_date = parsed
+
+    if month > 12:
+        return 'Invalid month'
+
+    if month < 1 or day > 28 and day > DAYS_PER_MONTHS[is_leap(year)][month]:
+        return 'Day is invalid for month'
+
+    if end == length:
+        return year, month, day, 0, 0, 0, 0, None, False, ambiguous_date
+
+    if ambiguous_date:
+        return 'Invalid date'
+
+    i = end + 1
+    if (length >= i + 8 and text[i + 2] == ':' and text[i + 5] == ':'
+            and text[i + 8:i + 9] in _TIME_ENDS
+            and not (text[i:i + 2] + text[i + 3:i + 5] + text[i + 6:i + 8]).strip(_DIGITS)):
+        # Fast path for the extended format (12:34:56)
+        hour = int(text[i:i + 2])
+        minute = int(text[i + 3:i + 5])
+        second = int(text[i + 6:i + 8])
+        end = i + 8
+    else:
+        # Time, up to the subsecond or the offset
+        end = length - len(text[i:].lstrip(_DIGITS + ':'))
+        if end < length and text[end] not in '.,Z+-':
+            return 'Invalid time'
+
+        part = text[i:end]
+        separators = part.count(':')
+        digits = part.replace(':', '')
+        hour = minute = second = 0
+        if len(digits) == 2 and not separators:
+            hour = int(digits)
+        elif len(digits) == 4 and separators <= 1:
+            hour, minute = divmod(int(digits), 100)
+        elif len(digits) == 6 and separators in (0, 2):
+            hour, minute = divmod(int(digits[:4]), 100)
+            second = int(digits[4:])
+        else:
+            return 'Invalid time'
+
+    if hour > 23:
+        return 'Invalid hour'
+
+    if minute > 59:
+        return 'Invalid minute'
+
+    if second > 59:
+        return 'Invalid second'
+
+    # Subsecond, truncated to the microsecond
+    microsecond = 0
+    if end < length and text[end] in '.,':
+        i = end + 1
+        end = length - len(text[i:].lstrip(_DIGITS))
+        if end < length and text[end] not in 'Z+-':
+            return 'Invalid subsecond'
+
+        if end > i:
+            microsecond = int(text[i:min(end, i + 6)].ljust(6, '0'))
+
+    # Timezone
+    offset = None
+    if end < length:
+        if text[end] == 'Z':
+            offset = 0
+        else:
+            part = text[end + 1:]
+            separators = part.count(':')
+            digits = part.replace(':', '')
+            if digits.strip(_DIGITS):
+                return 'Invalid timezone offset'
+
+            if len(digits) == 2 and not separators:
+                offset = int(digits) * 3600
+            elif len(digits) == 4 and separators <= 1:
+                offset = int(digits[:2]) * 3600 + int(digits[2:]) * 60
+            else:
+                return 'Invalid timezone offset'
+
+            if text[end] == '-':
+                offset = -offset
+
+    return year, month, day, hour, minute, second, microsecond, offset, True, False
+
+
+def _parse_iso8601_date(text, day_first):
+    """
+    Scans the date part of an ISO 8601 string,
+    in the basic or extended format
+    or as an ordinal or week date.
+
+    :return: The year, month, day, the end of the date part
+             and whether the date is ambiguous,
+             or the error message if the date is invalid
+    :rtype: tuple or str
+    """
+    length = len(text)
+
+    # Year
+    year = text[:4]
+    if len(year) < 4 or year.strip(_DIGITS):
+        return 'Invalid ISO8601 string'
+
+    year = int(year)
+    leap = is_leap(year)
+    month = 1
+    day = 1
+    monthday = 0
+    week = 0
+    ambiguous_date = False
+
+    # Optional separator
+    i = 4
+    separators = 0
+    if text[i:i + 1] == '-':
+        separators += 1
+        i += 1
+
+    # End of the date part
+    end = text.find('T', i)
+    space = text.find(' ', i)
+    if end < 0 or 0 <= space < end:
+        end = space
+
+    if end < 0:
+        end = length
+
+    if text[i:i + 1] == 'W':
+        # Week date
+        part = text[i + 1:end]
+        separators += part.count('-')
+        digits = part.replace('-', '')
+        if digits.strip(_DIGITS) or len(digits) not in (2, 3):
+            return 'Invalid week date'
+
+        week = int(digits)
+        weekday = 1
+        if len(digits) == 3:
+            # Week with weekday
+            if separators not in (0, 2):
+                return 'Invalid week date'
+
+            week, weekday = divmod(week, 10)
+
+        if week > 53:
+            return 'Invalid week number'
+
+        if weekday > 7:
+            return 'Invalid weekday number'
+
+        ordinal = week * 7 + weekday - (_week_day(year, 1, 4) + 3)
+
+        if ordinal < 1:
+            # Previous year
+            ordinal += _days_in_year(year - 1)
+            year -= 1
+            leap = is_leap(year)
+
+        if ordinal > _days_in_year(year):
+            # Next year
+            ordinal -= _days_in_year(year)
+            year += 1
+            leap = is_leap(year)
+
+        month, day = _month_and_day(ordinal, leap)
+    else:
+        # Two digits are a month, three an ordinal day
+        # and four a month and a day
+        part = text[i:end]
+        separators += part.count('-')
+        digits = part.replace('-', '')
+        if digits.strip(_DIGITS):
+            return 'Invalid date'
+
+        if digits:
+            monthday = int(digits)
+
+        if len(digits) == 2:
+            if not separators:
+                # The date looks like 201207
+                # which is invalid for a date
+                # But it might be a time in the form hhmmss
+                ambiguous_date = True
+
+            month = monthday
+        elif len(digits) == 3:
+            # Ordinal day
+            if separators > 1:
+                return 'Invalid date'
+
+            if monthday < 1 or monthday > MONTHS_OFFSETS[leap][13]:
+                return 'Invalid ordinal day for year'
+
+            month, day = _month_and_day(monthday, leap)
+        elif len(digits) == 4:
+            if day_first:
+                day, month = divmod(monthday, 100)
+            else:
+                month, day = divmod(monthday, 100)
+        elif digits:
+            return 'Invalid month and/or day'
+
+    if separators and not monthday and not week:
+        return 'Invalid date'
+
+    return year, month, day, end, ambiguous_date
+
+
+def _month_and_day(ordinal, leap):
+    offsets = MONTHS_OFFSETS[leap]
+    for month in range(1, 13):
+        if ordinal <= offsets[month + 1]:
+            return month, ordinal - offsets[month]
+
+    return 1, 1
+
+
+def _days_in_year(year):
+    if is_leap(year):
+        return DAYS_PER_L_YEAR
+
+    return DAYS_PER_N_YEAR
+
+
+def _week_day(year, month, day):
+    if month < 3:
+        year -= 1
+
+    return (
+        year + year // 4 - year // 100 + year // 400
+        + DAY_OF_WEEK_TABLE[month - 1] + day - 1
+    ) % 7 + 1
+
+
+def parse_iso8601_duration(text):
+    """
+    Parses an ISO 8601 duration like P1Y2M3DT4H5M6.5S or P2W.
+
+    Only the last component may have a fraction,
+    which is converted to microseconds.
+
+    :param text: The string to parse
+    :type text: str
+
+    :return: The years, months, weeks, days, hours,
+             minutes, seconds and microseconds
+    :rtype: tuple
+
+    :raises: ValueError
+    """
+    error = 'Invalid ISO 8601 duration'
+    sign = -1 if text[:1] == '-' else 1
+    i = 1 if text[:1] in ('-', '+') else 0
+    if text[i:i + 1] != 'P':
+        raise ValueError(error)
+
+    i += 1
+    units = [0] * 7
+    microseconds = 0
+    designators = _DURATION_DATE_UNITS
+    components = 0
+    last = -1
+    has_fraction = False
+    while i < len(text):
+        if text[i] == 'T':
+            if designators is _DURATION_TIME_UNITS:
+                raise ValueError(error)
+
+            designators = _DURATION_TIME_UNITS
+            components = 0
+            i += 1
+
+            continue
+
+        m = _DURATION_COMPONENT.match(text, i)
+        if has_fraction or not m:
+            raise ValueError(error)
+
+        value, fraction, designator = m.groups()
+        index = designators.get(designator, -1)
+        if index <= last:
+            raise ValueError(error)
+
+        if fraction is not None:
+            if index < 2:
+                raise ValueError(
+                    'Fractional years and months are not supported'
+                )
+
+            has_fraction = True
+            microseconds = sign * int(
+                float('0.' + fraction) * _DURATION_UNIT_USECS[index] + 0.5
+            )
+
+        units[index] = sign * int(value)
+        last = index
+        components += 1
+        i = m.end()
+
+    # At least one component, and one after the time designator
+    if not components:
+        raise ValueError(error)
+
+    return tuple(units) + (microseconds,)
+
+
+# Offset of the int64 columns without UTC offset designator
+_NO_OFFSET = -(1 << 63)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def format_iso8601(dt, offset, precision=-1, separator='T', basic=False):
+    """
+    Formats a datetime in the ISO 8601 format with a given offset.
+
+    :param dt: The datetime to format
+    :type dt: datetime
+
+    :param offset: The UTC offset, left out if it is None
+    :type offset: timedelta or int or None
+
+    :param precision: The number of digits of the fraction,
+                      -1 to write all of them unless they are 0
+    :type precision: int
+
+    :param separator: The separator of the date and time
+    :type separator: str
+
+    :param basic: Whether to use the basic format, without separators
+    :type basic: bool
+
+    :rtype: str
+    """
+    _check_format_options(precision, separator)
+    if not isinstance(dt, datetime):
+        raise TypeError('Expected a datetime')
+
+    return _format_iso8601(
+        dt.year, dt.month, dt.day,
+        dt.hour, dt.minute, dt.second, dt.microsecond,
+        _offset_seconds(offset), precision, separator, basic
+    )
+
+
+def format_iso8601_many(dts, precision=-1, separator='T', basic=False):
+    """
+    Formats a sequence of datetimes in the ISO 8601 format,
+    with the offsets returned by their utcoffset() method.
+
+    :rtype: list
+    """
+    _check_format_options(precision, separator)
+
+    strings = []
+    for dt in dts:
+        if not isinstance(dt, datetime):
+            raise TypeError('Expected a sequence of datetimes')
+
+        strings.append(_format_iso8601(
+            dt.year, dt.month, dt.day,
+            dt.hour, dt.minute, dt.second, dt.microsecond,
+            _offset_seconds(dt.utcoffset()), precision, separator, basic
+        ))
+
+    return strings
+
+
+def format_iso8601_column(values, offsets, precision=-1,
+                          separator='T', basic=False):
+    """
+    Formats wall clock microseconds elapsed since the epoch
+    in the ISO 8601 format.
+
+    :param values: The wall clock microseconds, as an int64 buffer
+                   or a sequence of integers
+    :type values: numpy.ndarray or array.array or list
+
+    :param offsets: The UTC offsets in seconds, left out
+                    if they are the minimum int64 value, or None
+    :type offsets: numpy.ndarray or array.array or list or None
+
+    :rtype: list
+    """
+    _check_format_options(precision, separator)
+    if offsets is None:
+        offsets = repeat(_NO_OFFSET)
+    elif len(offsets) < len(values):
+        raise ValueError('The offsets buffer is too small')
+
+    strings = []
+    for value, offset in zip(values, offsets):
+        offset = int(offset)
+        if offset == _NO_OFFSET:
+            offset = None
+        elif not -SECS_PER_DAY < offset < SECS_PER_DAY:
+            raise ValueError('Timestamp or offset out of range')
+
+        try:
+            dt = _EPOCH + timedelta(microseconds=int(value))
+        except OverflowError:
+            raise ValueError('Timestamp or offset out of range')
+
+        strings.append(_format_iso8601(
+            dt.year, dt.month, dt.day,
+            dt.hour, dt.minute, dt.second, dt.microsecond,
+            offset, precision, separator, basic
+        ))
+
+    return strings
+
+
+def _check_format_options(precision, separator):
+    if not -1 <= precision <= 6:
+        raise ValueError('Invalid precision')
+
+    if (not isinstance(separator, str) or len(separator) != 1
+            or ord(separator) > 127):
+        raise ValueError('The separator must be a single ASCII character')
+
+
+def _offset_seconds(offset):
+    if offset is None:
+        return
+
+    if isinstance(offset, timedelta):
+        if offset.microseconds:
+            raise ValueError('Offsets with microseconds are not supported')
+
+        offset = offset.days * SECS_PER_DAY + offset.seconds
+
+    if not -SECS_PER_DAY < offset < SECS_PER_DAY:
+        raise ValueError('Offset out of range')
+
+    return offset
+
+
+def _format_iso8601(year, month, day, hour, minute, second, microsecond,
+                    offset, precision, separator, basic):
+    if basic:
+        text = '%04d%02d%02d%s%02d%02d%02d' % (
+            year, month, day, separator, hour, minute, second
+        )
+    else:
+        text = '%04d-%02d-%02d%s%02d:%02d:%02d' % (
+            year, month, day, separator, hour, minute, second
+        )
+
+    if precision < 0 and microsecond:
+        precision = 6
+
+    if precision > 0:
+        text += '.' + ('%06d' % microsecond)[:precision]
+
+    if offset is not None:
+        sign = '-' if offset < 0 else '+'
+        minutes, seconds = divmod(abs(offset), SECS_PER_MIN)
+        hours, minutes = divmod(minutes, 60)
+        colon = '' if basic else ':'
+
+        text += '%s%02d%s%02d' % (sign, hours, colon, minutes)
+        if seconds:
+            text += '%s%02d' % (colon, seconds)
+
+    return text
+
+
+def parse_rfc2822(text):
+    """
+    Parses a RFC 2822, RFC 1123, RFC 850 or asctime string.
+
+    :param text: The string to parse
+    :type text: str
+
+    :return: The year, month, day, hour, minute, second
+             and UTC offset (or None)
+    :rtype: tuple
+
+    :raises: ValueError
+    """
+    parsed = _parse_rfc2822(text)
+    if not isinstance(parsed, tuple):
+        raise ValueError(parsed)
+
+    return parsed
+
+
+def try_parse_rfc2822(text):
+    """
+    Parses a RFC 2822, RFC 1123, RFC 850 or asctime string
+    without raising any exception if it is invalid.
+
+    :param text: The string to parse
+    :type text: str
+
+    :return: The year, month, day, hour, minute, second
+             and UTC offset (or None), or None if the string is invalid
+    :rtype: tuple or None
+    """
+    parsed = _parse_rfc2822(text)
+    if not isinstance(parsed, tuple):
+        return
+
+    return parsed
+
+
+def _parse_rfc2822(text):
+    """
+    Returns the parsed elements of a RFC 2822 string
+    or the error message if it is invalid.
+
+    :rtype: tuple or str
+    """
+    for regex in _RFC_FORMATS:
+        m = regex.match(text)
+        if m:
+            break
+    else:
+        return 'Invalid RFC 2822 string'
+
+    groups = m.groupdict()
+    month = _RFC_MONTHS.get(groups['month'].lower())
+    if month is None:
+        return 'Invalid RFC 2822 string'
+
+    offset = None
+    if groups.get('offset'):
+        value = int(groups['offset'])
+        if value % 100 > 59:
+            return 'Invalid RFC 2822 string'
+
+        offset = (value // 100) * SECS_PER_HOUR + (value % 100) * SECS_PER_MIN
+        if groups['sign'] == '-':
+            offset = -offset
+    elif groups.get('zone'):
+        offset = _RFC_ZONES.get(groups['zone'].lower())
+        if offset is None:
+            return 'Invalid RFC 2822 string'
+
+    year = int(groups['year'])
+    if len(groups['year']) == 2:
+        # Obsolete 2 and 3 digit years
+        year += 2000 if year < 50 else 1900
+    elif len(groups['year']) == 3:
+        year += 1900
+
+    day = int(groups['day'])
+    hour = int(groups['hour'])
+    minute = int(groups['minute'])
+    second = int(groups['second'] or 0)
+
+    if (year < 1 or day < 1 or day > DAYS_PER_MONTHS[int(is_leap(year))][month]
+            or hour > 23 or minute > 59 or second > 59):
+        return 'Invalid date'
+
+    return year, month, day, hour, minute, second, offset
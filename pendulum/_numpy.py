@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+"""
+Vectorized helpers working on NumPy int64 buffers
+of microseconds elapsed since the UNIX epoch.
+"""
+
+from .constants import EPOCH_ORDINAL, SECS_PER_DAY, USECS_PER_SEC
+from .tz.timezone import Timezone, FixedTimezone
+from .tz.exceptions import NonExistingTime, AmbiguousTime
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+# Integer value of NaT in any unit
+NAT = -2 ** 63
+
+
+def require_numpy():
+    if numpy is None:
+        raise ImportError('NumPy is required for this feature.')
+
+    return numpy
+
+
+def as_microseconds(values):
+    """
+    Returns an int64 view of the given datetime64 values
+    expressed in microseconds.
+
+    No copy is made if the values are already in microseconds.
+
+    :type values: numpy.ndarray or numpy.datetime64 or list
+
+    :rtype: numpy.ndarray
+    """
+    require_numpy()
+
+    values = numpy.asarray(values)
+    if values.dtype.kind != 'M':
+        raise TypeError(
+            'Expected datetime64 values, got {}'.format(values.dtype)
+        )
+
+    return values.astype('datetime64[us]', copy=False).view('int64')
+
+
+def tzinfo_indices(tz, unix_times):
+    """
+    Looks up the TimezoneInfo in effect for each UTC timestamp
+    using the transition table of the timezone.
+
+    :param tz: The timezone
+    :type tz: Timezone
+
+    :param unix_times: The UTC timestamps in seconds
+    :type unix_times: numpy.ndarray
+
+    :return: The candidate TimezoneInfo instances and,
+             for each timestamp, the index of its TimezoneInfo
+    :rtype: tuple
+    """
+    if isinstance(tz, FixedTimezone) or not tz._transitions:
+        tzinfos = [tz._get_unix_tzinfo(0)]
+
+        return tzinfos, numpy.zeros(len(unix_times), dtype='intp')
+
+    tzinfos = [tz._tzinfos[tr._tzinfo_index] for tr in tz._transitions]
+    transition_times = numpy.array(tz._unix_transition_times, dtype='int64')
+    indices = numpy.searchsorted(transition_times, unix_times, side='right') - 1
+
+    return tzinfos, numpy.maximum(indices, 0)
+
+
+def offsets(tzinfos, indices):
+    """
+    Returns the UTC offsets, in seconds, matching
+    the given TimezoneInfo indices.
+
+    :rtype: numpy.ndarray
+    """
+    table = []
+    for tzinfo in tzinfos:
+        offset = tzinfo.adjusted_offset
+        table.append(offset.days * SECS_PER_DAY + offset.seconds)
+
+    return numpy.array(table, dtype='int64')[indices]
+
+
+def unix_offsets(tz, unix_times):
+    """
+    Returns the UTC offsets, in seconds, in effect
+    at the given UTC timestamps.
+
+    :rtype: numpy.ndarray
+    """
+    return offsets(*tzinfo_indices(tz, unix_times))
+
+
+def unix_from_local(local_times, tz, rule=Timezone.POST_TRANSITION):
+    """
+    Converts wall clock times, in seconds, to UTC timestamps.
+
+    Skipped and repeated times are resolved with the given transition rule,
+    like Timezone.convert() does.
+
+    :param local_times: Seconds elapsed since 1970-01-01T00:00:00 (wall clock)
+    :type local_times: numpy.ndarray
+
+    :param tz: The timezone
+    :type tz: Timezone
+
+    :param rule: The transition rule
+    :type rule: str
+
+    :rtype: numpy.ndarray
+    """
+    if isinstance(tz, FixedTimezone) or not tz._transitions:
+        return local_times - unix_offsets(tz, numpy.zeros(1, dtype='int64'))[0]
+
+    offset_before = unix_offsets(tz, local_times - SECS_PER_DAY)
+    offset_after = unix_offsets(tz, local_times + SECS_PER_DAY)
+    before = local_times - offset_before
+    after = local_times - offset_after
+    valid_before = unix_offsets(tz, before) == offset_before
+    valid_after = unix_offsets(tz, after) == offset_after
+
+    if rule == Timezone.POST_TRANSITION:
+        return numpy.where(valid_after, after, before)
+
+    if rule == Timezone.PRE_TRANSITION:
+        return numpy.where(valid_before, before, after)
+
+    skipped = ~(valid_before | valid_after)
+    if skipped.any():
+        raise NonExistingTime(_local_datetime(local_times[skipped][0]))
+
+    repeated = valid_before & valid_after & (offset_before != offset_after)
+    if repeated.any():
+        raise AmbiguousTime(_local_datetime(local_times[repeated][0]))
+
+    return before
+
+
+def _local_datetime(local_time):
+    return (
+        numpy.datetime64(int(local_time), 's')
+        .astype('datetime64[us]').tolist()
+    )
+
+
+def days_from_civil(year, month, day):
+    """
+    Converts proleptic Gregorian years, months and days
+    to days elapsed since 1970-01-01.
+
+    :rtype: numpy.ndarray
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+
+    return era * 146097 + doe - 719468
+
+
+def days_in_month(year, month):
+    """
+    Returns the number of days of the given months.
+
+    :rtype: numpy.ndarray
+    """
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+    return _DAYS_PER_MONTH[month] + (leap & (month == 2))
+
+
+_DAYS_PER_MONTH = None if numpy is None else numpy.array(
+    [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype='int64'
+)
+
+
+def civil_from_days(days):
+    """
+    Converts days elapsed since 1970-01-01
+    to proleptic Gregorian years, months and days.
+
+    :type days: numpy.ndarray
+
+    :rtype: tuple
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = numpy.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+
+    return year, month, day
+
+
+def local_fields(microseconds, tz):
+    """
+    Breaks down UTC microseconds into local date and time fields.
+
+    :param microseconds: Microseconds elapsed since the UNIX epoch
+    :type microseconds: numpy.ndarray
+
+    :param tz: The timezone
+    :type tz: Timezone
+
+    :return: The year, month, day, hour, minute, second
+             and microsecond arrays, the TimezoneInfo candidates
+             and the TimezoneInfo index of each value
+    :rtype: tuple
+    """
+    unix_times, microsecond = numpy.divmod(microseconds, USECS_PER_SEC)
+    tzinfos, indices = tzinfo_indices(tz, unix_times)
+    local = unix_times + offsets(tzinfos, indices)
+
+    days, seconds = numpy.divmod(local, SECS_PER_DAY)
+    year, month, day = civil_from_days(days)
+    hour, seconds = numpy.divmod(seconds, 3600)
+    minute, second = numpy.divmod(seconds, 60)
+
+    return (
+        (year, month, day, hour, minute, second, microsecond),
+        tzinfos, indices
+    )
+
+
+def datetime_to_microseconds(dt):
+    """
+    Returns the microseconds elapsed since the UNIX epoch
+    for a datetime. Naive datetimes are considered to be in UTC.
+
+    :type dt: datetime.datetime
+
+    :rtype: int
+    """
+    seconds = (
+        (dt.toordinal() - EPOCH_ORDINAL) * SECS_PER_DAY
+        + dt.hour * 3600 + dt.minute * 60 + dt.second
+    )
+
+    offset = dt.utcoffset()
+    if offset is not None:
+        seconds -= offset.days * SECS_PER_DAY + offset.seconds
+
+    return seconds * USECS_PER_SEC + dt.microsecond
+
+
+def to_datetime64(datetimes):
+    """
+    Converts a sequence of datetimes to a NumPy datetime64[us] array
+    of UTC times. Naive datetimes are considered to be in UTC
+    and None values become NaT.
+
+    :param datetimes: The datetimes
+    :type datetimes: iterable
+
+    :rtype: numpy.ndarray
+    """
+    require_numpy()
+
+    if not hasattr(datetimes, '__len__'):
+        datetimes = list(datetimes)
+
+    values = numpy.fromiter(
+        (NAT if dt is None else datetime_to_microseconds(dt)
+         for dt in datetimes),
+        dtype='int64', count=len(datetimes)
+    )
+
+    return values.view('datetime64[us]')
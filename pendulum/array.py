@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import division
+
+import datetime
+
+from .pendulum import Pendulum
+from .tz import UTC
+from .constants import (
+    YEARS_PER_CENTURY, YEARS_PER_DECADE,
+    MONTHS_PER_YEAR, SECS_PER_DAY, USECS_PER_SEC
+)
+from .helpers import format_iso8601_column
+from . import _numpy
+from ._numpy import numpy
+
+
+class PendulumArray(object):
+    """
+    A sequence of datetimes sharing the same timezone.
+
+    The datetimes are stored as an int64 buffer of microseconds
+    elapsed since the UNIX epoch, so that fields and operations
+    are computed on the whole array at once.
+
+    Pendulum instances are only created when the array is indexed.
+    """
+
+    def __init__(self, values, tz=UTC):
+        """
+        Constructor.
+
+        :param values: NumPy datetime64 values, considered to be in UTC,
+                       or a sequence of datetimes
+        :type values: numpy.ndarray or iterable
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+        """
+        _numpy.require_numpy()
+
+        if getattr(values, 'dtype', None) is None or values.dtype.kind != 'M':
+            values = _numpy.to_datetime64(values)
+
+        values = _numpy.as_microseconds(values).ravel()
+        if (values == _numpy.NAT).any():
+            raise ValueError('PendulumArray does not support NaT values.')
+
+        self._values = values
+        self._tz = Pendulum._safe_create_datetime_zone(tz)
+        self._fields = None
+
+    @classmethod
+    def _create(cls, values, tz):
+        array = cls.__new__(cls)
+        array._values = values
+        array._tz = tz
+        array._fields = None
+
+        return array
+
+    @property
+    def timezone(self):
+        return self._tz
+
+    @property
+    def tz(self):
+        return self._tz
+
+    @property
+    def timezone_name(self):
+        return self._tz.name
+
+    @property
+    def year(self):
+        return self._get_fields()[0][0]
+
+    @property
+    def month(self):
+        return self._get_fields()[0][1]
+
+    @property
+    def day(self):
+        return self._get_fields()[0][2]
+
+    @property
+    def hour(self):
+        return self._get_fields()[0][3]
+
+    @property
+    def minute(self):
+        return self._get_fields()[0][4]
+
+    @property
+    def second(self):
+        return self._get_fields()[0][5]
+
+    @property
+    def microsecond(self):
+        return self._get_fields()[0][6]
+
+    @property
+    def offset(self):
+        _, tzinfos, indices = self._get_fields()
+
+        return numpy.array([t.offset for t in tzinfos], dtype='int64')[indices]
+
+    @property
+    def int_timestamp(self):
+        return self._values // USECS_PER_SEC
+
+    @property
+    def day_of_week(self):
+        """
+        Returns the days of the week (0-6).
+
+        :rtype: numpy.ndarray
+        """
+        return (self._local_days() + 4) % 7
+
+    @property
+    def day_of_year(self):
+        """
+        Returns the days of the year (1-366).
+
+        :rtype: numpy.ndarray
+        """
+        year = self.year
+
+        return (
+            self._local_days()
+            - _numpy.days_from_civil(year, numpy.ones_like(year), numpy.ones_like(year))
+            + 1
+        )
+
+    @property
+    def week_of_year(self):
+        """
+        Returns the ISO weeks of the year (1-53).
+
+        :rtype: numpy.ndarray
+        """
+        days = self._local_days()
+
+        # The ISO year is the year of the Thursday of the same week
+        thursday = days - (days + 3) % 7 + 3
+        year = _numpy.civil_from_days(thursday)[0]
+        first = _numpy.days_from_civil(
+            year, numpy.ones_like(year), numpy.ones_like(year)
+        )
+
+        return (thursday - first) // 7 + 1
+
+    @property
+    def quarter(self):
+        return (self.month - 1) // 3 + 1
+
+    def to_datetime64(self):
+        """
+        Returns the UTC times as a NumPy datetime64[us] array
+        sharing the same buffer.
+
+        :rtype: numpy.ndarray
+        """
+        return self._values.view('datetime64[us]')
+
+    def in_timezone(self, tz):
+        """
+        Set the timezone of the array.
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :rtype: PendulumArray
+        """
+        return self._create(self._values, Pendulum._safe_create_datetime_zone(tz))
+
+    def in_tz(self, tz):
+        """
+        Set the timezone of the array.
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :rtype: PendulumArray
+        """
+        return self.in_timezone(tz)
+
+    def add(self, years=0, months=0, weeks=0, days=0,
+            hours=0, minutes=0, seconds=0, microseconds=0):
+        """
+        Add duration to the array, like Pendulum.add() does.
+
+        :param years: The number of years
+        :type years: int
+
+        :param months: The number of months
+        :type months: int
+
+        :param weeks: The number of weeks
+        :type weeks: int
+
+        :param days: The number of days
+        :type days: int
+
+        :param hours: The number of hours
+        :type hours: int
+
+        :param minutes: The number of minutes
+        :type minutes: int
+
+        :param seconds: The number of seconds
+        :type seconds: int
+
+        :param microseconds: The number of microseconds
+        :type microseconds: int
+
+        :rtype: PendulumArray
+        """
+        delta = (
+            ((hours * 60 + minutes) * 60 + seconds) * USECS_PER_SEC
+            + microseconds
+        )
+
+        if not any([years, months, weeks, days]):
+            return self._create(self._values + int(delta), self._tz)
+
+        # Years, months and days apply to the wall clock time
+        # and the transition (if any) is applied afterwards.
+        (year, month, day, hour, minute, second, microsecond), _, _ = self._get_fields()
+        month_index = year * MONTHS_PER_YEAR + month - 1 + years * MONTHS_PER_YEAR + months
+        year, month = numpy.divmod(month_index, MONTHS_PER_YEAR)
+        month += 1
+        day = numpy.minimum(day, _numpy.days_in_month(year, month))
+
+        local = (
+            (_numpy.days_from_civil(year, month, day) + weeks * 7 + days) * SECS_PER_DAY
+            + hour * 3600 + minute * 60 + second
+        )
+
+        return self._from_local(local, microsecond + int(delta))
+
+    def subtract(self, years=0, months=0, weeks=0, days=0,
+                 hours=0, minutes=0, seconds=0, microseconds=0):
+        """
+        Remove duration from the array.
+
+        :param years: The number of years
+        :type years: int
+
+        :param months: The number of months
+        :type months: int
+
+        :param weeks: The number of weeks
+        :type weeks: int
+
+        :param days: The number of days
+        :type days: int
+
+        :param hours: The number of hours
+        :type hours: int
+
+        :param minutes: The number of minutes
+        :type minutes: int
+
+        :param seconds: The number of seconds
+        :type seconds: int
+
+        :param microseconds: The number of microseconds
+        :type microseconds: int
+
+        :rtype: PendulumArray
+        """
+        return self.add(
+            years=-years, months=-months, weeks=-weeks, days=-days,
+            hours=-hours, minutes=-minutes, seconds=-seconds,
+            microseconds=-microseconds
+        )
+
+    def start_of(self, unit):
+        """
+        Returns a copy of the array with the time reset,
+        following the rules of Pendulum.start_of().
+
+        :param unit: The unit to reset to
+        :type unit: str
+
+        :rtype: PendulumArray
+        """
+        if unit not in Pendulum._MODIFIERS_VALID_UNITS:
+            raise ValueError('Invalid unit "{}" for start_of()'.format(unit))
+
+        return self._reset(unit, False)
+
+    def end_of(self, unit):
+        """
+        Returns a copy of the array with the time reset,
+        following the rules of Pendulum.end_of().
+
+        :param unit: The unit to reset to
+        :type unit: str
+
+        :rtype: PendulumArray
+        """
+        if unit not in Pendulum._MODIFIERS_VALID_UNITS:
+            raise ValueError('Invalid unit "%s" for end_of()' % unit)
+
+        return self._reset(unit, True)
+
+    def format(self, fmt, locale=None, formatter=None):
+        """
+        Formats the datetimes using the given format.
+
+        :param fmt: The format to use
+        :type fmt: str
+
+        :param locale: The locale to use
+        :type locale: str or None
+
+        :param formatter: The formatter to use
+        :type formatter: str or None
+
+        :rtype: list
+        """
+        return [dt.format(fmt, locale, formatter) for dt in self]
+
+    def isoformat(self, sep='T'):
+        """
+        Formats the datetimes in the ISO 8601 format,
+        like Pendulum.isoformat() does.
+
+        :param sep: The separator of the date and time
+        :type sep: str
+
+        :rtype: list
+        """
+        _, tzinfos, indices = self._get_fields()
+        offsets = _numpy.offsets(tzinfos, indices)
+
+        return format_iso8601_column(
+            self._values + offsets * USECS_PER_SEC, offsets, -1, sep
+        )
+
+    def _reset(self, unit, end):
+        (year, month, day, hour, minute, second, _), _, _ = self._get_fields()
+        days = self._local_days()
+        ones = numpy.ones_like(year)
+
+        if unit in ['second', 'minute', 'hour']:
+            if unit != 'second':
+                second = ones * (59 if end else 0)
+
+            if unit == 'hour':
+                minute = ones * (59 if end else 0)
+        else:
+            if unit == 'week':
+                day_of_week = (days + 4) % 7
+                if end:
+                    days = days + (Pendulum._week_ends_at - day_of_week) % 7
+                else:
+                    days = days - (day_of_week - Pendulum._week_starts_at) % 7
+            elif unit != 'day':
+                if unit == 'decade':
+                    year = year - year % YEARS_PER_DECADE
+                    if end:
+                        year = year + YEARS_PER_DECADE - 1
+                elif unit == 'century':
+                    year = year - 1 - (year - 1) % YEARS_PER_CENTURY + 1
+                    if end:
+                        year = year + YEARS_PER_CENTURY - 1
+
+                if unit != 'month':
+                    month = ones * (12 if end else 1)
+
+                days = _numpy.days_from_civil(
+                    year, month,
+                    _numpy.days_in_month(year, month) if end else ones
+                )
+
+            hour = minute = second = ones * (59 if end else 0)
+            if end:
+                hour = ones * 23
+
+        local = days * SECS_PER_DAY + hour * 3600 + minute * 60 + second
+
+        return self._from_local(
+            local, ones * (999999 if end else 0), Pendulum._TRANSITION_RULE
+        )
+
+    def _from_local(self, local, microseconds, rule=None):
+        """
+        Creates an array from wall clock seconds and microseconds.
+        """
+        if rule is None:
+            rule = self._tz.POST_TRANSITION
+
+        seconds, microseconds = numpy.divmod(microseconds, USECS_PER_SEC)
+        unix_times = _numpy.unix_from_local(local + seconds, self._tz, rule)
+
+        return self._create(unix_times * USECS_PER_SEC + microseconds, self._tz)
+
+    def _get_fields(self):
+        if self._fields is None:
+            self._fields = _numpy.local_fields(self._values, self._tz)
+
+        return self._fields
+
+    def _local_days(self):
+        (year, month, day, _, _, _, _), _, _ = self._get_fields()
+
+        return _numpy.days_from_civil(year, month, day)
+
+    def _get_microseconds(self, other):
+        if isinstance(other, PendulumArray):
+            return other._values
+
+        if isinstance(other, datetime.datetime):
+            return _numpy.datetime_to_microseconds(other)
+
+        return _numpy.as_microseconds(other)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        fields, tzinfos, indices = self._get_fields()
+        tzinfos = [tzinfos[i] for i in indices.tolist()]
+
+        for f, tzinfo in zip(zip(*[f.tolist() for f in fields]), tzinfos):
+            yield Pendulum(*f, tzinfo=tzinfo)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, numpy.integer)):
+            seconds, microsecond = divmod(int(self._values[item]), USECS_PER_SEC)
+
+            return Pendulum._create_from_unix_time(seconds, microsecond, self._tz)
+
+        return self._create(self._values[item], self._tz)
+
+    def __eq__(self, other):
+        return self._values == self._get_microseconds(other)
+
+    def __ne__(self, other):
+        return self._values != self._get_microseconds(other)
+
+    def __lt__(self, other):
+        return self._values < self._get_microseconds(other)
+
+    def __le__(self, other):
+        return self._values <= self._get_microseconds(other)
+
+    def __gt__(self, other):
+        return self._values > self._get_microseconds(other)
+
+    def __ge__(self, other):
+        return self._values >= self._get_microseconds(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        items = [str(dt) for dt in self[:3]]
+        if len(self) > 3:
+            items.append('...')
+
+        return '<PendulumArray [{}]>'.format(', '.join(items))
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import time
+
+from .pendulum import Pendulum
+from .helpers import local_time
+from .tz import UTC
+from .constants import SECONDS_PER_DAY
+
+try:
+    from time import time_ns
+except ImportError:
+    time_ns = None
+
+
+class Clock(object):
+    """
+    Clock bound to a timezone.
+
+    The timezone is resolved once and its UTC offset
+    is kept until the next transition, so that getting
+    the current time does not need any normalization.
+
+    With a coarser resolution, the same instance
+    and its formatted strings are reused while
+    the current time stays within the same tick.
+    """
+
+    RESOLUTIONS = {
+        'us': 1,
+        'ms': 1000,
+        's': 1000000
+    }
+
+    def __init__(self, tz=UTC, resolution='us'):
+        """
+        Constructor.
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :param resolution: The resolution of the clock ("s", "ms" or "us")
+        :type resolution: str
+        """
+        if resolution not in self.RESOLUTIONS:
+            raise ValueError('Invalid resolution "{}"'.format(resolution))
+
+        self._tz = Pendulum._safe_create_datetime_zone(tz)
+        self._resolution = resolution
+        self._step = self.RESOLUTIONS[resolution]
+
+        # Both are replaced as a whole so that concurrent callers
+        # never see a mix of old and new values:
+        # the timezone info, the offset and the period they apply to
+        self._transition = (None, 0, 0, 0)
+        # and the current tick, its instance and its formatted strings
+        self._state = (None, None, {})
+
+    @property
+    def timezone(self):
+        return self._tz
+
+    @property
+    def tz(self):
+        return self._tz
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def now(self):
+        """
+        Get a Pendulum instance for the current date and time.
+
+        :rtype: Pendulum
+        """
+        if Pendulum.has_test_now():
+            return Pendulum.now(self._tz)
+
+        unix_time, microsecond = self._time()
+        microsecond -= microsecond % self._step
+        tick = (unix_time, microsecond)
+        state = self._state
+        if tick == state[0]:
+            return state[1]
+
+        tzinfo, offset, since, until = self._transition
+        if not since <= unix_time < until:
+            tzinfo, offset, since, until = self._update(unix_time)
+
+        now = Pendulum(
+            *local_time(unix_time, offset, microsecond),
+            tzinfo=tzinfo
+        )
+        self._state = (tick, now, {})
+
+        return now
+
+    def format(self, fmt, locale=None, formatter=None):
+        """
+        Formats the current time using the given format.
+
+        The result is cached until the next tick.
+
+        :param fmt: The format to use
+        :type fmt: str
+
+        :param locale: The locale to use
+        :type locale: str or None
+
+        :param formatter: The formatter to use
+        :type formatter: str or None
+
+        :rtype: str
+        """
+        now = self.now()
+        _, current, strings = self._state
+        if now is not current:
+            return now.format(fmt, locale, formatter)
+
+        key = (
+            fmt,
+            locale or Pendulum.get_locale(),
+            formatter or Pendulum.get_formatter()
+        )
+
+        try:
+            return strings[key]
+        except KeyError:
+            string = now.format(fmt, locale, formatter)
+            strings[key] = string
+
+            return string
+
+    def _time(self):
+        """
+        Returns the current UTC time
+        as a (seconds, microseconds) tuple.
+
+        :rtype: tuple
+        """
+        if time_ns is not None:
+            seconds, nanoseconds = divmod(time_ns(), 1000000000)
+
+            return seconds, nanoseconds // 1000
+
+        return Pendulum._split_timestamp(time.time(), 's')
+
+    def _update(self, unix_time):
+        """
+        Caches the offset in effect at the given time
+        until the next transition.
+
+        :type unix_time: int
+
+        :rtype: tuple
+        """
+        tzinfo = self._tz._get_unix_tzinfo(unix_time)
+        offset = tzinfo.adjusted_offset
+        until = self._tz._get_next_unix_transition(unix_time)
+
+        self._transition = (
+            tzinfo,
+            offset.days * SECONDS_PER_DAY + offset.seconds,
+            unix_time,
+            until if until is not None else float('inf')
+        )
+
+        return self._transition
+
+    def __repr__(self):
+        return '<Clock [{}, {}]>'.format(self._tz.name, self._resolution)
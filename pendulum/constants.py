@@ -39,6 +39,9 @@ W3C = '%Y-%m-%dT%H:%M:%S%_z'
 
 EPOCH_YEAR = 1970
 
+# Proleptic Gregorian ordinal of 1970-01-01
+EPOCH_ORDINAL = 719163
+
 DAYS_PER_N_YEAR = 365
 DAYS_PER_L_YEAR = 366
 
@@ -48,6 +51,10 @@ SECS_PER_MIN = 60
 SECS_PER_HOUR = 60 * SECS_PER_MIN
 SECS_PER_DAY = SECS_PER_HOUR * 24
 
+USECS_PER_MIN = SECS_PER_MIN * USECS_PER_SEC
+USECS_PER_HOUR = SECS_PER_HOUR * USECS_PER_SEC
+USECS_PER_DAY = SECS_PER_DAY * USECS_PER_SEC
+
 # 400-year chunks always have 146097 days (20871 weeks).
 SECS_PER_400_YEARS = 146097 * SECS_PER_DAY
 
@@ -12,10 +12,16 @@ from .formatting.difference_formatter import DifferenceFormatter
 from .mixins.default import TranslatableMixin, FormattableMixing, TestableMixin
 from .constants import (
     DAYS_PER_WEEK, YEARS_PER_DECADE, YEARS_PER_CENTURY,
-    MONTHS_PER_YEAR,
+    MONTHS_PER_YEAR, DAYS_PER_MONTHS, EPOCH_ORDINAL,
     MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY
 )
 from .exceptions import PendulumException
+from .helpers import (
+    is_leap, date_ordinal, days_in_month,
+    days_from_civil, civil_from_days, add_months,
+    next_day_of_week, previous_day_of_week,
+    nth_day_of_week, last_day_of_week
+)
 
 
 class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
@@ -47,6 +53,59 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
     _diff_formatter = None
 
+    # Interned instances by ordinal (None if interning is disabled)
+    _interned = None
+
+    _interning_max_size = 0
+
+    @classmethod
+    def enable_interning(cls, max_size=4096):
+        """
+        Enable the interning of Date instances, so that
+        equal dates share the same instance.
+
+        Only Date itself supports interning, not its subclasses.
+
+        :param max_size: The maximum number of interned instances
+        :type max_size: int
+        """
+        _check_interning_class(cls)
+
+        if max_size < 1:
+            raise ValueError('Invalid interning size: {}'.format(max_size))
+
+        Date._interned = {}
+        Date._interning_max_size = max_size
+
+        # The constructor is only overridden while interning is enabled
+        # to keep the native one otherwise.
+        Date.__new__ = staticmethod(_new_interned)
+
+    @classmethod
+    def disable_interning(cls):
+        """
+        Disable the interning of Date instances.
+        """
+        _check_interning_class(cls)
+
+        Date._interned = None
+        Date._interning_max_size = 0
+
+        if _native_new is not None:
+            Date.__new__ = _native_new
+        elif '__new__' in Date.__dict__:
+            # Falls back to the constructor inherited from date
+            del Date.__new__
+
+    @classmethod
+    def is_interning(cls):
+        """
+        Returns whether Date instances are interned.
+
+        :rtype: bool
+        """
+        return cls._interned is not None
+
     @classmethod
     def instance(cls, dt):
         """
@@ -154,7 +213,7 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
     @property
     def days_in_month(self):
-        return calendar.monthrange(self.year, self.month)[1]
+        return days_in_month(self.year, self.month)
 
     @property
     def week_of_month(self):
@@ -537,6 +596,20 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         :rtype: Date
         """
+        delta = weeks * DAYS_PER_WEEK + days
+        if int(delta) == delta and int(years) == years and int(months) == months:
+            if not years and not months:
+                return self._from_ordinal(self.toordinal() + int(delta))
+
+            year, month, day = add_months(
+                self.year, self.month, self.day,
+                int(years) * MONTHS_PER_YEAR + int(months)
+            )
+
+            return self._from_ordinal(
+                days_from_civil(year, month, day) + EPOCH_ORDINAL + int(delta)
+            )
+
         delta = relativedelta(
             years=years,
             months=months,
@@ -564,6 +637,10 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         :rtype: Date
         """
+        delta = weeks * DAYS_PER_WEEK + days
+        if int(delta) == delta and int(years) == years and int(months) == months:
+            return self.add(years=-years, months=-months, days=-delta)
+
         delta = relativedelta(
             years=years,
             months=months,
@@ -573,6 +650,34 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         return self.instance(date(self.year, self.month, self.day) - delta)
 
+    def _from_ordinal(self, ordinal):
+        """
+        Returns the date of the given ordinal,
+        reusing the interned instance if any.
+
+        :type ordinal: int
+
+        :rtype: Date
+        """
+        if not 1 <= ordinal <= _MAX_ORDINAL:
+            raise OverflowError('date value out of range')
+
+        cls = self.__class__
+        if cls._interned is not None:
+            d = cls._interned.get(ordinal)
+            if d is not None and d.__class__ is cls:
+                return d
+
+        return cls.instance(date.fromordinal(ordinal))
+
+    def _epoch_days(self):
+        """
+        Returns the number of days elapsed since 1970-01-01.
+
+        :rtype: int
+        """
+        return self.toordinal() - EPOCH_ORDINAL
+
     def add_timedelta(self, delta):
         """
         Add timedelta duration to the instance.
@@ -851,11 +956,9 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
         if day_of_week < SUNDAY or day_of_week > SATURDAY:
             raise ValueError('Invalid day of week')
 
-        dt = self.add(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.add(days=1)
+        days = self._epoch_days()
 
-        return dt
+        return self.add(days=next_day_of_week(days, day_of_week) - days)
 
     def previous(self, day_of_week=None):
         """
@@ -875,11 +978,9 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
         if day_of_week < SUNDAY or day_of_week > SATURDAY:
             raise ValueError('Invalid day of week')
 
-        dt = self.subtract(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.subtract(days=1)
+        days = self._epoch_days()
 
-        return dt
+        return self.add(days=previous_day_of_week(days, day_of_week) - days)
 
     def first_of(self, unit, day_of_week=None):
         """
@@ -963,21 +1064,9 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         :rtype: Date
         """
-        dt = self
-
-        if day_of_week is None:
-            return dt.day_(1)
-
-        month = calendar.monthcalendar(dt.year, dt.month)
+        first = days_from_civil(self.year, self.month, 1)
 
-        calendar_day = (day_of_week - 1) % 7
-
-        if month[0][calendar_day] > 0:
-            day_of_month = month[0][calendar_day]
-        else:
-            day_of_month = month[1][calendar_day]
-
-        return dt.day_(day_of_month)
+        return self.day_(nth_day_of_week(first, first + 6, 1, day_of_week) - first + 1)
 
     def _last_of_month(self, day_of_week=None):
         """
@@ -990,21 +1079,9 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         :rtype: Date
         """
-        dt = self
-
-        if day_of_week is None:
-            return dt.day_(self.days_in_month)
+        last = days_from_civil(self.year, self.month, self.days_in_month)
 
-        month = calendar.monthcalendar(dt.year, dt.month)
-
-        calendar_day = (day_of_week - 1) % 7
-
-        if month[-1][calendar_day] > 0:
-            day_of_month = month[-1][calendar_day]
-        else:
-            day_of_month = month[-2][calendar_day]
-
-        return dt.day_(day_of_month)
+        return self.day_(self.days_in_month - last + last_day_of_week(last, day_of_week))
 
     def _nth_of_month(self, nth, day_of_week):
         """
@@ -1020,18 +1097,15 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         :rtype: Date
         """
-        if nth == 1:
-            return self.first_of('month', day_of_week)
-
-        dt = self.first_of('month')
-        check = dt.format('%Y-%m')
-        for i in range(nth - (1 if dt.day_of_week == day_of_week else 0)):
-            dt = dt.next(day_of_week)
+        first = days_from_civil(self.year, self.month, 1)
+        days = nth_day_of_week(
+            first, first + self.days_in_month - 1, nth, day_of_week
+        )
 
-        if dt.format('%Y-%m') == check:
-            return self.day_(dt.day)
+        if days is None:
+            return False
 
-        return False
+        return self.day_(days - first + 1)
 
     def _first_of_quarter(self, day_of_week=None):
         """
@@ -1073,20 +1147,17 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         :rtype: Date
         """
-        if nth == 1:
-            return self.first_of('quarter', day_of_week)
-
-        dt = self.replace(self.year, self.quarter * 3, 1)
-        last_month = dt.month
-        year = dt.year
-        dt = dt.first_of('quarter')
-        for i in range(nth - (1 if dt.day_of_week == day_of_week else 0)):
-            dt = dt.next(day_of_week)
+        last_month = self.quarter * 3
+        days = nth_day_of_week(
+            days_from_civil(self.year, last_month - 2, 1),
+            days_from_civil(self.year, last_month, days_in_month(self.year, last_month)),
+            nth, day_of_week
+        )
 
-        if last_month < dt.month or year != dt.year:
+        if days is None:
             return False
 
-        return self.replace(self.year, dt.month, dt.day)
+        return self.replace(*civil_from_days(days))
 
     def _first_of_year(self, day_of_week=None):
         """
@@ -1128,18 +1199,16 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
 
         :rtype: Date
         """
-        if nth == 1:
-            return self.first_of('year', day_of_week)
-
-        dt = self.first_of('year')
-        year = dt.year
-        for i in range(nth - (1 if dt.day_of_week == day_of_week else 0)):
-            dt = dt.next(day_of_week)
+        days = nth_day_of_week(
+            days_from_civil(self.year, 1, 1),
+            days_from_civil(self.year, 12, 31),
+            nth, day_of_week
+        )
 
-        if year != dt.year:
+        if days is None:
             return False
 
-        return self.replace(self.year, dt.month, dt.day)
+        return self.replace(*civil_from_days(days))
 
     def average(self, dt=None):
         """
@@ -1228,3 +1297,46 @@ class Date(TranslatableMixin, FormattableMixing, TestableMixin, date):
         day = day if day is not None else self.day
 
         return self.__class__(year, month, day)
+
+
+_MAX_ORDINAL = date.max.toordinal()
+
+# The constructor of Date outside of interning
+# (None when inherited from date)
+_native_new = Date.__dict__.get('__new__')
+
+
+def _check_interning_class(cls):
+    if cls is not Date:
+        raise TypeError(
+            'Interning is not supported by {}'.format(cls.__name__)
+        )
+
+
+def _new_interned(cls, *args, **kwargs):
+    """
+    Constructor of Date instances returning interned instances.
+    """
+    interned = cls._interned
+    if interned is None or kwargs or len(args) != 3:
+        return super(Date, cls).__new__(cls, *args, **kwargs)
+
+    year, month, day = args
+    if (not 1 <= year <= 9999
+            or not 1 <= month <= 12
+            or not 1 <= day <= DAYS_PER_MONTHS[int(is_leap(year))][month]):
+        # Let the native constructor raise the error
+        return super(Date, cls).__new__(cls, year, month, day)
+
+    ordinal = date_ordinal(year, month, day)
+    d = interned.get(ordinal)
+    if d is not None and d.__class__ is cls:
+        return d
+
+    d = super(Date, cls).__new__(cls, year, month, day)
+    if len(interned) >= cls._interning_max_size:
+        interned.clear()
+
+    interned[ordinal] = d
+
+    return d
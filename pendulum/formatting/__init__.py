@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import pendulum
+
 from .formatter import Formatter
 from .classic_formatter import ClassicFormatter
 from .alternative_formatter import AlternativeFormatter
+from .compiled_format import CompiledFormat
 
 
 FORMATTERS = {
@@ -10,6 +13,10 @@ FORMATTERS = {
     'alternative': AlternativeFormatter(),
 }
 
+_COMPILED_FORMATS = {}
+
+_COMPILED_FORMATS_MAX_SIZE = 512
+
 
 def register_formatter(name, formatter):
     """
@@ -33,3 +40,43 @@ def register_formatter(name, formatter):
         )
 
     FORMATTERS[name] = formatter
+
+
+def compile_format(fmt, formatter='classic', locale=None):
+    """
+    Compiles a format once so that it can be used
+    to parse and format strings.
+
+    Compiled formats are cached.
+
+    :param fmt: The format
+    :type fmt: str
+
+    :param formatter: The formatter the format is written for
+    :type formatter: str
+
+    :param locale: The locale of the localized tokens
+    :type locale: str or None
+
+    :rtype: CompiledFormat
+    """
+    if formatter not in FORMATTERS:
+        raise ValueError('Invalid formatter [{}]'.format(formatter))
+
+    if not locale:
+        locale = pendulum.Pendulum.get_locale()
+
+    key = (fmt, formatter, locale)
+
+    try:
+        return _COMPILED_FORMATS[key]
+    except KeyError:
+        pass
+
+    if len(_COMPILED_FORMATS) >= _COMPILED_FORMATS_MAX_SIZE:
+        _COMPILED_FORMATS.clear()
+
+    compiled = CompiledFormat(fmt, FORMATTERS[formatter], locale)
+    _COMPILED_FORMATS[key] = compiled
+
+    return compiled
@@ -36,6 +36,23 @@ class AlternativeFormatter(Formatter):
         'A', 'a',
     )
 
+    # Translation ids of the localizable tokens
+    # and the values they translate
+    _TRANSLATIONS = {
+        'MMM': ('months_abbrev', lambda dt: dt.month),
+        'MMMM': ('months', lambda dt: dt.month),
+        'dd': ('days_abbrev', lambda dt: dt.day_of_week),
+        'ddd': ('days_abbrev', lambda dt: dt.day_of_week),
+        'dddd': ('days', lambda dt: dt.day_of_week),
+        'Do': ('ordinal', lambda dt: dt.day),
+        'do': ('ordinal', lambda dt: dt.day_of_week),
+        'Mo': ('ordinal', lambda dt: dt.month),
+        'Qo': ('ordinal', lambda dt: dt.quarter),
+        'wo': ('ordinal', lambda dt: dt.week_of_year),
+        'DDDo': ('ordinal', lambda dt: dt.day_of_year),
+        'A': ('meridian', lambda dt: (dt.hour, dt.minute)),
+    }
+
     _TOKENS_RULES = {
         # Year
         'YYYY': lambda dt: '{:d}'.format(dt.year),
@@ -99,6 +116,11 @@ class AlternativeFormatter(Formatter):
         'LLLL': 'dddd, MMMM D, YYYY h:mm A',
     }
 
+    _PLANS_MAX_SIZE = 512
+
+    def __init__(self):
+        self._plans = {}
+
     def format(self, dt, fmt, locale=None):
         """
         Formats a Pendulum instance with a given format and locale.
@@ -114,17 +136,111 @@ class AlternativeFormatter(Formatter):
 
         :rtype: str
         """
+        translator = dt.translator()
         if not locale:
-            locale = dt.get_locale()
+            locale = translator.locale
+
+        template, emitters = self._compile(fmt, locale, translator)
+
+        return template.format(*[emit(dt) for emit in emitters])
+
+    def _compile(self, fmt, locale, translator):
+        """
+        Compiles a format into a plan made of a template,
+        holding the literal parts, and of the callables
+        emitting the formatted tokens to fill it with.
+
+        Plans are cached by format, locale and translator.
+
+        :rtype: tuple
+        """
+        key = (fmt, locale, translator)
+
+        try:
+            return self._plans[key]
+        except KeyError:
+            pass
+
+        if len(self._plans) >= self._PLANS_MAX_SIZE:
+            self._plans.clear()
+
+        segments = []
+        emitters = []
+        self._compile_segments(fmt, locale, translator, segments, emitters)
+
+        plan = (''.join(segments), tuple(emitters))
+        self._plans[key] = plan
+
+        return plan
+
+    def _compile_segments(self, fmt, locale, translator, segments, emitters):
+        position = 0
+        for match in self._FORMAT_RE.finditer(fmt):
+            segments.append(self._escape(fmt[position:match.start()]))
+            position = match.end()
+
+            if match.group(1) or match.group(2):
+                segments.append(self._escape(match.group(1) or match.group(2)))
+
+                continue
+
+            token = match.group(3)
+            if token in self._DEFAULT_DATE_FORMATS:
+                # Localized formats are expanded once and for all
+                expanded = translator.transchoice(
+                    'date_formats', token, locale=locale
+                )
+                if expanded == 'date_formats':
+                    expanded = self._DEFAULT_DATE_FORMATS[token]
 
-        return self._FORMAT_RE.sub(
-            lambda m: m.group(1)
-                if m.group(1)
-                else m.group(2)
-                if m.group(2)
-                else self._format_token(dt, m.group(3), locale),
-            fmt
-        )
+                self._compile_segments(
+                    expanded, locale, translator, segments, emitters
+                )
+
+                continue
+
+            segments.append('{}')
+            emitters.append(self._token_emitter(token, locale))
+
+        segments.append(self._escape(fmt[position:]))
+
+    def _token_emitter(self, token, locale):
+        """
+        Returns a callable formatting a Pendulum instance
+        with a given token and locale.
+
+        :rtype: callable
+        """
+        if token in self._LOCALIZABLE_TOKENS and token in self._TRANSLATIONS:
+            # Translations only depend on the translated value
+            # so they are looked up once per value
+            value = self._TRANSLATIONS[token][1]
+            translations = {}
+
+            def emit(dt):
+                count = value(dt)
+                try:
+                    return translations[count]
+                except KeyError:
+                    trans = self._format_localizable_token(dt, token, locale)
+                    translations[count] = trans
+
+                    return trans
+
+            return emit
+
+        if token not in self._LOCALIZABLE_TOKENS and token in self._TOKENS_RULES:
+            return self._TOKENS_RULES[token]
+
+        if token in ['ZZ', 'Z']:
+            separator = ':' if token == 'ZZ' else ''
+
+            return lambda dt: self._format_offset(dt, separator)
+
+        return lambda dt: self._format_token(dt, token, locale) or ''
+
+    def _escape(self, literal):
+        return literal.replace('{', '{{').replace('}', '}}')
 
     def _format_token(self, dt, token, locale):
         """
@@ -155,18 +271,20 @@ class AlternativeFormatter(Formatter):
 
         # Timezone
         if token in ['ZZ', 'Z']:
-            separator = ':' if token == 'ZZ' else ''
-            offset = dt.utcoffset() or datetime.timedelta()
-            minutes = offset.total_seconds() / 60
+            return self._format_offset(dt, ':' if token == 'ZZ' else '')
+
+    def _format_offset(self, dt, separator):
+        offset = dt.utcoffset() or datetime.timedelta()
+        minutes = offset.total_seconds() / 60
 
-            if minutes >= 0:
-                sign = '+'
-            else:
-                sign = '-'
+        if minutes >= 0:
+            sign = '+'
+        else:
+            sign = '-'
 
-            hour, minute = divmod(abs(int(minutes)), 60)
+        hour, minute = divmod(abs(int(minutes)), 60)
 
-            return '{}{:02d}{}{:02d}'.format(sign, hour, separator, minute)
+        return '{}{:02d}{}{:02d}'.format(sign, hour, separator, minute)
 
     def _format_localizable_token(self, dt, token, locale):
         """
@@ -187,39 +305,9 @@ class AlternativeFormatter(Formatter):
         trans_id = ''
         count = 0
 
-        if token == 'MMM':
-            count = dt.month
-            trans_id = 'months_abbrev'
-        elif token == 'MMMM':
-            count = dt.month
-            trans_id = 'months'
-        elif token in ('dd', 'ddd'):
-            count = dt.day_of_week
-            trans_id = 'days_abbrev'
-        elif token == 'dddd':
-            count = dt.day_of_week
-            trans_id = 'days'
-        elif token == 'Do':
-            count = dt.day
-            trans_id = 'ordinal'
-        elif token == 'do':
-            count = dt.day_of_week
-            trans_id = 'ordinal'
-        elif token == 'Mo':
-            count = dt.month
-            trans_id = 'ordinal'
-        elif token == 'Qo':
-            count = dt.quarter
-            trans_id = 'ordinal'
-        elif token == 'wo':
-            count = dt.week_of_year
-            trans_id = 'ordinal'
-        elif token == 'DDDo':
-            count = dt.day_of_year
-            trans_id = 'ordinal'
-        elif token == 'A':
-            count = (dt.hour, dt.minute)
-            trans_id = 'meridian'
+        if token in self._TRANSLATIONS:
+            trans_id, value = self._TRANSLATIONS[token]
+            count = value(dt)
 
         trans = dt.translator().transchoice(trans_id, count, locale=locale)
 
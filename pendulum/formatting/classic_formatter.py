@@ -3,13 +3,57 @@
 import re
 import datetime
 
+from operator import attrgetter
+
 from .formatter import Formatter
 
 
+def _year(dt):
+    if dt.year < 1000:
+        # Padding of small years depends on the platform
+        return dt._datetime.strftime('%Y')
+
+    return dt.year
+
+
 class ClassicFormatter(Formatter):
 
     _CUSTOM_FORMATTERS = ['_z', '_t']
-    _FORMATTERS_REGEX = re.compile('%%(%s)' % '|'.join(_CUSTOM_FORMATTERS))
+
+    # Directives, with their flags, width and modifier
+    _DIRECTIVES_REGEX = re.compile(
+        '%%(%s|[-_0^#]*[0-9]*[EO]?.?)' % '|'.join(_CUSTOM_FORMATTERS),
+        re.DOTALL
+    )
+
+    _LOCALIZABLE_DIRECTIVES = {
+        'a': lambda dt: dt.day_of_week,
+        'A': lambda dt: dt.day_of_week,
+        'b': lambda dt: dt.month,
+        'B': lambda dt: dt.month,
+        'p': lambda dt: (dt.hour, dt.minute),
+    }
+
+    # Directives formatted from the fields of Pendulum instances
+    # rather than by strftime()
+    _NATIVE_DIRECTIVES = {
+        'Y': ('{}', _year),
+        'y': ('{:02d}', lambda dt: dt.year % 100),
+        'm': ('{:02d}', attrgetter('month')),
+        'd': ('{:02d}', attrgetter('day')),
+        'j': ('{:03d}', attrgetter('day_of_year')),
+        'H': ('{:02d}', attrgetter('hour')),
+        'I': ('{:02d}', lambda dt: dt.hour % 12 or 12),
+        'M': ('{:02d}', attrgetter('minute')),
+        'S': ('{:02d}', attrgetter('second')),
+        'f': ('{:06d}', attrgetter('microsecond')),
+        'Z': ('{}', lambda dt: dt._datetime.tzname() or ''),
+    }
+
+    _PLANS_MAX_SIZE = 512
+
+    def __init__(self):
+        self._plans = {}
 
     def format(self, dt, fmt, locale=None):
         """
@@ -26,22 +70,129 @@ class ClassicFormatter(Formatter):
 
         :rtype: str
         """
+        translator = dt.translator()
         if not locale:
-            locale = dt.get_locale()
+            locale = translator.locale
 
-        # Checking for custom formatters
-        fmt = self._FORMATTERS_REGEX.sub(lambda m: self._strftime(dt, m, locale), fmt)
+        native = hasattr(dt, '_datetime')
+        template, emitters = self._compile(fmt, locale, translator, native)
+        values = [emit(dt) for emit in emitters]
 
-        # Checking for localizable directives
-        fmt = re.sub('%(a|A|b|B|p)', lambda m: self._localize_directive(dt, m.group(1), locale), fmt)
-
-        if hasattr(dt, '_datetime'):
-            return dt._datetime.strftime(fmt)
+        if native:
+            return template.format(*values)
 
         if hasattr(dt, '_time'):
-            return dt._time.strftime(fmt)
+            return dt._time.strftime(template).format(*values)
+
+        return datetime.date(dt.year, dt.month, dt.day).strftime(
+            template
+        ).format(*values)
+
+    def _compile(self, fmt, locale, translator, native):
+        """
+        Compiles a format into a plan made of a template
+        and of the callables emitting the values to fill it with.
+
+        For Pendulum instances, the template only holds the literal
+        parts and directives are emitted from the fields of the instance,
+        strftime() being only used for the other directives.
+        For other instances, the template is a strftime() format
+        in which only the localizable and custom directives are emitted.
+
+        Plans are cached by format, locale and translator.
+
+        :rtype: tuple
+        """
+        key = (fmt, locale, translator, native)
+
+        try:
+            return self._plans[key]
+        except KeyError:
+            pass
+
+        if len(self._plans) >= self._PLANS_MAX_SIZE:
+            self._plans.clear()
+
+        segments = []
+        emitters = []
+        position = 0
+        for match in self._DIRECTIVES_REGEX.finditer(fmt):
+            segments.append(self._escape(fmt[position:match.start()]))
+            position = match.end()
+            directive = match.group(1)
+
+            emitter = self._directive_emitter(directive, locale)
+            if emitter is not None:
+                segments.append('{}')
+                emitters.append(emitter)
+            elif not native:
+                segments.append(self._escape(match.group()))
+            elif directive == '%':
+                segments.append('%')
+            elif directive in self._NATIVE_DIRECTIVES:
+                spec, emitter = self._NATIVE_DIRECTIVES[directive]
+                segments.append(spec)
+                emitters.append(emitter)
+            elif directive == 'z':
+                segments.append('{}')
+                emitters.append(lambda dt: self._format_offset(dt, ''))
+            else:
+                segments.append('{}')
+                emitters.append(self._strftime_emitter(match.group()))
+
+        segments.append(self._escape(fmt[position:]))
+
+        plan = (''.join(segments), tuple(emitters))
+        self._plans[key] = plan
+
+        return plan
+
+    def _directive_emitter(self, directive, locale):
+        """
+        Returns a callable formatting an instance with a localizable
+        or custom directive, or None for other directives.
+
+        Translations only depend on the translated value
+        so they are looked up once per value.
 
-        return datetime.date(dt.year, dt.month, dt.day).strftime(fmt)
+        :rtype: callable or None
+        """
+        if directive in self._CUSTOM_FORMATTERS:
+            match = self._DIRECTIVES_REGEX.match('%' + directive)
+            if directive == '_z':
+                return lambda dt: self._strftime(dt, match, locale)
+
+            value = attrgetter('day')
+
+            def translate(dt):
+                return self._strftime(dt, match, locale)
+        elif directive in self._LOCALIZABLE_DIRECTIVES:
+            value = self._LOCALIZABLE_DIRECTIVES[directive]
+
+            def translate(dt):
+                return self._localize_directive(dt, directive, locale)
+        else:
+            return
+
+        translations = {}
+
+        def emit(dt):
+            count = value(dt)
+            try:
+                return translations[count]
+            except KeyError:
+                translation = translate(dt)
+                translations[count] = translation
+
+                return translation
+
+        return emit
+
+    def _strftime_emitter(self, directive):
+        return lambda dt: dt._datetime.strftime(directive)
+
+    def _escape(self, literal):
+        return literal.replace('{', '{{').replace('}', '}}')
 
     def _localize_directive(self, dt, directive, locale):
         """
@@ -94,22 +245,49 @@ class ClassicFormatter(Formatter):
         fmt = m.group(1)
 
         if fmt == '_z':
-            offset = dt.utcoffset() or datetime.timedelta()
-            minutes = offset.total_seconds() / 60
+            return self._format_offset(dt, ':', True)
+        elif fmt == '_t':
+            return self._format_ordinal(dt, locale)
 
-            if minutes >= 0:
-                sign = '+'
-            else:
-                sign = '-'
+        raise ValueError('Unknown formatter %%{}'.format(fmt))
 
-            hour, minute = divmod(abs(int(minutes)), 60)
+    def _format_offset(self, dt, separator, default=False):
+        """
+        Formats the UTC offset of an instance.
 
-            return '{0}{1:02d}:{2:02d}'.format(sign, hour, minute)
-        elif fmt == '_t':
-            translation = dt.translator().transchoice('ordinal', dt.day, locale=locale)
-            if translation == 'ordinal':
-                translation = ''
+        :param separator: The separator of the hours and minutes
+        :type separator: str
 
-            return translation
+        :param default: Whether instances without offset
+                        are formatted as +00:00
+        :type default: bool
 
-        raise ValueError('Unknown formatter %%{}'.format(fmt))
+        :rtype: str
+        """
+        offset = dt.utcoffset()
+        if offset is None:
+            if not default:
+                return ''
+
+            offset = datetime.timedelta()
+
+        minutes = offset.total_seconds() / 60
+        if not default and minutes != int(minutes):
+            # Offsets with seconds are left to strftime()
+            return dt._datetime.strftime('%z')
+
+        if minutes >= 0:
+            sign = '+'
+        else:
+            sign = '-'
+
+        hour, minute = divmod(abs(int(minutes)), 60)
+
+        return '{0}{1:02d}{2}{3:02d}'.format(sign, hour, separator, minute)
+
+    def _format_ordinal(self, dt, locale):
+        translation = dt.translator().transchoice('ordinal', dt.day, locale=locale)
+        if translation == 'ordinal':
+            translation = ''
+
+        return translation
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+
+import re
+import datetime
+
+import pendulum
+
+from .classic_formatter import ClassicFormatter
+from .alternative_formatter import AlternativeFormatter
+
+
+class _Field(object):
+    """
+    A parsable field of a compiled format.
+
+    The width is None when the field has a variable width.
+    """
+
+    __slots__ = ('name', 'width', 'pattern', 'convert')
+
+    def __init__(self, name, width, pattern, convert):
+        self.name = name
+        self.width = width
+        self.pattern = pattern
+        self.convert = convert
+
+
+def _number(minimum, maximum):
+    def convert(value):
+        if not value.isdigit():
+            raise ValueError(value)
+
+        value = int(value)
+        if not minimum <= value <= maximum:
+            raise ValueError(value)
+
+        return value
+
+    return convert
+
+
+def _short_year(value):
+    # Same pivot as strptime()
+    year = _number(0, 99)(value)
+
+    return year + (2000 if year < 69 else 1900)
+
+
+def _fraction(width):
+    convert = _number(0, 10 ** width - 1)
+
+    def fraction(value):
+        value = convert(value)
+
+        if width > 6:
+            return value // 10 ** (width - 6)
+
+        return value * 10 ** (6 - width)
+
+    return fraction
+
+
+def _offset(separator):
+    def convert(value):
+        sign = value[:1]
+        hours = value[1:3]
+        minutes = value[3 + len(separator):]
+
+        if (sign not in ('+', '-')
+                or value[3:3 + len(separator)] != separator
+                or not hours.isdigit() or not minutes.isdigit()):
+            raise ValueError(value)
+
+        hours, minutes = int(hours), int(minutes)
+        if hours > 23 or minutes > 59:
+            raise ValueError(value)
+
+        offset = hours * 3600 + minutes * 60
+        if sign == '-':
+            offset = -offset
+
+        return offset
+
+    return convert
+
+
+def _timestamp(value):
+    return int(value)
+
+
+def _name(value):
+    return value
+
+
+def _names(names):
+    def convert(value):
+        return names[value]
+
+    return convert
+
+
+def _numeric_field(name, width, minimum, maximum, max_width=None):
+    if width:
+        pattern = '[0-9]{{{}}}'.format(width)
+    else:
+        pattern = '[0-9]{{1,{}}}'.format(max_width)
+
+    return _Field(name, width, pattern, _number(minimum, maximum))
+
+
+# Directives of strptime() which can be sliced at fixed positions.
+# Any other directive is delegated to strptime().
+_CLASSIC_FIELDS = {
+    'Y': _numeric_field('year', 4, 1, 9999),
+    'y': _Field('year', 2, None, _short_year),
+    'm': _numeric_field('month', 2, 1, 12),
+    'd': _numeric_field('day', 2, 1, 31),
+    'j': _numeric_field('day_of_year', 3, 1, 366),
+    'H': _numeric_field('hour', 2, 0, 23),
+    'M': _numeric_field('minute', 2, 0, 59),
+    'S': _numeric_field('second', 2, 0, 59),
+    'f': _Field('microsecond', 6, None, _fraction(6)),
+    'z': _Field('offset', 5, None, _offset('')),
+}
+
+_ALTERNATIVE_FIELDS = {
+    'YYYY': _numeric_field('year', 4, 1, 9999),
+    'YY': _Field('year', 2, '[0-9]{2}', _short_year),
+    'Y': _numeric_field('year', None, 1, 9999, 4),
+    'MM': _numeric_field('month', 2, 1, 12),
+    'M': _numeric_field('month', None, 1, 12, 2),
+    'DD': _numeric_field('day', 2, 1, 31),
+    'D': _numeric_field('day', None, 1, 31, 2),
+    'DDDD': _numeric_field('day_of_year', 3, 1, 366),
+    'DDD': _numeric_field('day_of_year', None, 1, 366, 3),
+    'd': _numeric_field(None, 1, 0, 6),
+    'HH': _numeric_field('hour', 2, 0, 23),
+    'H': _numeric_field('hour', None, 0, 23, 2),
+    'hh': _numeric_field('hour12', 2, 1, 12),
+    'h': _numeric_field('hour12', None, 1, 12, 2),
+    'mm': _numeric_field('minute', 2, 0, 59),
+    'm': _numeric_field('minute', None, 0, 59, 2),
+    'ss': _numeric_field('second', 2, 0, 59),
+    's': _numeric_field('second', None, 0, 59, 2),
+    'X': _Field('timestamp', None, '-?[0-9]+', _timestamp),
+    'ZZ': _Field('offset', 6, '[+-][0-9]{2}:[0-9]{2}', _offset(':')),
+    'Z': _Field('offset', 5, '[+-][0-9]{4}', _offset('')),
+    'zz': _Field('timezone', None, '[A-Za-z_]+(?:/[A-Za-z0-9_+-]+)*', _name),
+}
+
+for _width in range(1, 10):
+    _ALTERNATIVE_FIELDS['S' * _width] = _Field(
+        'microsecond', _width, '[0-9]{{{}}}'.format(_width), _fraction(_width)
+    )
+
+# Localizable tokens and their translation ids
+_ALTERNATIVE_NAMES = {
+    'MMMM': ('month', 'months', range(1, 13)),
+    'MMM': ('month', 'months_abbrev', range(1, 13)),
+    'dddd': (None, 'days', range(7)),
+    'ddd': (None, 'days_abbrev', range(7)),
+    'dd': (None, 'days_abbrev', range(7)),
+}
+
+
+class CompiledFormat(object):
+    """
+    A format compiled once to parse and format strings.
+
+    Fields of known widths are parsed by slicing the string
+    at fixed positions, other ones with a regular expression
+    built from the format.
+    """
+
+    def __init__(self, fmt, formatter, locale='en'):
+        """
+        Constructor.
+
+        :param fmt: The format
+        :type fmt: str
+
+        :param formatter: The formatter the format is written for
+        :type formatter: Formatter
+
+        :param locale: The locale of the localized tokens
+        :type locale: str
+        """
+        self._fmt = fmt
+        self._formatter = formatter
+        self._locale = locale
+        self._native = False
+        self._unsupported = None
+        self._items = []
+        self._length = None
+        self._literals = None
+        self._slices = None
+        self._regex = None
+        self._fields = None
+
+        if isinstance(formatter, ClassicFormatter):
+            self._compile_classic(fmt)
+        elif isinstance(formatter, AlternativeFormatter):
+            self._compile_alternative(fmt)
+        else:
+            self._unsupported = 'unsupported formatter'
+
+        if not self._native and self._unsupported is None:
+            self._compile_parser()
+
+    @property
+    def fmt(self):
+        return self._fmt
+
+    @property
+    def locale(self):
+        return self._locale
+
+    def parse(self, text):
+        """
+        Parses a string with the format.
+
+        Missing date fields default to 1900-01-01, like strptime() does.
+
+        :param text: The string to parse
+        :type text: str
+
+        :return: The year, month, day, hour, minute, second
+                 and microsecond and, if they are parsed,
+                 the offset in seconds, the timezone name and the timestamp
+        :rtype: dict
+        """
+        if self._unsupported is not None:
+            raise ValueError(
+                'Unable to parse with format "{}": {}'.format(
+                    self._fmt, self._unsupported
+                )
+            )
+
+        if self._native:
+            return self._parse_native(text)
+
+        try:
+            if self._length is not None:
+                values = self._parse_fixed(text)
+            else:
+                values = self._parse_variable(text)
+
+            return self._resolve(values)
+        except ValueError:
+            if isinstance(self._formatter, ClassicFormatter):
+                return self._parse_native(text)
+
+            raise ValueError(
+                'Unable to parse "{}" with format "{}"'.format(text, self._fmt)
+            )
+
+    def format(self, dt, locale=None):
+        """
+        Formats an instance with the format.
+
+        :param dt: The instance to format
+        :type dt: pendulum.Pendulum
+
+        :param locale: The locale to use
+        :type locale: str or None
+
+        :rtype: str
+        """
+        if not locale:
+            locale = self._locale
+
+        return self._formatter.format(dt, self._fmt, locale)
+
+    def _compile_classic(self, fmt):
+        literal = ''
+        i = 0
+        while i < len(fmt):
+            char = fmt[i]
+            i += 1
+
+            if char != '%':
+                literal += char
+
+                continue
+
+            directive = fmt[i:i + 1]
+            i += 1
+
+            if directive == '%':
+                literal += '%'
+            elif directive in _CLASSIC_FIELDS:
+                if literal:
+                    self._items.append(literal)
+                    literal = ''
+
+                self._items.append(_CLASSIC_FIELDS[directive])
+            else:
+                self._native = True
+
+                return
+
+        if literal:
+            self._items.append(literal)
+
+    def _compile_alternative(self, fmt):
+        translator = pendulum.Pendulum.translator()
+        regex = AlternativeFormatter._FORMAT_RE
+        position = 0
+        for match in regex.finditer(fmt):
+            self._add_literal(fmt[position:match.start()])
+            position = match.end()
+
+            if match.group(1) is not None:
+                self._add_literal(match.group(1))
+
+                continue
+
+            if match.group(2) is not None:
+                self._add_literal(match.group(2))
+
+                continue
+
+            token = match.group(3)
+            if token in AlternativeFormatter._DEFAULT_DATE_FORMATS:
+                expanded = translator.transchoice(
+                    'date_formats', token, locale=self._locale
+                )
+                if expanded == 'date_formats':
+                    expanded = AlternativeFormatter._DEFAULT_DATE_FORMATS[token]
+
+                self._compile_alternative(expanded)
+            elif token in _ALTERNATIVE_FIELDS:
+                self._items.append(_ALTERNATIVE_FIELDS[token])
+            elif token in _ALTERNATIVE_NAMES:
+                name, trans_id, numbers = _ALTERNATIVE_NAMES[token]
+                self._items.append(
+                    self._names_field(name, trans_id, numbers)
+                )
+            elif token in ('A', 'a'):
+                self._items.append(self._meridian_field())
+            elif self._unsupported is None:
+                self._unsupported = 'unsupported token "{}"'.format(token)
+
+        self._add_literal(fmt[position:])
+
+    def _add_literal(self, literal):
+        if not literal:
+            return
+
+        if self._items and not isinstance(self._items[-1], _Field):
+            self._items[-1] += literal
+        else:
+            self._items.append(literal)
+
+    def _names_field(self, name, trans_id, numbers):
+        names = {}
+        for number in numbers:
+            translation = self._translate(trans_id, number)
+            for variant in (translation, translation.lower(), translation.upper()):
+                names.setdefault(variant, number)
+
+        return _Field(name, None, self._names_pattern(names), _names(names))
+
+    def _meridian_field(self):
+        names = {}
+        for hour, meridian in ((0, 0), (12, 12)):
+            translation = self._translate('meridian', (hour, 0))
+            for variant in (translation, translation.lower(), translation.upper()):
+                names.setdefault(variant, meridian)
+
+        return _Field('meridian', None, self._names_pattern(names), _names(names))
+
+    def _translate(self, trans_id, number):
+        translator = pendulum.Pendulum.translator()
+        translation = translator.transchoice(
+            trans_id, number, locale=self._locale
+        )
+        if translation == trans_id:
+            # Defaulting to english, like the formatter does
+            translation = translator.transchoice(
+                trans_id, number, locale='en'
+            )
+
+        return translation
+
+    def _names_pattern(self, names):
+        # Longest names first so that prefixes do not match early
+        return '|'.join(
+            re.escape(name)
+            for name in sorted(names, key=lambda n: (-len(n), n))
+        )
+
+    def _compile_parser(self):
+        fields = [item for item in self._items if isinstance(item, _Field)]
+
+        if all(field.width is not None for field in fields):
+            # Every field can be sliced at a fixed position
+            position = 0
+            self._literals = []
+            self._slices = []
+            for item in self._items:
+                if isinstance(item, _Field):
+                    self._slices.append(
+                        (position, position + item.width, item)
+                    )
+                    position += item.width
+                else:
+                    self._literals.append((position, item))
+                    position += len(item)
+
+            self._length = position
+
+            return
+
+        pattern = ''
+        for item in self._items:
+            if isinstance(item, _Field):
+                pattern += '({})'.format(item.pattern)
+            else:
+                pattern += re.escape(item)
+
+        self._regex = re.compile(pattern + r'\Z')
+        self._fields = fields
+
+    def _parse_fixed(self, text):
+        if len(text) != self._length:
+            raise ValueError(text)
+
+        for position, literal in self._literals:
+            if not text.startswith(literal, position):
+                raise ValueError(text)
+
+        return [
+            (field.name, field.convert(text[start:end]))
+            for start, end, field in self._slices
+        ]
+
+    def _parse_variable(self, text):
+        match = self._regex.match(text)
+        if match is None:
+            raise ValueError(text)
+
+        return [
+            (field.name, field.convert(value))
+            for field, value in zip(self._fields, match.groups())
+        ]
+
+    def _parse_native(self, text):
+        dt = datetime.datetime.strptime(text, self._fmt)
+
+        parsed = {
+            'year': dt.year,
+            'month': dt.month,
+            'day': dt.day,
+            'hour': dt.hour,
+            'minute': dt.minute,
+            'second': dt.second,
+            'microsecond': dt.microsecond,
+        }
+
+        offset = dt.utcoffset()
+        if offset is not None:
+            parsed['offset'] = offset.total_seconds()
+
+        return parsed
+
+    def _resolve(self, values):
+        values = dict(values)
+
+        year = values.get('year', 1900)
+        month = values.get('month', 1)
+        day = values.get('day', 1)
+        hour = values.get('hour', 0)
+
+        if 'day_of_year' in values:
+            # The day of the year takes precedence, like with strptime()
+            date = datetime.date.fromordinal(
+                datetime.date(year, 1, 1).toordinal()
+                + values['day_of_year'] - 1
+            )
+            year, month, day = date.year, date.month, date.day
+
+        if 'hour12' in values:
+            hour = values['hour12'] % 12 + values.get('meridian', 0)
+
+        parsed = {
+            'year': year,
+            'month': month,
+            'day': day,
+            'hour': hour,
+            'minute': values.get('minute', 0),
+            'second': values.get('second', 0),
+            'microsecond': values.get('microsecond', 0),
+        }
+
+        for name in ('offset', 'timezone', 'timestamp'):
+            if name in values:
+                parsed[name] = values[name]
+
+        return parsed
+
+    def __repr__(self):
+        return '<CompiledFormat [{}]>'.format(self._fmt)
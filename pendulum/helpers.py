@@ -2,227 +2,167 @@
 
 import pendulum
 
-from math import copysign
-from datetime import timedelta
+from datetime import date
 
 try:
-    from ._extensions._helpers import local_time, parse_iso8601 as _parse_iso8601
+    from ._extensions._helpers import (
+        local_time, precise_diff, parse_iso8601 as _parse_iso8601,
+        try_parse_iso8601 as _try_parse_iso8601,
+        parse_iso8601_timestamp, parse_iso8601_column,
+        parse_iso8601_duration, parse_rfc2822, try_parse_rfc2822,
+        format_iso8601, format_iso8601_many, format_iso8601_column,
+        add_duration as _add_duration, TZFixedOffset
+    )
+    from ._extensions.helpers import (
+        local_times, add_duration as _add_duration_py
+    )
 
     def parse_iso8601(text, day_first=False):
         return _parse_iso8601(text, day_first)
 
+    def try_parse_iso8601(text, day_first=False):
+        return _try_parse_iso8601(text, day_first)
+
+    scan_iso8601 = None
+    native_format_iso8601 = format_iso8601
+
+    def add_duration(dt, years=0, months=0, weeks=0, days=0,
+                     hours=0, minutes=0, seconds=0, microseconds=0):
+        try:
+            return _add_duration(
+                dt, years, months, weeks, days,
+                hours, minutes, seconds, microseconds
+            )
+        except TypeError:
+            # Non-integer units are only supported
+            # by the pure Python implementation.
+            return _add_duration_py(
+                dt, years, months, weeks, days,
+                hours, minutes, seconds, microseconds
+            )
+
 except ImportError:
-    from ._extensions.helpers import local_time
+    from ._extensions.helpers import (
+        local_time, local_times, precise_diff, add_duration,
+        parse_iso8601, try_parse_iso8601, scan_iso8601,
+        parse_iso8601_duration, parse_rfc2822, try_parse_rfc2822,
+        format_iso8601, format_iso8601_many, format_iso8601_column,
+        TZFixedOffset
+    )
 
-    parse_iso8601 = None
+    parse_iso8601_timestamp = None
+    parse_iso8601_column = None
+    native_format_iso8601 = None
 
 from .constants import (
-    DAYS_PER_MONTHS, DAY_OF_WEEK_TABLE, DAYS_PER_L_YEAR, DAYS_PER_N_YEAR
+    DAYS_PER_MONTHS, DAY_OF_WEEK_TABLE, DAYS_PER_L_YEAR, DAYS_PER_N_YEAR,
+    EPOCH_ORDINAL, USECS_PER_SEC, USECS_PER_MIN, USECS_PER_HOUR, USECS_PER_DAY,
+    MONDAY, THURSDAY, DAYS_PER_WEEK
 )
 
+# Length of the units that can be rounded to
+# without taking the calendar into account.
+_ROUNDING_STEPS = {
+    'microsecond': 1,
+    'millisecond': 1000,
+    'second': USECS_PER_SEC,
+    'minute': USECS_PER_MIN,
+    'hour': USECS_PER_HOUR,
+    'day': USECS_PER_DAY,
+}
+
+ROUNDING_UNITS = [
+    'microsecond', 'millisecond', 'second', 'minute', 'hour',
+    'day', 'week', 'month', 'year'
+]
+
 
 def is_leap(year):
     return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
-def add_duration(dt, years=0, months=0, weeks=0, days=0,
-                 hours=0, minutes=0, seconds=0, microseconds=0):
+def date_ordinal(year, month, day):
     """
-    Adds a duration to a datetime instance.
-
-    :param dt: The datetime instance
-    :type dt: datetime.datetime
+    Returns the proleptic Gregorian ordinal of a valid date,
+    January 1 of year 1 having ordinal 1.
 
-    :param years: The number of years
-    :type years: int
+    :rtype: int
+    """
+    return days_from_civil(year, month, day) + EPOCH_ORDINAL
 
-    :param months: The number of months
-    :type months: int
 
-    :param weeks: The number of weeks
-    :type weeks: int
+def floor_local(local, unit, multiple=1, week_starts_at=MONDAY):
+    """
+    Rounds down a wall clock time to a multiple of the given unit.
 
-    :param days: The number of days
-    :type days: int
+    Fixed-length units are aligned on 1970-01-01,
+    weeks on the first week day following it,
+    months and years on the year 0.
 
-    :param hours: The number of hours
-    :type hours: int
+    :param local: Microseconds elapsed since 1970-01-01T00:00:00 (wall clock)
+    :type local: int
 
-    :param minutes: The number of minutes
-    :type minutes: int
+    :param unit: The unit to round to
+    :type unit: str
 
-    :param seconds: The number of seconds
-    :type seconds: int
+    :param multiple: The number of units in a bucket
+    :type multiple: int
 
-    :param microseconds: The number of microseconds
-    :type microseconds: int
+    :param week_starts_at: The first day of the week
+    :type week_starts_at: int
 
-    :rtype: datetime.datetime
+    :rtype: int
     """
-    days += weeks * 7
+    if unit in _ROUNDING_STEPS:
+        return local - local % (_ROUNDING_STEPS[unit] * multiple)
 
-    # Normalizing
-    if abs(microseconds) > 999999:
-        s = _sign(microseconds)
-        div, mod = divmod(microseconds * s, 1000000)
-        microseconds = mod * s
-        seconds += div * s
+    days = local // USECS_PER_DAY
 
-    if abs(seconds) > 59:
-        s = _sign(seconds)
-        div, mod = divmod(seconds * s, 60)
-        seconds = mod * s
-        minutes += div * s
+    if unit == 'week':
+        origin = (week_starts_at - THURSDAY) % DAYS_PER_WEEK
+        step = DAYS_PER_WEEK * multiple
 
-    if abs(minutes) > 59:
-        s = _sign(minutes)
-        div, mod = divmod(minutes * s, 60)
-        minutes = mod * s
-        hours += div * s
+        return (days - (days - origin) % step) * USECS_PER_DAY
 
-    if abs(hours) > 23:
-        s = _sign(hours)
-        div, mod = divmod(hours * s, 24)
-        hours = mod * s
-        days += div * s
+    d = date.fromordinal(days + EPOCH_ORDINAL)
+    if unit == 'month':
+        month = d.year * 12 + d.month - 1
+        month -= month % multiple
 
-    if abs(months) > 11:
-        s = _sign(months)
-        div, mod = divmod(months * s, 12)
-        months = mod * s
-        years += div * s
+        return _local_from_date(month // 12, month % 12 + 1)
 
-    year = dt.year + years
-    month = dt.month
+    return _local_from_date(d.year - d.year % multiple, 1)
 
-    if months:
-        month += months
-        if month > 12:
-            year += 1
-            month -= 12
-        elif month < 1:
-            year -= 1
-            month += 12
 
-    day = min(DAYS_PER_MONTHS[int(is_leap(year))][month], dt.day)
+def ceil_local(local, unit, multiple=1, week_starts_at=MONDAY):
+    """
+    Rounds up a wall clock time to a multiple of the given unit.
 
-    dt = dt.replace(year=year, month=month, day=day)
+    See floor_local() for the meaning of the parameters.
 
-    return dt + timedelta(
-        days=days,
-        hours=hours,
-        minutes=minutes,
-        seconds=seconds,
-        microseconds=microseconds
-    )
+    :rtype: int
+    """
+    floored = floor_local(local, unit, multiple, week_starts_at)
+    if floored == local:
+        return local
+
+    if unit in _ROUNDING_STEPS:
+        return floored + _ROUNDING_STEPS[unit] * multiple
+
+    if unit == 'week':
+        return floored + DAYS_PER_WEEK * multiple * USECS_PER_DAY
 
+    d = date.fromordinal(floored // USECS_PER_DAY + EPOCH_ORDINAL)
+    if unit == 'month':
+        month = d.year * 12 + d.month - 1 + multiple
 
-def precise_diff(d1, d2):
-    """
-    Calculate a precise difference between two datetimes.
-
-    :param d1: The first datetime
-    :type d1: pendulum.Pendulum or pendulum.Date
-
-    :param d2: The second datetime
-    :type d2: pendulum.Pendulum or pendulum.Date
-
-    :rtype: dict
-    """
-    diff = {
-        'years': 0,
-        'months': 0,
-        'days': 0,
-        'hours': 0,
-        'minutes': 0,
-        'seconds': 0,
-        'microseconds': 0
-    }
-    sign = 1
-
-    if d1 == d2:
-        return diff
-
-    if d1 > d2:
-        d1, d2 = d2, d1
-        sign = -1
-
-    y_diff = d2.year - d1.year
-    m_diff = d2.month - d1.month
-    d_diff = d2.day - d1.day
-    hour_diff = 0
-    min_diff = 0
-    sec_diff = 0
-    mic_diff = 0
-
-    if hasattr(d2, 'hour'):
-        hour_diff = d2.hour - d1.hour
-        min_diff = d2.minute - d1.minute
-        sec_diff = d2.second - d1.second
-        mic_diff = d2.microsecond - d1.microsecond
-
-        if mic_diff < 0:
-            mic_diff += 1000000
-            sec_diff -= 1
-
-        if sec_diff < 0:
-            sec_diff += 60
-            min_diff -= 1
-
-        if min_diff < 0:
-            min_diff += 60
-            hour_diff -= 1
-
-        if hour_diff < 0:
-            hour_diff += 24
-            d_diff -= 1
-
-    if d_diff < 0:
-        year = d2.year
-        month = d2.month
-
-        if month == 1:
-            month = 12
-            year -= 1
-        else:
-            month -= 1
-
-        leap = int(is_leap(year))
-
-        days_in_last_month = DAYS_PER_MONTHS[leap][month]
-        days_in_month = DAYS_PER_MONTHS[int(is_leap(d2.year))][d2.month]
-
-        if d_diff < days_in_month - days_in_last_month:
-            # We don't have a full month, we calculate days
-            if days_in_last_month < d1.day:
-                d_diff += d1.day
-            else:
-                d_diff += days_in_last_month
-        elif d_diff == days_in_month - days_in_last_month:
-            # We have exactly a full month
-            # We remove the days difference
-            # and add one to the months difference
-            d_diff = 0
-            m_diff += 1
-        else:
-            # We have a full month
-            d_diff += days_in_last_month
-
-        m_diff -= 1
-
-    if m_diff < 0:
-        m_diff += 12
-        y_diff -= 1
-
-    diff['microseconds'] = sign * mic_diff
-    diff['seconds'] = sign * sec_diff
-    diff['minutes'] = sign * min_diff
-    diff['hours'] = sign * hour_diff
-    diff['days'] = sign * d_diff
-    diff['months'] = sign * m_diff
-    diff['years'] = sign * y_diff
-
-    return diff
+        return _local_from_date(month // 12, month % 12 + 1)
+
+    return _local_from_date(d.year + multiple, 1)
+
+
+def _local_from_date(year, month, day=1):
+    return (date(year, month, day).toordinal() - EPOCH_ORDINAL) * USECS_PER_DAY
 
 
 def week_day(year, month, day):
@@ -243,5 +183,131 @@ def days_in_year(year):
 
     return DAYS_PER_N_YEAR
 
-def _sign(x):
-    return int(copysign(1, x))
+
+def days_in_month(year, month):
+    return DAYS_PER_MONTHS[int(is_leap(year))][month]
+
+
+# Calendar arithmetic on days elapsed since 1970-01-01,
+# using the closed-form conversions from and to civil dates.
+
+def days_from_civil(year, month, day):
+    """
+    Returns the number of days elapsed since 1970-01-01
+    for the given proleptic Gregorian date.
+
+    :rtype: int
+    """
+    if month <= 2:
+        year -= 1
+
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+
+    return era * 146097 + doe - 719468
+
+
+def civil_from_days(days):
+    """
+    Returns the (year, month, day) proleptic Gregorian date
+    of the given number of days elapsed since 1970-01-01.
+
+    :rtype: tuple
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    year = yoe + era * 400 + (month <= 2)
+
+    return year, month, day
+
+
+def add_months(year, month, day, months):
+    """
+    Adds months to a date, clamping the day to the end of the month.
+
+    :rtype: tuple
+    """
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    month += 1
+
+    if not 1 <= year <= 9999:
+        raise ValueError('year {} is out of range'.format(year))
+
+    return year, month, min(day, days_in_month(year, month))
+
+
+def day_of_week_from_days(days):
+    """
+    Returns the day of the week (0-6, 0 being Sunday)
+    of the given number of days elapsed since 1970-01-01.
+
+    :rtype: int
+    """
+    return (days + THURSDAY) % 7
+
+
+def next_day_of_week(days, day_of_week):
+    """
+    Returns the next occurrence, strictly after the given day,
+    of a day of the week.
+
+    :rtype: int
+    """
+    return days + (day_of_week - day_of_week_from_days(days) - 1) % 7 + 1
+
+
+def previous_day_of_week(days, day_of_week):
+    """
+    Returns the previous occurrence, strictly before the given day,
+    of a day of the week.
+
+    :rtype: int
+    """
+    return days - (day_of_week_from_days(days) - day_of_week - 1) % 7 - 1
+
+
+def nth_day_of_week(first, last, nth, day_of_week=None):
+    """
+    Returns the nth occurrence of a day of the week
+    between the first and last given days (inclusive),
+    or None if there is no such occurrence.
+
+    If no day of the week is given, the one of the first day is used.
+
+    :rtype: int or None
+    """
+    if nth < 1:
+        return
+
+    if day_of_week is None:
+        day_of_week = day_of_week_from_days(first)
+
+    days = first + (day_of_week - day_of_week_from_days(first)) % 7 + (nth - 1) * 7
+    if days > last:
+        return
+
+    return days
+
+
+def last_day_of_week(last, day_of_week=None):
+    """
+    Returns the last occurrence of a day of the week
+    on or before the given day.
+
+    If no day of the week is given, the given day is returned.
+
+    :rtype: int
+    """
+    if day_of_week is None:
+        return last
+
+    return last - (day_of_week_from_days(last) - day_of_week) % 7
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import csv
+import io
+import json
+import multiprocessing
+import re
+
+from ._compat import PY2
+from .constants import USECS_PER_SEC
+from .formatting import compile_format
+from .parser import TimestampParser
+from .pendulum import Pendulum
+from .tz import UTC
+
+
+class Normalizer(object):
+    """
+    Rewrites a timestamp column of CSV or NDJSON lines
+    in a given timezone and format.
+
+    Instances only hold plain options so that they can be
+    sent to worker processes, the parser and the formatter
+    being created on first use.
+    """
+
+    FORMATS = ['csv', 'ndjson']
+
+    ERRORS = ['raise', 'keep', 'empty']
+
+    def __init__(self, column, input_format='csv', tz=UTC, to=UTC,
+                 fmt=None, formatter='classic', locale=None,
+                 day_first=False, sniff=False, errors='raise', delimiter=','):
+        """
+        Constructor.
+
+        :param column: The CSV column index or the NDJSON key,
+                       dotted keys being looked up in nested objects
+        :type column: int or str
+
+        :param input_format: The format of the lines ("csv" or "ndjson")
+        :type input_format: str
+
+        :param tz: The timezone of the timestamps without offset
+        :type tz: str or int or None
+
+        :param to: The timezone of the normalized timestamps
+        :type to: str or int or None
+
+        :param fmt: The output format, RFC 3339 by default
+        :type fmt: str or None
+
+        :param formatter: The formatter of the output format
+        :type formatter: str
+
+        :param locale: The locale of the output format
+        :type locale: str or None
+
+        :param day_first: Whether to parse ambiguous dates day first
+        :type day_first: bool
+
+        :param sniff: Whether to try the format of the last
+                      parsed timestamp first
+        :type sniff: bool
+
+        :param errors: What to do with invalid timestamps:
+                       "raise" to raise the error,
+                       "keep" to leave them as they are
+                       or "empty" to clear them
+        :type errors: str
+
+        :param delimiter: The CSV delimiter
+        :type delimiter: str
+        """
+        if input_format not in self.FORMATS:
+            raise ValueError('Invalid input format "{}"'.format(input_format))
+
+        if errors not in self.ERRORS:
+            raise ValueError('Invalid errors value "{}"'.format(errors))
+
+        if input_format == 'ndjson':
+            column = str(column).split('.')
+
+        self._column = column
+        self._input_format = input_format
+        self._tz = tz
+        self._to = to
+        self._fmt = fmt
+        self._formatter = formatter
+        self._locale = locale
+        self._day_first = day_first
+        self._sniff = sniff
+        self._errors = errors
+        self._delimiter = delimiter
+        self._parser = None
+        self._compiled = None
+        self._to_tz = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_parser'] = state['_compiled'] = state['_to_tz'] = None
+
+        return state
+
+    def normalize(self, text):
+        """
+        Normalizes a timestamp.
+
+        :param text: The timestamp to normalize
+        :type text: str
+
+        :rtype: str
+        """
+        if self._parser is None:
+            self._parser = TimestampParser(
+                self._tz, day_first=self._day_first, sniff=self._sniff
+            )
+            self._to_tz = Pendulum._safe_create_datetime_zone(self._to)
+            if self._fmt is not None:
+                self._compiled = compile_format(
+                    self._fmt, self._formatter, self._locale
+                )
+
+        unix_time, microsecond = divmod(self._parser.parse(text), USECS_PER_SEC)
+        dt = Pendulum._create_from_unix_time(unix_time, microsecond, self._to_tz)
+
+        if self._compiled is None:
+            return dt.isoformat()
+
+        return self._compiled.format(dt)
+
+    def normalize_lines(self, text, first_line=1):
+        """
+        Normalizes the timestamps of the given lines.
+
+        :param text: The lines
+        :type text: str
+
+        :param first_line: The number of the first line, for error messages
+        :type first_line: int
+
+        :rtype: str
+        """
+        lines = text.split('\n')
+        # Either an empty string or a last line without line break
+        last = lines.pop()
+        if last:
+            lines.append(last)
+
+        output = io.BytesIO() if PY2 else io.StringIO()
+        if self._input_format == 'csv':
+            # A single reader and writer for all the lines
+            # since creating them dominates the cost of short lines.
+            # The extra empty line is only read by a quoted field
+            # left open by the last line, which the check
+            # on line numbers then reports.
+            rows = csv.reader(lines + [''], delimiter=self._delimiter)
+            writer = csv.writer(
+                output, delimiter=self._delimiter, lineterminator=''
+            )
+        else:
+            rows = lines
+
+        for i, (line, row) in enumerate(zip(lines, rows)):
+            if i:
+                output.write('\n')
+
+            if not line.strip():
+                output.write(line)
+
+                continue
+
+            try:
+                if self._input_format == 'csv':
+                    if rows.line_num != i + 1:
+                        raise ValueError(
+                            'Records spanning several lines are not supported'
+                        )
+
+                    writer.writerow(self._normalize_row(row))
+                else:
+                    output.write(self._normalize_json_line(line.rstrip('\r')))
+            except ValueError as e:
+                raise ValueError('Line {}: {}'.format(first_line + i, e))
+
+            if line.endswith('\r'):
+                output.write('\r')
+
+        if lines and not last:
+            output.write('\n')
+
+        return output.getvalue()
+
+    def _normalize_value(self, value):
+        try:
+            return self.normalize(value)
+        except (ValueError, TypeError, OverflowError):
+            if self._errors == 'raise':
+                raise ValueError('Invalid timestamp {!r}'.format(value))
+
+            if self._errors == 'keep':
+                return value
+
+            return None
+
+    def _normalize_row(self, row):
+        if self._column >= len(row):
+            raise ValueError('Missing column {}'.format(self._column))
+
+        value = self._normalize_value(row[self._column])
+        row[self._column] = '' if value is None else value
+
+        return row
+
+    def _normalize_json_line(self, line):
+        # Only the value is rewritten, the rest of the line
+        # being left as it is rather than decoded and encoded again
+        end, bounds = _scan_json_object(line, self._column, 0)
+        if _skip_json_space(line, end) != len(line):
+            raise ValueError('Extra data after the JSON object')
+
+        if bounds is None:
+            raise ValueError('Missing key "{}"'.format('.'.join(self._column)))
+
+        start, end = bounds
+        value = _JSON_DECODER.decode(line[start:end])
+        normalized = self._normalize_value(value)
+        if normalized is value:
+            return line
+
+        return line[:start] + json.dumps(normalized, ensure_ascii=False) + line[end:]
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_SPACE = re.compile(r'[ \t\n\r]*')
+
+
+def _skip_json_space(text, pos):
+    return _JSON_SPACE.match(text, pos).end()
+
+
+def _scan_json_object(text, keys, pos):
+    """
+    Scans the JSON value at a position of a string
+    for the value of nested keys, like json.loads() would find it.
+
+    :param text: The string
+    :type text: str
+
+    :param keys: The nested keys
+    :type keys: list
+
+    :param pos: The position of the value
+    :type pos: int
+
+    :return: The end of the value and the bounds of the value
+             of the keys, or None if it is missing
+    :rtype: tuple
+    """
+    pos = _skip_json_space(text, pos)
+    if text[pos:pos + 1] != '{':
+        return _JSON_DECODER.raw_decode(text, pos)[1], None
+
+    bounds = None
+    pos = _skip_json_space(text, pos + 1)
+    if text[pos:pos + 1] == '}':
+        return pos + 1, bounds
+
+    while True:
+        if text[pos:pos + 1] != '"':
+            raise ValueError('Expecting property name at {}'.format(pos))
+
+        key, pos = json.decoder.scanstring(text, pos + 1)
+        pos = _skip_json_space(text, pos)
+        if text[pos:pos + 1] != ':':
+            raise ValueError("Expecting ':' delimiter at {}".format(pos))
+
+        pos = _skip_json_space(text, pos + 1)
+        if key != keys[0]:
+            end = _JSON_DECODER.raw_decode(text, pos)[1]
+        elif len(keys) > 1:
+            end, bounds = _scan_json_object(text, keys[1:], pos)
+        else:
+            end = _JSON_DECODER.raw_decode(text, pos)[1]
+            bounds = pos, end
+
+        pos = _skip_json_space(text, end)
+        if text[pos:pos + 1] == '}':
+            return pos + 1, bounds
+
+        if text[pos:pos + 1] != ',':
+            raise ValueError("Expecting ',' delimiter at {}".format(pos))
+
+        pos = _skip_json_space(text, pos + 1)
+
+
+def iter_chunks(f, chunk_size):
+    """
+    Reads a binary file in chunks ending on line boundaries.
+
+    :param f: The file
+    :type f: file
+
+    :param chunk_size: The approximate size of the chunks
+    :type chunk_size: int
+
+    :rtype: generator
+    """
+    rest = b''
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            break
+
+        data = rest + data
+        end = data.rfind(b'\n') + 1
+        if not end:
+            rest = data
+
+            continue
+
+        yield data[:end]
+        rest = data[end:]
+
+    if rest:
+        yield rest
+
+
+_worker_normalizer = None
+
+
+def _init_worker(normalizer):
+    global _worker_normalizer
+
+    _worker_normalizer = normalizer
+
+
+def _normalize_chunk(args):
+    chunk, first_line = args
+    if PY2:
+        return _worker_normalizer.normalize_lines(chunk, first_line)
+
+    return _worker_normalizer.normalize_lines(
+        chunk.decode('utf-8'), first_line
+    ).encode('utf-8')
+
+
+def normalize_files(files, output, normalizer, header=False,
+                    header_line=None, jobs=None, chunk_size=1 << 20):
+    """
+    Normalizes the timestamps of files, in chunks processed
+    by a pool of processes, and writes the results in order.
+
+    :param files: The binary files to read
+    :type files: list
+
+    :param output: The binary file to write to
+    :type output: file
+
+    :param normalizer: The normalizer
+    :type normalizer: Normalizer
+
+    :param header: Whether the files start with a header line,
+                   which is only written once
+    :type header: bool
+
+    :param header_line: The header line of the first file
+                        if it has already been read by read_header()
+    :type header_line: bytes or None
+
+    :param jobs: The number of processes, all CPUs by default.
+                 With 1, the chunks are processed in the current process.
+    :type jobs: int or None
+
+    :param chunk_size: The approximate size of the chunks in bytes
+    :type chunk_size: int
+    """
+    chunks = _iter_file_chunks(files, output, header, header_line, chunk_size)
+
+    if jobs == 1:
+        _init_worker(normalizer)
+        for result in map(_normalize_chunk, chunks):
+            output.write(result)
+
+        return
+
+    pool = multiprocessing.Pool(jobs, _init_worker, (normalizer,))
+    try:
+        for result in pool.imap(_normalize_chunk, chunks):
+            output.write(result)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _iter_file_chunks(files, output, header, header_line, chunk_size):
+    for i, f in enumerate(files):
+        line = 1
+        if header:
+            if i or header_line is None:
+                header_line = f.readline()
+
+            if i == 0:
+                output.write(header_line)
+
+            line += 1
+
+        for chunk in iter_chunks(f, chunk_size):
+            yield chunk, line
+
+            line += chunk.count(b'\n')
+
+
+def read_header(f, delimiter=','):
+    """
+    Reads the header line of a CSV file, to be given
+    to normalize_files() as the header_line, and its columns.
+
+    :param f: The binary file
+    :type f: file
+
+    :rtype: tuple
+    """
+    line = f.readline()
+
+    text = line.rstrip(b'\r\n')
+    if not PY2:
+        text = text.decode('utf-8')
+
+    return line, next(csv.reader([text], delimiter=delimiter), [])
@@ -2,12 +2,29 @@
 
 from __future__ import division
 
+import re
+
+from datetime import datetime
+
+from ._compat import unicode
 from .parsing import Parser as BaseParser
+from .parsing.parser import to_text, DateutilResult
+from .parsing.cache import get_cache
 from .tz import UTC
 from .pendulum import Pendulum
 from .date import Date
 from .time import Time
+from .interval import Interval
+from .period import Period
 from ._global import Global
+from .parsing.exceptions import ParserError
+from .helpers import (
+    parse_iso8601_timestamp, parse_iso8601_column, parse_iso8601_duration,
+    try_parse_rfc2822,
+    days_from_civil, civil_from_days, days_in_month
+)
+from .constants import SECS_PER_DAY, USECS_PER_SEC
+from . import _numpy
 
 
 class Parser(BaseParser):
@@ -15,6 +32,20 @@ class Parser(BaseParser):
     Parser that returns known types (Pendulum, Date, Time)
     """
 
+    def __init__(self, **options):
+        super(Parser, self).__init__(**options)
+
+        # Key identifying the options in the parse cache
+        self._cache_key = tuple(sorted(self._options.items()))
+        try:
+            hash(self._cache_key)
+        except TypeError:
+            self._cache_key = None
+
+        # Results depend on the previously parsed strings
+        if self._options['sniff']:
+            self._cache_key = None
+
     def parse(self, text):
         """
         Parses a string with the given options.
@@ -24,11 +55,80 @@ class Parser(BaseParser):
 
         :rtype: mixed
         """
+        return self._parse_object(text, self._parse)
+
+    def try_parse(self, text, default=None):
+        """
+        Parses a string with the given options
+        without raising any exception if it is invalid.
+
+        :param text: The string to parse.
+        :type text: str
+
+        :param default: The value returned for invalid strings
+        :type default: mixed
+
+        :rtype: mixed
+        """
+        try:
+            obj = self._parse_object(text, self._try_parse_valid)
+        except (ValueError, TypeError, OverflowError):
+            return default
+
+        if obj is None:
+            return default
+
+        return obj
+
+    def _try_parse_valid(self, text):
+        parsed = self._try_parse(text)
+
+        # Checking the elements rather than
+        # letting the constructors raise an error
+        if parsed is None or not _is_valid(parsed):
+            return
+
+        return parsed
+
+    def _parse_object(self, text, parse):
         # Handling special cases
         if text == 'now':
             return Pendulum.now()
 
-        parsed = super(Parser, self).parse(text)
+        cache = get_cache()
+        if (cache is None or self._cache_key is None
+                or isinstance(text, (bytearray, memoryview))):
+            parsed = parse(text)
+            if parsed is None:
+                return
+
+            return self._create_object(parsed)
+
+        # The transition rule is global but changes
+        # the instances created for ambiguous times
+        key = (text, self._cache_key, Pendulum._TRANSITION_RULE)
+        obj = cache.get(key)
+        if obj is not None:
+            return obj
+
+        parsed = parse(text)
+        if parsed is None:
+            return
+
+        obj = self._create_object(parsed)
+
+        # Strings without a date depend on the current date,
+        # which dateutil fills in whatever the options
+        if isinstance(parsed, DateutilResult):
+            return obj
+
+        if 'year' in parsed or self.is_strict() or self._options['now']:
+            cache.set(key, obj)
+
+        return obj
+
+    def _create_object(self, parsed):
+        parsed = self.normalize(parsed)
 
         if not self.is_strict():
             return self._create_pendulum_object(parsed)
@@ -68,8 +168,679 @@ class Parser(BaseParser):
         )
 
 
+class TimestampParser(BaseParser):
+    """
+    Parser that returns UTC timestamps, in microseconds,
+    without creating intermediate objects on the fast paths.
+    """
+
+    def __init__(self, tz=UTC, **options):
+        super(TimestampParser, self).__init__(**options)
+
+        # Missing date and time fields are always defaulted
+        self._options['strict'] = False
+        self._tz = Pendulum._safe_create_datetime_zone(tz)
+
+    def parse(self, text, offset=0, length=None):
+        """
+        Parses a string into a UTC timestamp.
+
+        :param text: The string to parse.
+        :type text: str or bytes or bytearray or memoryview
+
+        :param offset: The position of the string in a bytes-like object
+        :type offset: int
+
+        :param length: The length of the string in a bytes-like object
+        :type length: int or None
+
+        :rtype: int
+        """
+        local, utc_offset = self.parse_local(text, offset, length)
+
+        if utc_offset is None:
+            return self._local_to_unix(local)
+
+        return local - utc_offset * USECS_PER_SEC
+
+    def parse_local(self, text, offset=0, length=None):
+        """
+        Parses a string into a wall clock timestamp, in microseconds,
+        and the UTC offset, in seconds, if the string has one.
+
+        :param text: The string to parse.
+        :type text: str or bytes or bytearray or memoryview
+
+        :param offset: The position of the string in a bytes-like object
+        :type offset: int
+
+        :param length: The length of the string in a bytes-like object
+        :type length: int or None
+
+        :rtype: tuple
+        """
+        if offset or length is not None:
+            if isinstance(text, unicode):
+                text = _slice(text, offset, length)
+                offset, length = 0, None
+
+        if parse_iso8601_timestamp is not None:
+            try:
+                return parse_iso8601_timestamp(
+                    text, self._options['day_first'],
+                    offset, -1 if length is None else length
+                )
+            except ValueError:
+                pass
+
+        if offset or length is not None:
+            text = _slice(text, offset, length)
+
+        text = to_text(text)
+
+        if text == 'now':
+            return _numpy.datetime_to_microseconds(Pendulum.now()), 0
+
+        parsed = try_parse_rfc2822(text)
+        if parsed is not None:
+            year, month, day, hour, minute, second, utc_offset = parsed
+            microsecond = 0
+        else:
+            parsed = self.normalize(self._parse(text))
+
+            year, month, day = parsed['year'], parsed.get('month', 1), parsed.get('day', 1)
+            hour, minute, second = parsed['hour'], parsed['minute'], parsed['second']
+            microsecond = parsed['subsecond']
+            utc_offset = parsed['offset']
+            if utc_offset is not None:
+                utc_offset = int(utc_offset)
+
+        if not (_is_valid_date(year, month, day)
+                and _is_valid_time(hour, minute, second)):
+            # Lets the constructor raise the same error as parse()
+            datetime(year, month, day, hour, minute, second)
+
+        local = (
+            days_from_civil(year, month, day) * SECS_PER_DAY
+            + hour * 3600 + minute * 60 + second
+        ) * USECS_PER_SEC + microsecond
+
+        return local, utc_offset
+
+    def _local_to_unix(self, local):
+        seconds, microsecond = divmod(local, USECS_PER_SEC)
+
+        tzinfo = self._tz._get_local_tzinfo(seconds)
+        if tzinfo is not None:
+            offset = tzinfo.adjusted_offset
+
+            return local - (offset.days * SECS_PER_DAY + offset.seconds) * USECS_PER_SEC
+
+        # Close to a transition: the transition rule applies
+        days, seconds = divmod(seconds, SECS_PER_DAY)
+        minutes, second = divmod(seconds, 60)
+        dt = Pendulum(
+            *(civil_from_days(days) + divmod(minutes, 60) + (second, microsecond)),
+            tzinfo=self._tz
+        )
+
+        return _numpy.datetime_to_microseconds(dt)
+
+
+def _is_valid(parsed):
+    if 'year' in parsed:
+        if not _is_valid_date(parsed['year'], parsed.get('month', 1), parsed.get('day', 1)):
+            return False
+
+    if 'hour' in parsed:
+        if not _is_valid_time(parsed['hour'], parsed.get('minute', 0), parsed.get('second', 0)):
+            return False
+
+    return True
+
+
+def _is_valid_date(year, month, day):
+    return (1 <= year <= 9999 and 1 <= month <= 12
+            and 1 <= day <= days_in_month(year, month))
+
+
+def _is_valid_time(hour, minute, second):
+    return 0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59
+
+
+def _slice(text, offset, length):
+    end = len(text) if length is None else offset + length
+    if offset < 0 or end < offset or end > len(text):
+        raise ValueError('Offset and length are out of bounds')
+
+    return text[offset:end]
+
+
 def parse(text, **options):
     # Use the mock now value if it exists
     options['now'] = options.get('now', Global.get_test_now())
 
     return Parser(**options).parse(text)
+
+
+def try_parse(text, default=None, **options):
+    """
+    Parses a string like parse() but returns a default value
+    instead of raising an error if the string is invalid.
+
+    Invalid strings are mostly rejected without creating
+    any exception, so that they cost about as much as valid ones.
+
+    :param text: The string to parse
+    :type text: str
+
+    :param default: The value returned for invalid strings
+    :type default: mixed
+
+    :param options: The parsing options
+    :type options: dict
+
+    :rtype: mixed
+    """
+    options['now'] = options.get('now', Global.get_test_now())
+
+    return Parser(**options).try_parse(text, default)
+
+
+_PARSE_ERRORS = ['raise', 'skip', 'none']
+
+
+def parse_many(texts, lazy=False, errors='raise', **options):
+    """
+    Parses strings with the same options.
+
+    The parser, and the timezone if any, are created
+    only once for the whole batch.
+
+    :param texts: The strings to parse
+    :type texts: iterable
+
+    :param lazy: Whether to return a generator instead of a list
+    :type lazy: bool
+
+    :param errors: What to do with invalid strings:
+                   "raise" to raise the error,
+                   "skip" to leave them out
+                   or "none" to replace them by None
+    :type errors: str
+
+    :param options: The parsing options
+    :type options: dict
+
+    :rtype: list or generator
+    """
+    if errors not in _PARSE_ERRORS:
+        raise ValueError('Invalid errors value "{}" for parse_many()'.format(errors))
+
+    options['now'] = options.get('now', Global.get_test_now())
+    if 'tz' in options:
+        options['tz'] = Pendulum._safe_create_datetime_zone(options['tz'])
+
+    parsed = _iter_parse(Parser(**options), texts, errors)
+
+    if lazy:
+        return parsed
+
+    return list(parsed)
+
+
+def _iter_parse(parser, texts, errors):
+    if errors == 'raise':
+        for text in texts:
+            yield parser.parse(text)
+
+        return
+
+    for text in texts:
+        parsed = parser.try_parse(text, _INVALID)
+        if parsed is _INVALID:
+            if errors == 'skip':
+                continue
+
+            parsed = None
+
+        yield parsed
+
+
+# Marker of the invalid strings in parse_many()
+_INVALID = object()
+
+
+def parse_duration(text):
+    """
+    Parses an ISO 8601 duration, like P3DT4H or PT15M, into an Interval.
+
+    Since the length of years and months depends on the calendar,
+    durations with years or months can only be parsed
+    as part of an interval with parse_interval().
+
+    :param text: The string to parse
+    :type text: str
+
+    :rtype: Interval
+    """
+    years, months, weeks, days, hours, minutes, seconds, microseconds = (
+        _parse_duration_units(text)
+    )
+    if years or months:
+        raise ParserError(
+            'Durations with years or months cannot be converted '
+            'to an Interval, use parse_interval() instead: {}'.format(text)
+        )
+
+    return Interval(
+        weeks=weeks, days=days, hours=hours, minutes=minutes,
+        seconds=seconds, microseconds=microseconds
+    )
+
+
+def parse_interval(text, tz=UTC, **options):
+    """
+    Parses an ISO 8601 interval into a Period.
+
+    Intervals are given by their start and end (2017-01-01/2017-02-01),
+    their start and duration (2017-01-01T00:00Z/P1M)
+    or their duration and end (P1DT12H/2017-01-01).
+    The end may leave out the components it shares with the start,
+    like a time on the same day (2017-01-01T10:00/12:30)
+    or a date in the same year (2008-02-15/03-14),
+    and is in the timezone of the start if it has no offset.
+
+    :param text: The string to parse
+    :type text: str
+
+    :param tz: The timezone of the dates without offset
+    :type tz: Timezone or TimezoneInfo or str or int or None
+
+    :param options: The parsing options of the dates
+    :type options: dict
+
+    :rtype: Period
+    """
+    text = to_text(text)
+    parts = text.split('/')
+    if len(parts) != 2:
+        raise ParserError('Invalid ISO 8601 interval: {}'.format(text))
+
+    start_text, end_text = parts
+    start_is_duration = start_text.startswith('P')
+    end_is_duration = end_text.startswith('P')
+    if start_is_duration and end_is_duration:
+        raise ParserError('Invalid ISO 8601 interval: {}'.format(text))
+
+    options['now'] = options.get('now', Global.get_test_now())
+    options['tz'] = Pendulum._safe_create_datetime_zone(tz)
+    options['strict'] = False
+    parser = Parser(**options)
+
+    if start_is_duration:
+        end = parser.parse(end_text)
+        start = end.subtract(**_duration_units(start_text))
+    elif end_is_duration:
+        start = parser.parse(start_text)
+        end = start.add(**_duration_units(end_text))
+    else:
+        start = parser.parse(start_text)
+        end = _parse_interval_end(end_text, start_text, start, options)
+
+    return Period(start, end)
+
+
+def _parse_interval_end(text, start_text, start, options):
+    # The components missing from the end, its timezone included,
+    # are those of the start (ISO 8601 4.4.5)
+    options['strict'] = True
+    options['tz'] = start.tz
+
+    date_text, _, time_text = text.partition('T')
+    if not time_text and ':' in date_text:
+        # A time on the same day, like 12:30
+        date_text, time_text = '', date_text
+
+    start_date_text = re.split('[T ]', start_text, 1)[0]
+    cut = len(start_date_text) - len(date_text)
+    if not (date_text or time_text) or 0 < cut < len(start_date_text):
+        # The end only has the lower order components, like 03-14
+        if cut < 4 or not (
+                start_date_text[cut - 1] == '-'
+                or '-' not in start_date_text and cut in (4, 6)):
+            raise ParserError('Invalid ISO 8601 interval end: {}'.format(text))
+
+    date_text = start_date_text[:max(cut, 0)] + date_text
+
+    if time_text:
+        date_text += 'T' + time_text
+
+    end = Parser(**options).parse(date_text)
+    if not isinstance(end, Pendulum):
+        return Pendulum(end.year, end.month, end.day, tzinfo=start.tz)
+
+    return end
+
+
+_DURATION_UNITS = (
+    'years', 'months', 'weeks', 'days',
+    'hours', 'minutes', 'seconds', 'microseconds'
+)
+
+
+def _duration_units(text):
+    return dict(zip(_DURATION_UNITS, _parse_duration_units(text)))
+
+
+def _parse_duration_units(text):
+    text = to_text(text)
+
+    try:
+        return parse_iso8601_duration(text)
+    except ValueError as e:
+        raise ParserError('{}: {}'.format(e, text))
+
+
+def parse_durations(texts, lazy=False, errors='raise'):
+    """
+    Parses ISO 8601 durations into Intervals, like parse_duration().
+
+    :param texts: The strings to parse
+    :type texts: iterable
+
+    :param lazy: Whether to return a generator instead of a list
+    :type lazy: bool
+
+    :param errors: What to do with invalid strings:
+                   "raise" to raise the error,
+                   "skip" to leave them out
+                   or "none" to replace them by None
+    :type errors: str
+
+    :rtype: list or generator
+    """
+    if errors not in _PARSE_ERRORS:
+        raise ValueError('Invalid errors value "{}" for parse_durations()'.format(errors))
+
+    parsed = _iter_parse_each(parse_duration, texts, errors)
+
+    if lazy:
+        return parsed
+
+    return list(parsed)
+
+
+def parse_intervals(texts, tz=UTC, lazy=False, errors='raise', **options):
+    """
+    Parses ISO 8601 intervals with the same options
+    into Periods, like parse_interval().
+
+    :param texts: The strings to parse
+    :type texts: iterable
+
+    :param tz: The timezone of the dates without offset
+    :type tz: Timezone or TimezoneInfo or str or int or None
+
+    :param lazy: Whether to return a generator instead of a list
+    :type lazy: bool
+
+    :param errors: What to do with invalid strings:
+                   "raise" to raise the error,
+                   "skip" to leave them out
+                   or "none" to replace them by None
+    :type errors: str
+
+    :param options: The parsing options of the dates
+    :type options: dict
+
+    :rtype: list or generator
+    """
+    if errors not in _PARSE_ERRORS:
+        raise ValueError('Invalid errors value "{}" for parse_intervals()'.format(errors))
+
+    options['now'] = options.get('now', Global.get_test_now())
+    tz = Pendulum._safe_create_datetime_zone(tz)
+
+    parsed = _iter_parse_each(
+        lambda text: parse_interval(text, tz, **options), texts, errors
+    )
+
+    if lazy:
+        return parsed
+
+    return list(parsed)
+
+
+def _iter_parse_each(parse, texts, errors):
+    for text in texts:
+        try:
+            parsed = parse(text)
+        except (ValueError, OverflowError):
+            if errors == 'raise':
+                raise
+
+            if errors == 'skip':
+                continue
+
+            parsed = None
+
+        yield parsed
+
+
+def parse_timestamp(text, tz=UTC, unit='us', offset=0, length=None, **options):
+    """
+    Parses a string into a UTC timestamp
+    without creating a Pendulum instance.
+
+    Strings without offset are considered to be in the given timezone.
+
+    ISO 8601 strings can be parsed in place from bytes-like objects,
+    like memory-mapped files, at the given offset.
+
+    :param text: The string to parse
+    :type text: str or bytes or bytearray or memoryview
+
+    :param tz: The timezone
+    :type tz: Timezone or TimezoneInfo or str or int or None
+
+    :param unit: The unit of the timestamp ("s", "ms" or "us")
+    :type unit: str
+
+    :param offset: The position of the string in a bytes-like object
+    :type offset: int
+
+    :param length: The length of the string in a bytes-like object,
+                   up to its end by default
+    :type length: int or None
+
+    :param options: The parsing options
+    :type options: dict
+
+    :rtype: int
+    """
+    if unit not in Pendulum._TIMESTAMP_UNITS:
+        raise ValueError('Invalid unit "{}" for parse_timestamp()'.format(unit))
+
+    options['now'] = options.get('now', Global.get_test_now())
+    timestamp = TimestampParser(tz, **options).parse(text, offset, length)
+
+    return timestamp // (USECS_PER_SEC // Pendulum._TIMESTAMP_UNITS[unit])
+
+
+def parse_timestamps(texts, tz=UTC, unit='us', errors='raise', **options):
+    """
+    Parses strings into a NumPy int64 array of UTC timestamps.
+
+    Strings without offset are considered to be in the given timezone,
+    whose offsets are looked up for the whole batch at once.
+
+    :param texts: The strings to parse
+    :type texts: iterable
+
+    :param tz: The timezone
+    :type tz: Timezone or TimezoneInfo or str or int or None
+
+    :param unit: The unit of the timestamps ("s", "ms" or "us")
+    :type unit: str
+
+    :param errors: What to do with invalid strings:
+                   "raise" to raise the error,
+                   "skip" to leave them out
+                   or "none" to replace them by the NaT value
+    :type errors: str
+
+    :param options: The parsing options
+    :type options: dict
+
+    :rtype: numpy.ndarray
+    """
+    numpy = _numpy.require_numpy()
+
+    if unit not in Pendulum._TIMESTAMP_UNITS:
+        raise ValueError('Invalid unit "{}" for parse_timestamps()'.format(unit))
+
+    if errors not in _PARSE_ERRORS:
+        raise ValueError('Invalid errors value "{}" for parse_timestamps()'.format(errors))
+
+    options['now'] = options.get('now', Global.get_test_now())
+    parser = TimestampParser(tz, **options)
+
+    locals_ = []
+    offsets = []
+    for text in texts:
+        try:
+            local, offset = parser.parse_local(text)
+        except (ValueError, TypeError):
+            if errors == 'raise':
+                raise
+
+            if errors == 'skip':
+                continue
+
+            local, offset = _numpy.NAT, 0
+
+        locals_.append(local)
+        offsets.append(_NO_OFFSET if offset is None else offset)
+
+    return _to_timestamps(
+        parser._tz,
+        numpy.array(locals_, dtype='int64'),
+        numpy.array(offsets, dtype='int64'),
+        unit
+    )
+
+
+def parse_timestamp_column(buffer, starts, width, tz=UTC, unit='us',
+                           errors='raise', **options):
+    """
+    Parses the strings of the same width found at the given positions
+    of a bytes-like object, like a memory-mapped file,
+    into a NumPy int64 array of UTC timestamps.
+
+    ISO 8601 strings are parsed in place,
+    without creating intermediate string objects.
+
+    :param buffer: The bytes-like object
+    :type buffer: bytes or bytearray or memoryview or mmap.mmap
+
+    :param starts: The positions of the strings
+    :type starts: numpy.ndarray or iterable
+
+    :param width: The length of the strings
+    :type width: int
+
+    :param tz: The timezone
+    :type tz: Timezone or TimezoneInfo or str or int or None
+
+    :param unit: The unit of the timestamps ("s", "ms" or "us")
+    :type unit: str
+
+    :param errors: What to do with invalid strings:
+                   "raise" to raise the error,
+                   "skip" to leave them out
+                   or "none" to replace them by the NaT value
+    :type errors: str
+
+    :param options: The parsing options
+    :type options: dict
+
+    :rtype: numpy.ndarray
+    """
+    numpy = _numpy.require_numpy()
+
+    if unit not in Pendulum._TIMESTAMP_UNITS:
+        raise ValueError('Invalid unit "{}" for parse_timestamp_column()'.format(unit))
+
+    if errors not in _PARSE_ERRORS:
+        raise ValueError('Invalid errors value "{}" for parse_timestamp_column()'.format(errors))
+
+    options['now'] = options.get('now', Global.get_test_now())
+    parser = TimestampParser(tz, **options)
+
+    starts = numpy.ascontiguousarray(starts, dtype='int64').ravel()
+    locals_ = numpy.empty(len(starts), dtype='int64')
+    offsets = numpy.empty(len(starts), dtype='int64')
+
+    if parse_iso8601_column is not None:
+        parse_iso8601_column(
+            buffer, starts, width, locals_, offsets, parser._options['day_first']
+        )
+    else:
+        locals_.fill(_numpy.NAT)
+
+    # Strings which are not ISO 8601 go through the regular parser
+    view = memoryview(buffer)
+    valid = numpy.ones(len(starts), dtype=bool)
+    for i in numpy.flatnonzero(locals_ == _numpy.NAT).tolist():
+        try:
+            local, offset = parser.parse_local(view, int(starts[i]), width)
+        except (ValueError, TypeError):
+            if errors == 'raise':
+                raise
+
+            valid[i] = False
+            offsets[i] = 0
+
+            continue
+
+        locals_[i] = local
+        offsets[i] = _NO_OFFSET if offset is None else offset
+
+    timestamps = _to_timestamps(parser._tz, locals_, offsets, unit)
+
+    if errors == 'skip':
+        return timestamps[valid]
+
+    return timestamps
+
+
+# Offset of the strings without UTC offset in the offsets arrays
+_NO_OFFSET = _numpy.NAT
+
+
+def _to_timestamps(tz, locals_, offsets, unit):
+    """
+    Converts wall clock microseconds and UTC offsets
+    to timestamps in the given unit.
+
+    The strings without UTC offset are considered to be in the given timezone
+    and NaT values are kept as they are.
+
+    :rtype: numpy.ndarray
+    """
+    nat = locals_ == _numpy.NAT
+    naive = (offsets == _NO_OFFSET) & ~nat
+    offsets[nat] = 0
+
+    if naive.any():
+        seconds = locals_[naive] // USECS_PER_SEC
+        offsets[naive] = seconds - _numpy.unix_from_local(
+            seconds, tz, Pendulum._TRANSITION_RULE
+        )
+
+    timestamps = locals_ - offsets * USECS_PER_SEC
+    timestamps //= USECS_PER_SEC // Pendulum._TIMESTAMP_UNITS[unit]
+    timestamps[nat] = _numpy.NAT
+
+    return timestamps
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from .parser import Parser
+from .cache import enable_cache, disable_cache, cache_info
 
 
 def parse(text, **options):
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses max_size size')
+
+
+class ParseCache(object):
+    """
+    Bounded cache of parsed objects
+    discarding the least recently used ones first.
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        Constructor.
+
+        :param max_size: The maximum number of cached objects
+        :type max_size: int
+        """
+        if max_size < 1:
+            raise ValueError('The cache size must be positive.')
+
+        self._max_size = max_size
+        self._items = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def get(self, key):
+        """
+        Returns the object cached for the given key, if any,
+        and marks it as the most recently used.
+
+        :param key: The key
+        :type key: tuple
+
+        :rtype: mixed or None
+        """
+        try:
+            value = self._items.pop(key)
+        except KeyError:
+            self._misses += 1
+
+            return
+
+        self._items[key] = value
+        self._hits += 1
+
+        return value
+
+    def set(self, key, value):
+        """
+        Caches an object.
+
+        :param key: The key
+        :type key: tuple
+
+        :param value: The object to cache
+        :type value: mixed
+        """
+        self._items.pop(key, None)
+        self._items[key] = value
+
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes the cached objects and resets the statistics.
+        """
+        self._items.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self):
+        """
+        Returns the cache statistics.
+
+        :rtype: CacheInfo
+        """
+        return CacheInfo(self._hits, self._misses, self._max_size, len(self))
+
+    def __len__(self):
+        return len(self._items)
+
+
+_cache = None
+
+
+def enable_cache(max_size=1024):
+    """
+    Enables the cache of parsed objects.
+
+    Parsing the same string with the same options
+    then returns the same instance.
+
+    :param max_size: The maximum number of cached objects
+    :type max_size: int
+    """
+    global _cache
+
+    _cache = ParseCache(max_size)
+
+
+def disable_cache():
+    """
+    Disables the cache of parsed objects.
+    """
+    global _cache
+
+    _cache = None
+
+
+def get_cache():
+    """
+    Returns the cache of parsed objects, if enabled.
+
+    :rtype: ParseCache or None
+    """
+    return _cache
+
+
+def cache_info():
+    """
+    Returns the statistics of the cache of parsed objects, if enabled.
+
+    :rtype: CacheInfo or None
+    """
+    if _cache is None:
+        return
+
+    return _cache.info()
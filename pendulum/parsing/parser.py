@@ -2,12 +2,70 @@
 
 import re
 import copy
+import functools
 
 from datetime import datetime, date, time
 from dateutil import parser
 
-from ..helpers import parse_iso8601, week_day, days_in_year
+from .._compat import PY2, decode
+from ..helpers import (
+    try_parse_iso8601, scan_iso8601, try_parse_rfc2822, week_day, days_in_year
+)
 from .exceptions import ParserError
+from .sniffing import guess_format, guess_day_month_order
+from ..formatting import compile_format
+from ..tz.abbreviations import resolve_abbreviation
+
+
+def to_text(text):
+    """
+    Decodes bytes-like objects, which are only
+    natively supported by the ISO 8601 scanner.
+
+    :type text: str or bytes or bytearray or memoryview
+
+    :rtype: str
+    """
+    if isinstance(text, (bytearray, memoryview)):
+        text = bytes(text)
+
+    if not PY2 and isinstance(text, bytes):
+        text = decode(text)
+
+    return text
+
+
+# The dateutil parser needs at least a number, a month or a weekday
+_DIGIT = re.compile(r'\d', re.UNICODE)
+_WORDS = re.compile(r'[^\W\d_]+', re.UNICODE)
+_DATEUTIL_INFO = parser.parserinfo()
+
+
+class DateutilResult(dict):
+    """
+    Elements parsed by dateutil, which fills in the date elements
+    missing from the string with the current date.
+    """
+
+
+def may_have_date(text):
+    """
+    Checks whether the dateutil parser can find a date in a string,
+    to reject the strings it can't without calling it.
+
+    :type text: str
+
+    :rtype: bool
+    """
+    if _DIGIT.search(text):
+        return True
+
+    for word in _WORDS.findall(text):
+        if (_DATEUTIL_INFO.month(word) is not None
+                or _DATEUTIL_INFO.weekday(word) is not None):
+            return True
+
+    return False
 
 
 class Parser(object):
@@ -59,13 +117,23 @@ class Parser(object):
         'day_first': False,
         'year_first': True,
         'strict': False,
-        'now': None
+        'now': None,
+        'sniff': False,
+        'region': None
     }
 
     def __init__(self, **options):
         self._options = copy.copy(self.DEFAULT_OPTIONS)
         self._options.update(options)
 
+        # Strategy which parsed the last string in sniffing mode,
+        # tried first for the next ones
+        self._sniffed = None
+
+        # Order of the numeric day and month of the strings
+        # parsed in sniffing mode, which layouts must then follow
+        self._day_month_order = None
+
     def is_strict(self):
         return self._options['strict']
 
@@ -276,6 +344,26 @@ class Parser(object):
         """
         return self.normalize(self._parse(text))
 
+    def try_parse(self, text):
+        """
+        Parses a string with the given options
+        without raising any exception if it is invalid.
+
+        :param text: The string to parse.
+        :type text: str
+
+        :rtype: dict or None
+        """
+        try:
+            parsed = self._try_parse(text)
+        except (ValueError, TypeError, OverflowError):
+            return
+
+        if parsed is None:
+            return
+
+        return self.normalize(parsed)
+
     def normalize(self, parsed):
         """
         Normalizes the parsed element.
@@ -314,17 +402,137 @@ class Parser(object):
         return default
 
     def _parse(self, text):
-        # Trying to parse ISO8601 with C extension
+        parsed = self._try_parse(text)
+        if parsed is None:
+            raise ParserError('Invalid date string: {}'.format(text))
+
+        return parsed
+
+    def _try_parse(self, text):
+        """
+        Parses a string, invalid strings returning None.
+
+        The C scanners and the check made before calling dateutil
+        reject most of them without creating any exception.
+
+        :rtype: dict or None
+        """
+        if self._sniffed is not None:
+            try:
+                parsed = self._sniffed(to_text(text))
+            except ValueError:
+                parsed = None
+
+            if parsed:
+                return parsed
+
+        # Trying to parse ISO8601 natively
         parsed = self._parse_iso8601(text)
         if parsed:
+            # Always tried first anyway
+            self._sniffed = None
+
             return parsed
 
+        text = to_text(text)
+
         parsed = self.parse_common(text)
         if parsed:
-            return parsed
+            return self._sniff(self.parse_common, parsed)
+
+        # Trying to parse RFC 2822 and HTTP dates
+        parsed = self._parse_rfc2822(text)
+        if parsed:
+            return self._sniff(self._parse_rfc2822, parsed)
+
+        # Trying to parse strings ending with a timezone abbreviation
+        parsed = self._parse_abbreviated(text)
+        if parsed:
+            return self._sniff(self._parse_abbreviated, parsed)
 
         # We couldn't parse the string
         # so we fallback on the dateutil parser
+        parsed = self._parse_dateutil(text)
+        if parsed is None or not self._options['sniff']:
+            return parsed
+
+        # Strings already parsed in a day and month order
+        # must not be read the other way round by a layout,
+        # the current one being kept
+        order = guess_day_month_order(text, parsed)
+        if order is not None:
+            if self._day_month_order is None:
+                self._day_month_order = order
+            elif order != self._day_month_order:
+                return parsed
+
+        # The layout of the string is tried first for the next ones,
+        # if it can be guessed, to spare the dateutil parser
+        fmt = guess_format(text, parsed)
+        if fmt is not None:
+            strategy = functools.partial(
+                self._parse_format,
+                compile_format(fmt, 'classic', 'en')
+            )
+
+            try:
+                if strategy(text) == parsed:
+                    return self._sniff(strategy, parsed)
+            except ValueError:
+                pass
+
+        # The whole cascade is tried again for the next ones
+        return self._sniff(None, parsed)
+
+    def _sniff(self, strategy, parsed):
+        if self._options['sniff']:
+            self._sniffed = strategy
+
+        return parsed
+
+    def _parse_abbreviated(self, text):
+        """
+        Parses a string ending with a timezone abbreviation,
+        like 2017-03-01 10:00 CEST, resolved through the abbreviation index.
+
+        :rtype: dict or None
+        """
+        head, _, abbreviation = text.rpartition(' ')
+        if not head or not abbreviation.isalpha():
+            return
+
+        resolved = resolve_abbreviation(abbreviation, self._options['region'])
+        if resolved is None:
+            return
+
+        try:
+            parsed = (
+                self._parse_iso8601(head)
+                or self.parse_common(head)
+                or self._parse_rfc2822(head)
+                or self._parse_dateutil(head)
+            )
+        except ValueError:
+            return
+
+        # The abbreviation only makes sense for a time without offset
+        if not parsed or 'hour' not in parsed or parsed.get('offset') is not None:
+            return
+
+        # Times are created without offset in strict mode
+        if self.is_strict() and 'year' not in parsed:
+            raise ParserError(
+                'Timezone abbreviations need a date in strict mode: {}'.format(text)
+            )
+
+        parsed['offset'] = resolved.offset
+
+        return parsed
+
+    def _parse_dateutil(self, text):
+        if not may_have_date(text):
+            return
+
         try:
             dt = parser.parse(
                 text,
@@ -332,26 +540,39 @@ class Parser(object):
                 yearfirst=self._options['year_first']
             )
         except ValueError:
-            raise ParserError('Invalid date string: {}'.format(text))
+            return
+
+        return DateutilResult(
+            year=dt.year,
+            month=dt.month,
+            day=dt.day,
+            hour=dt.hour,
+            minute=dt.minute,
+            second=dt.second,
+            subsecond=dt.microsecond,
+            offset=dt.utcoffset().total_seconds() if dt.tzinfo else None,
+        )
+
+    def _parse_format(self, compiled, text):
+        parsed = compiled.parse(text)
 
         return {
-            'year': dt.year,
-            'month': dt.month,
-            'day': dt.day,
-            'hour': dt.hour,
-            'minute': dt.minute,
-            'second': dt.second,
-            'subsecond': dt.microsecond,
-            'offset': dt.utcoffset().total_seconds() if dt.tzinfo else None,
+            'year': parsed['year'],
+            'month': parsed['month'],
+            'day': parsed['day'],
+            'hour': parsed['hour'],
+            'minute': parsed['minute'],
+            'second': parsed['second'],
+            'subsecond': parsed['microsecond'],
+            'offset': parsed.get('offset')
         }
 
     def _parse_iso8601(self, text):
-        if not parse_iso8601:
-            return
+        if scan_iso8601 is not None:
+            return self._scan_iso8601(text)
 
-        try:
-            dt = parse_iso8601(text, self._options['day_first'])
-        except ValueError:
+        dt = try_parse_iso8601(text, self._options['day_first'])
+        if dt is None:
             return
 
         if isinstance(dt, time):
@@ -380,3 +601,57 @@ class Parser(object):
         }
 
         return parsed
+
+    def _scan_iso8601(self, text):
+        # Without the C extension, the fields of the pure Python scanner
+        # are used as they are rather than through date objects
+        parsed = scan_iso8601(text, self._options['day_first'])
+        if parsed is None:
+            return
+
+        (year, month, day, hour, minute, second,
+         microsecond, offset, has_time, ambiguous_date) = parsed
+
+        if not has_time:
+            if ambiguous_date:
+                return {
+                    'hour': year // 100,
+                    'minute': year % 100,
+                    'second': month,
+                    'subsecond': 0
+                }
+
+            return {
+                'year': year,
+                'month': month,
+                'day': day
+            }
+
+        return {
+            'year': year,
+            'month': month,
+            'day': day,
+            'hour': hour,
+            'minute': minute,
+            'second': second,
+            'subsecond': microsecond,
+            'offset': offset
+        }
+
+    def _parse_rfc2822(self, text):
+        parsed = try_parse_rfc2822(text)
+        if parsed is None:
+            return
+
+        year, month, day, hour, minute, second, offset = parsed
+
+        return {
+            'year': year,
+            'month': month,
+            'day': day,
+            'hour': hour,
+            'minute': minute,
+            'second': second,
+            'subsecond': 0,
+            'offset': offset
+        }
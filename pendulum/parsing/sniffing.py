@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+_TOKENS = re.compile(r'([0-9]+|[^\W\d_]+)', re.UNICODE)
+
+_MONTHS = [
+    'january', 'february', 'march', 'april', 'may', 'june', 'july',
+    'august', 'september', 'october', 'november', 'december'
+]
+
+_DAYS = [
+    'monday', 'tuesday', 'wednesday', 'thursday',
+    'friday', 'saturday', 'sunday'
+]
+
+# Names and the directive and value they stand for,
+# full names taking precedence over abbreviations (May)
+_NAMES = {}
+for _i, _name in enumerate(_MONTHS):
+    _NAMES[_name[:3]] = ('b', _i + 1)
+
+for _i, _name in enumerate(_MONTHS):
+    _NAMES[_name] = ('B', _i + 1)
+
+for _i, _name in enumerate(_DAYS):
+    _NAMES[_name[:3]] = ('a', _i)
+    _NAMES[_name] = ('A', _i)
+
+_NAMES['am'] = _NAMES['pm'] = ('p', None)
+
+
+def guess_format(text, parsed):
+    """
+    Guesses the strptime() format of a string
+    from the elements it has been parsed into.
+
+    Only formats with a complete date whose numbers
+    can each be attributed to a single element are guessed,
+    so that other strings of the same format are parsed the same way.
+    Neither are formats with a numeric day and month both up to 12,
+    which could have been read the other way round.
+
+    :param text: The parsed string
+    :type text: str
+
+    :param parsed: The parsed elements
+    :type parsed: dict
+
+    :rtype: str or None
+    """
+    fmt = _guess_format(text, parsed)
+    if (fmt is not None and day_month_order(fmt) is not None
+            and parsed['day'] <= 12 and parsed['month'] <= 12):
+        return
+
+    return fmt
+
+
+def guess_day_month_order(text, parsed):
+    """
+    Guesses the order of the numeric day and month of a string
+    from the elements it has been parsed into.
+
+    :param text: The parsed string
+    :type text: str
+
+    :param parsed: The parsed elements
+    :type parsed: dict
+
+    :return: "dm" for the day first, "md" for the month first
+             or None if it can't be told
+    :rtype: str or None
+    """
+    fmt = _guess_format(text, parsed)
+    if fmt is None:
+        return
+
+    return day_month_order(fmt)
+
+
+def day_month_order(fmt):
+    """
+    Returns the order of the numeric day and month of a strptime() format.
+
+    :param fmt: The format
+    :type fmt: str
+
+    :return: "dm" for the day first, "md" for the month first
+             or None if it has no numeric day and month
+    :rtype: str or None
+    """
+    day = fmt.find('%d')
+    month = fmt.find('%m')
+    if day < 0 or month < 0:
+        return
+
+    return 'dm' if day < month else 'md'
+
+
+def _guess_format(text, parsed):
+    pieces = _TOKENS.split(text)
+
+    hour = parsed['hour']
+    meridian = any(p.lower() in ('am', 'pm') for p in pieces[1::2])
+    if meridian:
+        hour = hour % 12 or 12
+
+    dates = [
+        ('d', parsed['day']), ('m', parsed['month']), ('y', parsed['year'] % 100)
+    ]
+    times = [('H', hour), ('M', parsed['minute']), ('S', parsed['second'])]
+    offset = parsed.get('offset')
+
+    fmt = [_escape(pieces[0])]
+    used = set()
+    i = 1
+    while i < len(pieces):
+        token, literal = pieces[i], pieces[i + 1]
+        directive = None
+
+        if not token.isdigit():
+            directive, value = _NAMES.get(token.lower(), (None, None))
+            if directive in ('B', 'b') and value != parsed['month']:
+                directive = None
+
+            if directive in ('B', 'b'):
+                used.add('m')
+        elif fmt[-1].endswith(('.', ',')) and 'S' in used:
+            if len(token) <= 6 and int(token.ljust(6, '0')) == parsed['subsecond']:
+                directive = 'f'
+        elif fmt[-1].endswith(('+', '-')) and 'H' in used and offset is not None:
+            # UTC offset like +0200 or +02:00
+            if len(token) == 2 and literal == ':' and i + 2 < len(pieces):
+                token += pieces[i + 2]
+                literal = pieces[i + 3]
+                i += 2
+
+            if len(token) == 4:
+                sign = -1 if fmt[-1].endswith('-') else 1
+                if sign * (int(token[:2]) * 3600 + int(token[2:]) * 60) == offset:
+                    fmt[-1] = fmt[-1][:-1]
+                    directive = 'z'
+                    offset = None
+        elif len(token) == 4:
+            if 'y' not in used and int(token) == parsed['year']:
+                directive = 'Y'
+                used.add('y')
+        elif len(token) <= 2:
+            value = int(token)
+
+            # Date numbers must be unambiguous
+            candidates = [
+                name for name, v in dates
+                if name not in used and v == value
+                and (name != 'y' or len(token) == 2)
+            ]
+            if len(candidates) == 1:
+                directive = candidates[0]
+            elif not candidates:
+                # Time numbers are always in the same order
+                for name, v in times:
+                    if name not in used:
+                        if v == value:
+                            directive = name
+
+                        break
+
+            if directive == 'H' and meridian:
+                used.add('H')
+                directive = 'I'
+
+        if directive is None:
+            return
+
+        used.add(directive)
+        fmt.append('%' + directive + _escape(literal))
+        i += 2
+
+    if not used.issuperset('dmy') or offset is not None:
+        return
+
+    return ''.join(fmt)
+
+
+def _escape(literal):
+    return literal.replace('%', '%%')
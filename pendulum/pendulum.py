@@ -2,7 +2,6 @@
 
 from __future__ import division
 
-import calendar
 import datetime
 
 from .date import Date
@@ -11,14 +10,24 @@ from .period import Period
 from .exceptions import PendulumException
 from .tz import Timezone, UTC, FixedTimezone, local_timezone
 from .tz.timezone_info import TimezoneInfo
+from . import _numpy
 from .parsing import parse
-from .helpers import add_duration
+from .formatting import compile_format
+from .helpers import (
+    add_duration, local_time, floor_local, ceil_local, ROUNDING_UNITS,
+    days_in_month, days_from_civil, civil_from_days,
+    next_day_of_week, previous_day_of_week,
+    nth_day_of_week, last_day_of_week,
+    format_iso8601, format_iso8601_many, native_format_iso8601
+)
 from .constants import (
     YEARS_PER_CENTURY, YEARS_PER_DECADE,
     MONTHS_PER_YEAR,
     MINUTES_PER_HOUR, SECONDS_PER_MINUTE,
     SECONDS_PER_DAY,
-    SUNDAY, SATURDAY
+    SUNDAY, SATURDAY,
+    EPOCH_ORDINAL, USECS_PER_SEC,
+    RFC3339, RFC3339_EXTENDED
 )
 
 
@@ -43,6 +52,12 @@ class Pendulum(Date, datetime.datetime):
 
     _TRANSITION_RULE = Timezone.POST_TRANSITION
 
+    _TIMESTAMP_UNITS = {
+        's': 1,
+        'ms': 1000,
+        'us': USECS_PER_SEC,
+    }
+
     _MODIFIERS_VALID_UNITS = [
         'second', 'minute', 'hour',
         'day', 'week', 'month', 'year',
@@ -373,10 +388,13 @@ class Pendulum(Date, datetime.datetime):
         return cls.instance(dt, tz)
 
     @classmethod
-    def create_from_format(cls, time, fmt, tz=UTC):
+    def create_from_format(cls, time, fmt, tz=UTC,
+                           formatter='classic', locale=None):
         """
         Create a Pendulum instance from a specific format.
 
+        The format is compiled once and cached.
+
         :param fmt: The format
         :type fmt: str
 
@@ -386,11 +404,30 @@ class Pendulum(Date, datetime.datetime):
         :param tz: The timezone
         :type tz: tzinfo or str or int or None
 
+        :param formatter: The formatter the format is written for
+        :type formatter: str
+
+        :param locale: The locale of the localized tokens
+        :type locale: str or None
+
         :rtype: Pendulum
         """
-        dt = datetime.datetime.strptime(time, fmt)
+        parsed = compile_format(fmt, formatter, locale).parse(time)
 
-        return cls.instance(dt, tz)
+        if 'timezone' in parsed:
+            tz = parsed['timezone']
+        elif 'offset' in parsed:
+            tz = FixedTimezone.load(parsed['offset'])
+
+        if 'timestamp' in parsed:
+            return cls.create_from_timestamp(parsed['timestamp'], tz)
+
+        return cls(
+            parsed['year'], parsed['month'], parsed['day'],
+            parsed['hour'], parsed['minute'], parsed['second'],
+            parsed['microsecond'],
+            tzinfo=tz
+        )
 
     @classmethod
     def create_from_timestamp(cls, timestamp, tz=UTC):
@@ -405,17 +442,189 @@ class Pendulum(Date, datetime.datetime):
 
         :rtype: Pendulum
         """
-        dt = datetime.datetime.utcfromtimestamp(timestamp).replace(tzinfo=UTC)
-        instance = cls(
-            dt.year, dt.month, dt.day,
-            dt.hour, dt.minute, dt.second, dt.microsecond,
-            dt.tzinfo
+        seconds, microsecond = cls._split_timestamp(timestamp, 's')
+
+        return cls._create_from_unix_time(
+            seconds, microsecond, cls._safe_create_datetime_zone(tz)
+        )
+
+    @classmethod
+    def from_timestamps(cls, timestamps, tz=UTC, unit='s', lazy=False):
+        """
+        Create Pendulum instances from a batch of timestamps.
+
+        The timezone is resolved only once and sorted timestamps
+        reuse the previously found transition.
+
+        :param timestamps: The timestamps (an iterable or a NumPy array)
+        :type timestamps: iterable
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :param unit: The unit of the timestamps: s, ms or us
+        :type unit: str
+
+        :param lazy: Whether to return a generator instead of a list
+        :type lazy: bool
+
+        :rtype: list or generator
+        """
+        if unit not in cls._TIMESTAMP_UNITS:
+            raise ValueError('Invalid unit "{}" for from_timestamps()'.format(unit))
+
+        if hasattr(timestamps, 'tolist'):
+            # NumPy arrays
+            timestamps = timestamps.tolist()
+
+        instances = cls._iter_from_timestamps(
+            timestamps, cls._safe_create_datetime_zone(tz), unit
+        )
+
+        if lazy:
+            return instances
+
+        return list(instances)
+
+    @classmethod
+    def _iter_from_timestamps(cls, timestamps, tz, unit):
+        for timestamp in timestamps:
+            seconds, microsecond = cls._split_timestamp(timestamp, unit)
+
+            yield cls._create_from_unix_time(seconds, microsecond, tz)
+
+    @classmethod
+    def from_fields(cls, fields, tz=UTC, lazy=False):
+        """
+        Create Pendulum instances from a batch of
+        (year, month, day[, hour[, minute[, second[, microsecond]]]]) tuples.
+
+        The timezone is resolved only once and local times
+        far enough from any transition skip normalization.
+
+        :param fields: The date and time fields
+        :type fields: iterable
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :param lazy: Whether to return a generator instead of a list
+        :type lazy: bool
+
+        :rtype: list or generator
+        """
+        instances = cls._iter_from_fields(
+            fields, cls._safe_create_datetime_zone(tz)
         )
 
-        if tz is not UTC and tz != 'UTC':
-            instance = instance.in_tz(tz)
+        if lazy:
+            return instances
 
-        return instance
+        return list(instances)
+
+    @classmethod
+    def _iter_from_fields(cls, fields, tz):
+        for f in fields:
+            f = tuple(f) + (0, 0, 0, 0)[len(f) - 3:]
+            local = (
+                (datetime.date(f[0], f[1], f[2]).toordinal() - EPOCH_ORDINAL)
+                * SECONDS_PER_DAY
+                + f[3] * 3600 + f[4] * 60 + f[5]
+            )
+
+            yield cls(*f, tzinfo=tz._get_local_tzinfo(local) or tz)
+
+    @classmethod
+    def from_datetime64(cls, values, tz=UTC, lazy=False):
+        """
+        Create Pendulum instances from NumPy datetime64 values,
+        which are considered to be UTC times. NaT values become None.
+
+        The fields are computed on the underlying int64 buffer
+        and the timezone offsets are looked up in its transition table.
+
+        :param values: The datetime64 values
+        :type values: numpy.ndarray
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :param lazy: Whether to return a generator instead of a list
+        :type lazy: bool
+
+        :rtype: list or generator
+        """
+        microseconds = _numpy.as_microseconds(values).ravel()
+        nat = microseconds == _numpy.NAT
+        if nat.any():
+            microseconds = _numpy.numpy.where(nat, 0, microseconds)
+
+        fields, tzinfos, indices = _numpy.local_fields(
+            microseconds, cls._safe_create_datetime_zone(tz)
+        )
+
+        instances = cls._iter_from_datetime64(
+            zip(*[f.tolist() for f in fields]),
+            [tzinfos[i] for i in indices.tolist()],
+            nat.tolist()
+        )
+
+        if lazy:
+            return instances
+
+        return list(instances)
+
+    @classmethod
+    def _iter_from_datetime64(cls, fields, tzinfos, nat):
+        for f, tzinfo, is_nat in zip(fields, tzinfos, nat):
+            if is_nat:
+                yield None
+            else:
+                yield cls(*f, tzinfo=tzinfo)
+
+    @classmethod
+    def _split_timestamp(cls, timestamp, unit):
+        """
+        Splits a timestamp into integral seconds and microseconds.
+
+        :rtype: tuple
+        """
+        if unit == 's':
+            seconds = int(timestamp // 1)
+            microsecond = int(round((timestamp - seconds) * USECS_PER_SEC))
+            if microsecond == USECS_PER_SEC:
+                seconds += 1
+                microsecond = 0
+
+            return seconds, microsecond
+
+        seconds, fraction = divmod(int(timestamp), cls._TIMESTAMP_UNITS[unit])
+
+        return seconds, fraction * (USECS_PER_SEC // cls._TIMESTAMP_UNITS[unit])
+
+    @classmethod
+    def _create_from_unix_time(cls, unix_time, microsecond, tz):
+        """
+        Create a Pendulum instance from a UTC time
+        in an already resolved timezone.
+
+        :type unix_time: int
+        :type microsecond: int
+        :type tz: Timezone
+
+        :rtype: Pendulum
+        """
+        tzinfo = tz._get_unix_tzinfo(unix_time)
+        offset = tzinfo.adjusted_offset
+
+        return cls(
+            *local_time(
+                unix_time,
+                offset.days * SECONDS_PER_DAY + offset.seconds,
+                microsecond
+            ),
+            tzinfo=tzinfo
+        )
 
     @classmethod
     def strptime(cls, time, fmt):
@@ -518,6 +727,17 @@ class Pendulum(Date, datetime.datetime):
 
         return self._int_timestamp
 
+    def to_datetime64(self):
+        """
+        Returns the instance as a NumPy datetime64
+        in UTC with a microsecond precision.
+
+        :rtype: numpy.datetime64
+        """
+        return _numpy.require_numpy().datetime64(
+            self.int_timestamp * USECS_PER_SEC + self._microsecond, 'us'
+        )
+
     @property
     def offset(self):
         return self.get_offset()
@@ -728,7 +948,7 @@ class Pendulum(Date, datetime.datetime):
 
         :rtype: str
         """
-        return self.format(self.ATOM, formatter='classic')
+        return self._format_rfc3339(self.ATOM)
 
     def to_cookie_string(self):
         """
@@ -748,7 +968,7 @@ class Pendulum(Date, datetime.datetime):
         if extended:
             fmt = self.ISO8601_EXTENDED
 
-        return self.format(fmt, formatter='classic')
+        return self._format_rfc3339(fmt)
 
     def to_rfc822_string(self):
         """
@@ -800,7 +1020,7 @@ class Pendulum(Date, datetime.datetime):
         if extended:
             fmt = self.RFC3339_EXTENDED
 
-        return self.format(fmt, formatter='classic')
+        return self._format_rfc3339(fmt)
 
     def to_rss_string(self):
         """
@@ -816,7 +1036,31 @@ class Pendulum(Date, datetime.datetime):
 
         :rtype: str
         """
-        return self.format(self.W3C, formatter='classic')
+        return self._format_rfc3339(self.W3C)
+
+    def _format_rfc3339(self, fmt):
+        """
+        Formats the instance with one of the RFC 3339 formats
+        without going through the formatter.
+
+        Years before 1000 and offsets with seconds,
+        whose formatting depends on strftime(), still do.
+
+        :rtype: str
+        """
+        if fmt == RFC3339:
+            precision = 0
+        elif fmt == RFC3339_EXTENDED:
+            precision = 6
+        else:
+            return self.format(fmt, formatter='classic')
+
+        offset = self.utcoffset()
+        if (self.year < 1000 or offset is None
+                or offset.seconds % 60 or offset.microseconds):
+            return self.format(fmt, formatter='classic')
+
+        return format_iso8601(self._datetime, offset, precision)
 
     # Comparisons
     def __eq__(self, other):
@@ -1256,6 +1500,224 @@ class Pendulum(Date, datetime.datetime):
 
         return getattr(self, '_end_of_%s' % unit)()
 
+    def floor(self, unit, multiple=1):
+        """
+        Returns a copy of the instance rounded down
+        to a multiple of the given unit, in local time.
+
+        Supported units are microsecond, millisecond, second, minute,
+        hour, day, week, month and year.
+        Buckets are aligned on 1970-01-01 for fixed-length units,
+        on the first day of the week for weeks
+        and on the year 0 for months and years.
+
+        :param unit: The unit to round to
+        :type unit: str
+
+        :param multiple: The number of units in a bucket
+        :type multiple: int
+
+        :rtype: Pendulum
+        """
+        return self._round_to(unit, multiple, floor_local, 'floor')
+
+    def ceil(self, unit, multiple=1):
+        """
+        Returns a copy of the instance rounded up
+        to a multiple of the given unit, in local time.
+
+        See floor() for the supported units.
+
+        :param unit: The unit to round to
+        :type unit: str
+
+        :param multiple: The number of units in a bucket
+        :type multiple: int
+
+        :rtype: Pendulum
+        """
+        return self._round_to(unit, multiple, ceil_local, 'ceil')
+
+    def round(self, unit, multiple=1):
+        """
+        Returns a copy of the instance rounded
+        to the nearest multiple of the given unit, in local time.
+
+        Ties are rounded up. See floor() for the supported units.
+
+        :param unit: The unit to round to
+        :type unit: str
+
+        :param multiple: The number of units in a bucket
+        :type multiple: int
+
+        :rtype: Pendulum
+        """
+        floor = self.floor(unit, multiple)
+        if floor is self:
+            return self
+
+        ceil = self.ceil(unit, multiple)
+        if self._datetime - floor._datetime < ceil._datetime - self._datetime:
+            return floor
+
+        return ceil
+
+    def _round_to(self, unit, multiple, rounder, name):
+        self._check_rounding(unit, multiple, name)
+
+        dt = self._datetime
+        local = (
+            (dt.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+            + dt.hour * 3600 + dt.minute * 60 + dt.second
+        ) * USECS_PER_SEC + dt.microsecond
+
+        rounded = rounder(local, unit, multiple, self._week_starts_at)
+        if rounded == local:
+            return self
+
+        seconds, microsecond = divmod(rounded, USECS_PER_SEC)
+        offset = self._tzinfo.offset
+
+        # The wall clock time is kept in the same offset
+        # unless a transition occurred in between.
+        tzinfo = self._tz._get_unix_tzinfo(seconds - offset)
+        if tzinfo.offset != offset:
+            tzinfo = self._tz
+
+        return self.__class__(
+            *local_time(seconds, 0, microsecond),
+            tzinfo=tzinfo, fold=1
+        )
+
+    @classmethod
+    def _check_rounding(cls, unit, multiple, name):
+        if unit not in ROUNDING_UNITS:
+            raise ValueError('Invalid unit "{}" for {}()'.format(unit, name))
+
+        if multiple < 1:
+            raise ValueError('Invalid multiple "{}" for {}()'.format(multiple, name))
+
+    @classmethod
+    def floor_timestamps(cls, timestamps, unit, multiple=1, tz=UTC):
+        """
+        Rounds down a batch of timestamps
+        to a multiple of the given unit, in the given timezone.
+
+        The timezone is resolved only once and sorted timestamps
+        reuse the previously found transition.
+        Timestamps falling on a whole second are returned as integers.
+
+        :param timestamps: The timestamps
+        :type timestamps: iterable
+
+        :param unit: The unit to round to
+        :type unit: str
+
+        :param multiple: The number of units in a bucket
+        :type multiple: int
+
+        :param tz: The timezone
+        :type tz: Timezone or TimezoneInfo or str or int or None
+
+        :rtype: list
+        """
+        return cls._round_timestamps(timestamps, unit, multiple, tz, 'floor')
+
+    @classmethod
+    def ceil_timestamps(cls, timestamps, unit, multiple=1, tz=UTC):
+        """
+        Rounds up a batch of timestamps
+        to a multiple of the given unit, in the given timezone.
+
+        See floor_timestamps() for the meaning of the parameters.
+
+        :rtype: list
+        """
+        return cls._round_timestamps(timestamps, unit, multiple, tz, 'ceil')
+
+    @classmethod
+    def round_timestamps(cls, timestamps, unit, multiple=1, tz=UTC):
+        """
+        Rounds a batch of timestamps
+        to the nearest multiple of the given unit, in the given timezone.
+
+        See floor_timestamps() for the meaning of the parameters.
+
+        :rtype: list
+        """
+        return cls._round_timestamps(timestamps, unit, multiple, tz, 'round')
+
+    @classmethod
+    def _round_timestamps(cls, timestamps, unit, multiple, tz, name):
+        cls._check_rounding(unit, multiple, name)
+
+        tz = cls._safe_create_datetime_zone(tz)
+        week_starts_at = cls._week_starts_at
+        rounded = []
+
+        for timestamp in timestamps:
+            seconds = int(timestamp // 1)
+            microsecond = int(round((timestamp - seconds) * USECS_PER_SEC))
+            unix_time = seconds * USECS_PER_SEC + microsecond
+
+            offset = tz._get_unix_tzinfo(seconds).offset
+            local = unix_time + offset * USECS_PER_SEC
+
+            if name == 'round':
+                lower = cls._unix_from_local(
+                    floor_local(local, unit, multiple, week_starts_at),
+                    offset, tz
+                )
+                upper = cls._unix_from_local(
+                    ceil_local(local, unit, multiple, week_starts_at),
+                    offset, tz
+                )
+                if unix_time - lower < upper - unix_time:
+                    unix_time = lower
+                else:
+                    unix_time = upper
+            else:
+                rounder = floor_local if name == 'floor' else ceil_local
+                unix_time = cls._unix_from_local(
+                    rounder(local, unit, multiple, week_starts_at),
+                    offset, tz
+                )
+
+            seconds, microsecond = divmod(unix_time, USECS_PER_SEC)
+            if microsecond:
+                rounded.append(seconds + microsecond / USECS_PER_SEC)
+            else:
+                rounded.append(seconds)
+
+        return rounded
+
+    @classmethod
+    def _unix_from_local(cls, local, offset, tz):
+        """
+        Converts a wall clock time, in microseconds,
+        to a UTC time, in microseconds.
+
+        The given offset is kept unless
+        a transition occurs, in which case
+        the wall clock time is normalized.
+
+        :rtype: int
+        """
+        seconds, microsecond = divmod(local, USECS_PER_SEC)
+        if tz._get_unix_tzinfo(seconds - offset).offset != offset:
+            dt = tz.convert(
+                datetime.datetime(*local_time(seconds, 0, microsecond)),
+                dst_rule=Timezone.POST_TRANSITION
+            )
+            seconds = (
+                (dt.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+                + dt.hour * 3600 + dt.minute * 60 + dt.second
+            )
+            offset = dt.tzinfo.offset
+
+        return (seconds - offset) * USECS_PER_SEC + microsecond
+
     def _start_of_second(self):
         """
         Reset microseconds to 0.
@@ -1459,11 +1921,9 @@ class Pendulum(Date, datetime.datetime):
         else:
             dt = self.start_of('day')
 
-        dt = dt.add(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.add(days=1)
+        days = self._epoch_days()
 
-        return dt
+        return dt.add(days=next_day_of_week(days, day_of_week) - days)
 
     def previous(self, day_of_week=None, keep_time=False):
         """
@@ -1491,11 +1951,9 @@ class Pendulum(Date, datetime.datetime):
         else:
             dt = self.start_of('day')
 
-        dt = dt.subtract(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.subtract(days=1)
+        days = self._epoch_days()
 
-        return dt
+        return dt.add(days=previous_day_of_week(days, day_of_week) - days)
 
     def first_of(self, unit, day_of_week=None):
         """
@@ -1580,20 +2038,9 @@ class Pendulum(Date, datetime.datetime):
         :rtype: Pendulum
         """
         dt = self.start_of('day')
+        first = days_from_civil(dt.year, dt.month, 1)
 
-        if day_of_week is None:
-            return dt.day_(1)
-
-        month = calendar.monthcalendar(dt.year, dt.month)
-
-        calendar_day = (day_of_week - 1) % 7
-
-        if month[0][calendar_day] > 0:
-            day_of_month = month[0][calendar_day]
-        else:
-            day_of_month = month[1][calendar_day]
-
-        return dt.day_(day_of_month)
+        return dt.day_(nth_day_of_week(first, first + 6, 1, day_of_week) - first + 1)
 
     def _last_of_month(self, day_of_week=None):
         """
@@ -1607,20 +2054,9 @@ class Pendulum(Date, datetime.datetime):
         :rtype: Pendulum
         """
         dt = self.start_of('day')
+        last = days_from_civil(dt.year, dt.month, dt.days_in_month)
 
-        if day_of_week is None:
-            return dt.day_(self.days_in_month)
-
-        month = calendar.monthcalendar(dt.year, dt.month)
-
-        calendar_day = (day_of_week - 1) % 7
-
-        if month[-1][calendar_day] > 0:
-            day_of_month = month[-1][calendar_day]
-        else:
-            day_of_month = month[-2][calendar_day]
-
-        return dt.day_(day_of_month)
+        return dt.day_(dt.days_in_month - last + last_day_of_week(last, day_of_week))
 
     def _nth_of_month(self, nth, day_of_week):
         """
@@ -1639,15 +2075,15 @@ class Pendulum(Date, datetime.datetime):
         if nth == 1:
             return self.first_of('month', day_of_week)
 
-        dt = self.first_of('month')
-        check = dt.format('%Y-%m')
-        for i in range(nth - (1 if dt.day_of_week == day_of_week else 0)):
-            dt = dt.next(day_of_week)
+        first = days_from_civil(self.year, self.month, 1)
+        days = nth_day_of_week(
+            first, first + self.days_in_month - 1, nth, day_of_week
+        )
 
-        if dt.format('%Y-%m') == check:
-            return self.day_(dt.day).start_of('day')
+        if days is None:
+            return False
 
-        return False
+        return self.day_(days - first + 1).start_of('day')
 
     def _first_of_quarter(self, day_of_week=None):
         """
@@ -1692,17 +2128,17 @@ class Pendulum(Date, datetime.datetime):
         if nth == 1:
             return self.first_of('quarter', day_of_week)
 
-        dt = self.day_(1).month_(self.quarter * 3)
-        last_month = dt.month
-        year = dt.year
-        dt = dt.first_of('quarter')
-        for i in range(nth - (1 if dt.day_of_week == day_of_week else 0)):
-            dt = dt.next(day_of_week)
+        last_month = self.quarter * 3
+        days = nth_day_of_week(
+            days_from_civil(self.year, last_month - 2, 1),
+            days_from_civil(self.year, last_month, days_in_month(self.year, last_month)),
+            nth, day_of_week
+        )
 
-        if last_month < dt.month or year != dt.year:
+        if days is None:
             return False
 
-        return self.on(self.year, dt.month, dt.day).start_of('day')
+        return self.on(*civil_from_days(days)).start_of('day')
 
     def _first_of_year(self, day_of_week=None):
         """
@@ -1747,15 +2183,16 @@ class Pendulum(Date, datetime.datetime):
         if nth == 1:
             return self.first_of('year', day_of_week)
 
-        dt = self.first_of('year')
-        year = dt.year
-        for i in range(nth - (1 if dt.day_of_week == day_of_week else 0)):
-            dt = dt.next(day_of_week)
+        days = nth_day_of_week(
+            days_from_civil(self.year, 1, 1),
+            days_from_civil(self.year, 12, 31),
+            nth, day_of_week
+        )
 
-        if year != dt.year:
+        if days is None:
             return False
 
-        return self.on(self.year, dt.month, dt.day).start_of('day')
+        return self.on(*civil_from_days(days)).start_of('day')
 
     def average(self, dt=None):
         """
@@ -1876,7 +2313,39 @@ class Pendulum(Date, datetime.datetime):
         return self.instance(self._datetime.astimezone(tz))
 
     def isoformat(self, sep='T'):
-        return self._datetime.isoformat(sep)
+        dt = self._datetime
+        if native_format_iso8601 is None:
+            # The pure Python serializer is slower than datetime's own
+            return dt.isoformat(sep)
+
+        try:
+            return native_format_iso8601(dt, dt.utcoffset(), -1, sep)
+        except ValueError:
+            return dt.isoformat(sep)
+
+    @classmethod
+    def isoformat_many(cls, dts, sep='T'):
+        """
+        Formats datetimes in the ISO 8601 format, like isoformat() does,
+        in a single call.
+
+        :param dts: The datetimes
+        :type dts: iterable
+
+        :param sep: The separator of the date and time
+        :type sep: str
+
+        :rtype: list
+        """
+        # The fields of Pendulum instances are those of their datetime
+        dts = [getattr(dt, '_datetime', dt) for dt in dts]
+        if native_format_iso8601 is None:
+            return [dt.isoformat(sep) for dt in dts]
+
+        try:
+            return format_iso8601_many(dts, -1, sep)
+        except ValueError:
+            return [dt.isoformat(sep) for dt in dts]
 
     def utcoffset(self):
         return self._tzinfo.utcoffset(self)
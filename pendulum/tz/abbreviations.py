@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+from collections import namedtuple
+
+from pytzdata import timezones
+
+from .loader import Loader
+
+Abbreviation = namedtuple('Abbreviation', 'abbreviation offset zones')
+
+# Only the abbreviations used since 2000-01-01 are indexed,
+# leaving out local mean times and long abandoned ones
+_SINCE = 946684800
+
+_index = None
+
+# Resolutions by upper-cased abbreviation and region,
+# cleared when full since regions are free strings
+_resolved = {}
+_MAX_RESOLVED = 1024
+
+
+def abbreviation_index():
+    """
+    Returns the index of the timezone abbreviations in use,
+    built once from the timezone infos of all the timezones.
+
+    Each abbreviation has its candidate UTC offsets,
+    the most widely used first.
+
+    :rtype: dict
+    """
+    global _index
+
+    if _index is None:
+        _index = _build_index()
+
+    return _index
+
+
+def resolve_abbreviation(abbreviation, region=None):
+    """
+    Resolves a timezone abbreviation, like CEST or EST,
+    into its UTC offset and the timezones using it.
+
+    Ambiguous abbreviations resolve to the offset
+    of the given region if it has one (like "Asia" for CST)
+    and to the most widely used one otherwise.
+
+    :param abbreviation: The abbreviation, in any case
+    :type abbreviation: str
+
+    :param region: The preferred region, like "America" or "Europe"
+    :type region: str or None
+
+    :rtype: Abbreviation or None
+    """
+    abbreviation = abbreviation.upper()
+    key = (abbreviation, region)
+    try:
+        return _resolved[key]
+    except KeyError:
+        pass
+
+    # Unknown abbreviations are not kept since
+    # any word of the parsed strings can end up here
+    candidates = abbreviation_index().get(abbreviation)
+    if not candidates:
+        return
+
+    resolved = candidates[0]
+    if region is not None:
+        prefix = region.rstrip('/') + '/'
+        for candidate in candidates:
+            if any(zone.startswith(prefix) for zone in candidate.zones):
+                resolved = candidate
+
+                break
+
+    if len(_resolved) >= _MAX_RESOLVED:
+        _resolved.clear()
+
+    _resolved[key] = resolved
+
+    return resolved
+
+
+def _build_index():
+    now = time.time()
+    zones = {}
+    current = set()
+    for name in timezones:
+        try:
+            transitions, tzinfos, default_tzinfo_index, _ = Loader.load(name)
+        except ValueError:
+            continue
+
+        # The timezone infos used since _SINCE
+        # and whether they are still in use
+        uses = [(default_tzinfo_index, True)]
+        if transitions:
+            uses = [(transitions[-1].tzinfo_index, True)]
+            for tr, next_tr in zip(transitions, transitions[1:]):
+                if next_tr.unix_time >= _SINCE:
+                    uses.append((tr.tzinfo_index, next_tr.unix_time > now))
+
+        for i, in_use in uses:
+            offset, _, _, abbrev = tzinfos[i]
+
+            # Numeric abbreviations, like +03, are offsets already
+            if not abbrev.isalpha():
+                continue
+
+            key = (abbrev.upper(), offset)
+            zones.setdefault(key, set()).add(name)
+            if in_use:
+                current.add(key)
+
+    index = {}
+    for (abbrev, offset), names in zones.items():
+        index.setdefault(abbrev, []).append(
+            Abbreviation(abbrev, offset, tuple(sorted(names)))
+        )
+
+    # Offsets still in use first, then the most widely used
+    for abbrev, candidates in index.items():
+        candidates.sort(key=lambda c: (
+            (c.abbreviation, c.offset) not in current, -len(c.zones), c.offset
+        ))
+        index[abbrev] = tuple(candidates)
+
+    return index
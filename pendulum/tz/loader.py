@@ -7,7 +7,7 @@ from pytzdata import tz_file
 from pytzdata.exceptions import TimezoneNotFound
 
 from .. import _compat
-from ..helpers import local_time
+from ..helpers import local_times
 from .transition import Transition
 from .transition_type import TransitionType
 
@@ -103,32 +103,26 @@ class Loader(object):
                     transition_types[0].abbrev
                 ),)
         else:
+            # We calculate local times based on the transition types
+            # of each transition and of the previous one
+            pre_lindexes = lindexes[:1] + lindexes[:-1]
+            pre_times = local_times(
+                transition_times,
+                [transition_types[index].utc_offset for index in pre_lindexes]
+            )
+            times = local_times(
+                transition_times,
+                [transition_types[index].utc_offset for index in lindexes]
+            )
+
             # calculate transition info
             tr = None
             for i in range(len(transition_times)):
-                # We retrieve transition types indexes
-                transition_type_index = lindexes[i]
-
-                if i == 0:
-                    pre_transition_type_index = lindexes[i]
-                else:
-                    pre_transition_type_index = lindexes[i - 1]
-
-                pre_transition_type = transition_types[pre_transition_type_index]
-                transition_type = transition_types[transition_type_index]
-
-                # We calculate local times based on the transition types
-                # we retrieved
-                pre_time = datetime(
-                    *local_time(transition_times[i],
-                                pre_transition_type.utc_offset,
-                                0)
-                )
-                time = datetime(
-                    *local_time(transition_times[i],
-                                transition_type.utc_offset,
-                                0)
-                )
+                pre_transition_type = transition_types[pre_lindexes[i]]
+                transition_type = transition_types[lindexes[i]]
+
+                pre_time = datetime(*pre_times[i])
+                time = datetime(*times[i])
 
                 # We build the tzinfo information as tuples
                 # and retrieve their index to store them
@@ -53,6 +53,9 @@ class Timezone(tzinfo):
         )
         self._default_tzinfo_index = default_tzinfo_index
         self._utc_transition_times = utc_transition_times
+        self._unix_transition_times = tuple(
+            tr.unix_time for tr in self._transitions
+        )
         self._local_hint = {}
 
     @property
@@ -446,6 +449,79 @@ class Timezone(tzinfo):
 
         return idx
 
+    def _find_unix_index(self, unix_time):
+        lo, hi = 0, len(self._unix_transition_times)
+        hint = self._local_hint.get('_unix')
+        if hint:
+            if unix_time == hint[0]:
+                return hint[1]
+            elif unix_time < hint[0]:
+                hi = hint[1] + 1
+            else:
+                lo = hint[1]
+
+        idx = max(0, bisect_right(self._unix_transition_times, unix_time, lo, hi) - 1)
+
+        self._local_hint['_unix'] = (unix_time, idx)
+
+        return idx
+
+    def _get_unix_tzinfo(self, unix_time):
+        """
+        Returns the TimezoneInfo in effect at the given UTC timestamp.
+
+        :param unix_time: The UTC timestamp
+        :type unix_time: int or float
+
+        :rtype: TimezoneInfo
+        """
+        if not self._transitions:
+            return self._tzinfos[self._default_tzinfo_index]
+
+        tr = self._transitions[self._find_unix_index(unix_time)]
+
+        return self._tzinfos[tr._tzinfo_index]
+
+    def _get_next_unix_transition(self, unix_time):
+        """
+        Returns the UTC timestamp of the first transition
+        after the given UTC timestamp, if any.
+
+        :param unix_time: The UTC timestamp
+        :type unix_time: int or float
+
+        :rtype: int or None
+        """
+        times = self._unix_transition_times
+        idx = bisect_right(times, unix_time)
+        if idx < len(times):
+            return times[idx]
+
+    def _get_local_tzinfo(self, local_time):
+        """
+        Returns the TimezoneInfo of a wall clock time
+        if it is at least a day away from any transition,
+        so that it can neither be skipped nor repeated.
+
+        :param local_time: Seconds elapsed since 1970-01-01T00:00:00 (wall clock)
+        :type local_time: int
+
+        :rtype: TimezoneInfo or None
+        """
+        if not self._transitions:
+            return self._tzinfos[self._default_tzinfo_index]
+
+        times = self._unix_transition_times
+        idx = self._find_unix_index(local_time)
+
+        if local_time < times[idx] + SECONDS_PER_DAY:
+            return
+
+        if idx + 1 < len(times) and local_time > times[idx + 1] - SECONDS_PER_DAY:
+            return
+
+        return self._tzinfos[self._transitions[idx]._tzinfo_index]
+
     def __repr__(self):
         return '<Timezone [{}]>'.format(self._name)
 
@@ -513,6 +589,12 @@ class FixedTimezone(Timezone):
 
         return (dt + self._tzinfo.adjusted_offset).replace(tzinfo=self._tzinfo)
 
+    def _get_unix_tzinfo(self, unix_time):
+        return self._tzinfo
+
+    def _get_local_tzinfo(self, local_time):
+        return self._tzinfo
+
 
 class _UTC(FixedTimezone):
 
@@ -524,4 +606,7 @@ class _UTC(FixedTimezone):
     def fromutc(self, dt):
         return dt.replace(tzinfo=UTC)
 
+    def _get_unix_tzinfo(self, unix_time):
+        return UTC
+
 UTCTimezone = _UTC()
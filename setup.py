@@ -86,6 +86,9 @@ kwargs = dict(
         'python-dateutil',
         'pytzdata',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     include_package_data=True,
     tests_require=['pytest'],
     test_suite='nose.collector',
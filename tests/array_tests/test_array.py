@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+import pendulum
+from pendulum import Pendulum, PendulumArray
+
+from .. import AbstractTestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class PendulumArrayTest(AbstractTestCase):
+
+    def setUp(self):
+        super(PendulumArrayTest, self).setUp()
+
+        if numpy is None:
+            self.skipTest('NumPy is not installed.')
+
+    def create(self, tz='Europe/Paris'):
+        return PendulumArray([
+            Pendulum(2016, 2, 29, 12, 30, 45, 123456, tzinfo=tz),
+            Pendulum(2013, 3, 31, 1, 30, tzinfo=tz),
+            Pendulum(2017, 1, 1, tzinfo=tz),
+        ], tz)
+
+    def test_construct_from_datetime64(self):
+        values = numpy.array(['2016-07-01T10:30'], dtype='datetime64[m]')
+        array = PendulumArray(values, 'Europe/Paris')
+
+        self.assertEqual(1, len(array))
+        self.assertEqual('Europe/Paris', array.timezone_name)
+        self.assertPendulum(array[0], 2016, 7, 1, 12, 30, 0, 0)
+
+    def test_construct_with_nat(self):
+        values = numpy.array(['NaT'], dtype='datetime64[us]')
+
+        self.assertRaises(ValueError, PendulumArray, values)
+
+    def test_fields(self):
+        array = self.create()
+
+        self.assertEqual([2016, 2013, 2017], array.year.tolist())
+        self.assertEqual([2, 3, 1], array.month.tolist())
+        self.assertEqual([29, 31, 1], array.day.tolist())
+        self.assertEqual([12, 1, 0], array.hour.tolist())
+        self.assertEqual([30, 30, 0], array.minute.tolist())
+        self.assertEqual([45, 0, 0], array.second.tolist())
+        self.assertEqual([123456, 0, 0], array.microsecond.tolist())
+        self.assertEqual([3600, 3600, 3600], array.offset.tolist())
+
+    def test_calendar_fields(self):
+        array = self.create()
+
+        self.assertEqual([pendulum.MONDAY, pendulum.SUNDAY, pendulum.SUNDAY], array.day_of_week.tolist())
+        self.assertEqual([60, 90, 1], array.day_of_year.tolist())
+        self.assertEqual([9, 13, 52], array.week_of_year.tolist())
+        self.assertEqual([1, 1, 1], array.quarter.tolist())
+
+    def test_getitem(self):
+        array = self.create()
+
+        d = array[1]
+        self.assertIsInstanceOfPendulum(d)
+        self.assertPendulum(d, 2013, 3, 31, 1, 30, 0, 0)
+        self.assertEqual('Europe/Paris', d.timezone_name)
+        self.assertPendulum(array[-1], 2017, 1, 1, 0, 0, 0, 0)
+
+    def test_slicing(self):
+        array = self.create()[1:]
+
+        self.assertIsInstance(array, PendulumArray)
+        self.assertEqual(2, len(array))
+        self.assertEqual([2013, 2017], array.year.tolist())
+        self.assertEqual([2017], array[array.year > 2016].year.tolist())
+
+    def test_iter(self):
+        array = self.create()
+
+        self.assertEqual(
+            [
+                Pendulum(2016, 2, 29, 12, 30, 45, 123456, tzinfo='Europe/Paris'),
+                Pendulum(2013, 3, 31, 1, 30, tzinfo='Europe/Paris'),
+                Pendulum(2017, 1, 1, tzinfo='Europe/Paris'),
+            ],
+            list(array)
+        )
+
+    def test_in_timezone(self):
+        array = self.create().in_timezone('America/New_York')
+
+        self.assertEqual('America/New_York', array.timezone_name)
+        self.assertEqual([6, 20, 18], array.hour.tolist())
+        self.assertEqual([-5 * 3600, -4 * 3600, -5 * 3600], array.offset.tolist())
+
+    def test_add(self):
+        array = self.create()
+
+        new = array.add(years=1)
+        self.assertEqual([2017, 2014, 2018], new.year.tolist())
+        self.assertEqual([28, 31, 1], new.day.tolist())
+
+        new = array.add(months=1)
+        self.assertPendulum(new[0], 2016, 3, 29, 12, 30, 45, 123456)
+        self.assertPendulum(new[1], 2013, 4, 30, 1, 30, 0, 0)
+        self.assertEqual(7200, new[1].offset)
+
+    def test_add_crossing_transition(self):
+        array = self.create()
+
+        # Days keep the wall clock time
+        new = array.add(days=1)
+        self.assertPendulum(new[0], 2016, 3, 1, 12, 30, 45, 123456)
+        self.assertPendulum(new[1], 2013, 4, 1, 1, 30, 0, 0)
+        self.assertEqual(7200, new[1].offset)
+
+        # Hours do not
+        new = array.add(hours=24)
+        self.assertPendulum(new[1], 2013, 4, 1, 2, 30, 0, 0)
+
+    def test_subtract(self):
+        array = self.create()
+        new = array.subtract(days=1, hours=2)
+
+        self.assertPendulum(new[0], 2016, 2, 28, 10, 30, 45, 123456)
+        self.assertPendulum(new[2], 2016, 12, 30, 22, 0, 0, 0)
+
+    def test_add_matches_pendulum(self):
+        array = self.create('America/New_York')
+
+        for kwargs in [{'months': -1}, {'days': 10, 'hours': 3}, {'minutes': 90}]:
+            for d, new in zip(array, array.add(**kwargs)):
+                self.assertEqual(d.add(**kwargs), new)
+                self.assertEqual(d.add(**kwargs).offset, new.offset)
+
+    def test_start_of(self):
+        array = self.create()
+
+        self.assertPendulum(array.start_of('day')[0], 2016, 2, 29, 0, 0, 0, 0)
+        self.assertPendulum(array.start_of('week')[1], 2013, 3, 25, 0, 0, 0, 0)
+        self.assertPendulum(array.start_of('month')[0], 2016, 2, 1, 0, 0, 0, 0)
+        self.assertPendulum(array.start_of('decade')[0], 2010, 1, 1, 0, 0, 0, 0)
+        self.assertPendulum(array.start_of('century')[0], 2001, 1, 1, 0, 0, 0, 0)
+        self.assertRaises(ValueError, array.start_of, 'quarter')
+
+    def test_end_of(self):
+        array = self.create()
+
+        self.assertPendulum(array.end_of('minute')[0], 2016, 2, 29, 12, 30, 59, 999999)
+        self.assertPendulum(array.end_of('week')[0], 2016, 3, 6, 23, 59, 59, 999999)
+        self.assertPendulum(array.end_of('month')[0], 2016, 2, 29, 23, 59, 59, 999999)
+        self.assertPendulum(array.end_of('year')[1], 2013, 12, 31, 23, 59, 59, 999999)
+        self.assertEqual(7200, array.end_of('month')[1].offset)
+        self.assertRaises(ValueError, array.end_of, 'quarter')
+
+    def test_start_end_of_match_pendulum(self):
+        array = self.create()
+
+        for unit in Pendulum._MODIFIERS_VALID_UNITS:
+            for d, start, end in zip(array, array.start_of(unit), array.end_of(unit)):
+                self.assertEqual(d.start_of(unit), start)
+                self.assertEqual(d.end_of(unit), end)
+
+    def test_comparisons(self):
+        array = self.create()
+        d = Pendulum(2016, 1, 1)
+
+        self.assertEqual([True, False, True], (array > d).tolist())
+        self.assertEqual([False, True, False], (array <= d).tolist())
+        self.assertEqual([True, False, False], (array == array[0]).tolist())
+        self.assertEqual([False, True, True], (array != array[0]).tolist())
+        self.assertEqual([False, False, False], (array < array.subtract(hours=1)).tolist())
+        self.assertEqual([True, True, True], (array.in_tz('UTC') == array).tolist())
+
+    def test_to_datetime64(self):
+        values = self.create().to_datetime64()
+
+        self.assertEqual(numpy.dtype('datetime64[us]'), values.dtype)
+        self.assertEqual(numpy.datetime64('2013-03-31T00:30'), values[1])
+
+    def test_isoformat(self):
+        array = PendulumArray(
+            [Pendulum(1890, 1, 1, 12, tzinfo='Europe/Paris'),
+             Pendulum(2016, 8, 28, 7, 3, 6, 123456, tzinfo='Europe/Paris')],
+            tz='Europe/Paris'
+        )
+
+        self.assertEqual([dt.isoformat() for dt in array], array.isoformat())
+        self.assertEqual(
+            ['1890-01-01 12:00:00+00:09', '2016-08-28 07:03:06.123456+02:00'],
+            array.isoformat(' ')
+        )
+
+    def test_format(self):
+        self.assertEqual(
+            ['2016-02-29', '2013-03-31', '2017-01-01'],
+            self.create().format('YYYY-MM-DD', formatter='alternative')
+        )
@@ -73,3 +73,22 @@ class AddTest(AbstractTestCase):
             self.fail()
         except TypeError:
             pass
+
+    def test_add_days_and_weeks(self):
+        self.assertDate(Date(2016, 2, 28).add(weeks=1, days=2), 2016, 3, 8)
+        self.assertDate(Date(2016, 3, 1).add(days=-1), 2016, 2, 29)
+
+    def test_add_fractional_days(self):
+        self.assertDate(Date(2016, 2, 28).add(days=1.5), 2016, 2, 29)
+
+    def test_add_out_of_range(self):
+        self.assertRaises(OverflowError, Date(9999, 12, 31).add, days=1)
+        self.assertRaises(OverflowError, Date(9999, 12, 31).add, weeks=1)
+        self.assertRaises(OverflowError, Date(9999, 11, 30).add, months=1, days=5)
+        self.assertRaises(OverflowError, Date(1, 1, 1).subtract, days=1)
+        self.assertRaises(OverflowError, Date(9999, 12, 31).next)
+        self.assertRaises(OverflowError, Date(1, 1, 1).previous)
+
+        # Months and years out of range raise ValueError, as the date constructor
+        self.assertRaises(ValueError, Date(9999, 12, 1).add, months=1)
+        self.assertRaises(ValueError, Date(1, 1, 1).subtract, years=1)
@@ -122,6 +122,13 @@ class DayOfWeekModifiersTest(AbstractTestCase):
 
         self.assertRaises(PendulumException, d.nth_of, 'month', 6, pendulum.MONDAY)
 
+    def test_nth_of_invalid_occurrence(self):
+        d = Date(2016, 3, 15)
+
+        self.assertRaises(PendulumException, d.nth_of, 'month', 0, pendulum.MONDAY)
+        self.assertRaises(PendulumException, d.nth_of, 'quarter', -1, pendulum.MONDAY)
+        self.assertRaises(PendulumException, d.nth_of, 'year', 0, pendulum.MONDAY)
+
     def test_nth_of_month_outside_year(self):
         d = Date(1975, 12, 5)
 
@@ -261,3 +268,10 @@ class DayOfWeekModifiersTest(AbstractTestCase):
         d = Date.create(1975, 8, 5)
 
         self.assertRaises(ValueError, d.nth_of, 'invalid', 3, pendulum.MONDAY)
+
+    def test_nth_of_month_outside_of_calendar(self):
+        d = Date(9999, 12, 1)
+
+        self.assertDate(d.nth_of('month', 5, pendulum.FRIDAY), 9999, 12, 31)
+        self.assertRaises(PendulumException, d.nth_of, 'month', 6, pendulum.FRIDAY)
+        self.assertDate(d.last_of('year', pendulum.FRIDAY), 9999, 12, 31)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+from pendulum import Date, Pendulum
+
+from .. import AbstractTestCase
+
+
+class InterningTest(AbstractTestCase):
+
+    def tearDown(self):
+        Date.disable_interning()
+
+        super(InterningTest, self).tearDown()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(Date.is_interning())
+        self.assertIsNot(Date(2016, 1, 1), Date(2016, 1, 1))
+
+    def test_interning(self):
+        Date.enable_interning()
+
+        self.assertTrue(Date.is_interning())
+        d = Date(2016, 1, 1)
+        self.assertIs(d, Date(2016, 1, 1))
+        self.assertIs(d, Date.instance(Pendulum(2016, 1, 1, 12)))
+        self.assertIs(d, Pendulum(2016, 1, 1, 12).date())
+        self.assertIs(d, Date(2015, 12, 31).add(days=1))
+        self.assertIs(d, Date(2016, 1, 8).subtract(weeks=1))
+        self.assertIsNot(d, Date(2016, 1, 2))
+
+    def test_disable_interning(self):
+        Date.enable_interning()
+        Date.disable_interning()
+
+        self.assertFalse(Date.is_interning())
+        self.assertIsNot(Date(2016, 1, 1), Date(2016, 1, 1))
+
+    def test_interning_is_bounded(self):
+        Date.enable_interning(2)
+
+        d = Date(2016, 1, 1)
+        Date(2016, 1, 2)
+        Date(2016, 1, 3)
+
+        self.assertEqual(1, len(Date._interned))
+        self.assertIsNot(d, Date(2016, 1, 1))
+
+    def test_invalid_dates_still_raise(self):
+        Date.enable_interning()
+        Date(2017, 3, 2)
+
+        self.assertRaises(ValueError, Date, 2017, 2, 30)
+        self.assertRaises(ValueError, Date, 2017, 13, 1)
+        self.assertRaises(ValueError, Date, 0, 1, 1)
+        self.assertRaises(ValueError, Date.enable_interning, 0)
+
+    def test_pickle(self):
+        Date.enable_interning()
+        d = Date(2016, 1, 1)
+
+        self.assertEqual(d, pickle.loads(pickle.dumps(d)))
+
+    def test_pendulum_is_not_interned(self):
+        Date.enable_interning()
+
+        d = Pendulum(2016, 1, 1)
+        self.assertIsInstanceOfPendulum(d)
+        self.assertIsNot(d, Pendulum(2016, 1, 1))
+        self.assertIsInstance(Date(2016, 1, 1).add(days=1), Date)
+
+    def test_interning_is_restricted_to_date(self):
+        self.assertRaises(TypeError, Pendulum.enable_interning)
+        self.assertRaises(TypeError, Pendulum.disable_interning)
+        self.assertFalse(Pendulum.is_interning())
+
+        Date.enable_interning()
+        Date.disable_interning()
+
+        d = Pendulum(2016, 1, 1, 12, tzinfo='Europe/Paris')
+        self.assertPendulum(d, 2016, 1, 1, 12)
+        self.assertEqual('Europe/Paris', d.timezone_name)
@@ -226,3 +226,24 @@ class ClassicFormatterTest(AbstractTestCase):
         d = Pendulum(2016, 8, 28, 7, 3, 6, 123456)
 
         self.assertEqual('J', f.format(d, 'J'))
+
+    def test_braces(self):
+        f = AlternativeFormatter()
+        d = Pendulum(2016, 8, 28)
+
+        self.assertEqual('{2016} {}', f.format(d, '{YYYY} {}'))
+
+    def test_plans_are_cached(self):
+        f = AlternativeFormatter()
+        d = Pendulum(2016, 8, 28, 7, 3, 6, 123456)
+
+        self.assertEqual('Sunday 28th August', f.format(d, 'dddd Do MMMM'))
+        self.assertEqual('dimanche 28e août', f.format(d, 'dddd Do MMMM', locale='fr'))
+        self.assertEqual(2, len(f._plans))
+
+        d = Pendulum(2016, 9, 1, 17, 3, 6)
+
+        self.assertEqual('Thursday 1st September', f.format(d, 'dddd Do MMMM'))
+        self.assertEqual('jeudi 1er septembre', f.format(d, 'dddd Do MMMM', locale='fr'))
+        self.assertEqual('5:03 PM', f.format(d, 'LT'))
+        self.assertEqual(3, len(f._plans))
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import re
-from pendulum import Pendulum, Date
+from pendulum import Pendulum, Date, Time
 from pendulum.formatting.classic_formatter import ClassicFormatter
 from .. import AbstractTestCase
 
@@ -63,3 +63,36 @@ class ClassicFormatterTest(AbstractTestCase):
             'Thursday 25th of December 1975',
             f.format(d, '%A %d%_t of %B %Y')
         )
+
+    def test_accepts_times(self):
+        t = Time(14, 15, 16)
+        f = ClassicFormatter()
+        self.assertEqual('02:15:16 PM {}', f.format(t, '%I:%M:%S %p {}'))
+
+    def test_literals(self):
+        f = ClassicFormatter()
+        d = Pendulum(2016, 8, 28)
+
+        self.assertEqual('{2016} % 100%', f.format(d, '{%Y} %% 100%%'))
+        self.assertEqual('{2016}', f.format(d.date(), '{%Y}'))
+
+    def test_strftime_directives(self):
+        f = ClassicFormatter()
+        d = Pendulum(2016, 8, 28, 7, 3, 6, tzinfo='Europe/Paris')
+
+        self.assertEqual(d._datetime.strftime('%c'), f.format(d, '%c'))
+        self.assertEqual('CEST +0200 35', f.format(d, '%Z %z %U'))
+
+    def test_plans_are_cached(self):
+        f = ClassicFormatter()
+        d = Pendulum(2016, 8, 28, 7, 3, 6)
+
+        self.assertEqual('Sunday 28th August', f.format(d, '%A %d%_t %B'))
+        self.assertEqual('dimanche 28e août', f.format(d, '%A %d%_t %B', locale='fr'))
+        self.assertEqual(2, len(f._plans))
+
+        d = Pendulum(2016, 9, 1, 17, 3, 6)
+
+        self.assertEqual('Thursday 01st September', f.format(d, '%A %d%_t %B'))
+        self.assertEqual('jeudi 01er septembre', f.format(d, '%A %d%_t %B', locale='fr'))
+        self.assertEqual(2, len(f._plans))
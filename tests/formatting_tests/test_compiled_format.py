@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+from pendulum import Pendulum, compile_format
+from pendulum.formatting import CompiledFormat, Formatter
+from .. import AbstractTestCase
+
+
+class CompiledFormatTest(AbstractTestCase):
+
+    def test_compiled_formats_are_cached(self):
+        self.assertIs(
+            compile_format('%Y-%m-%d'),
+            compile_format('%Y-%m-%d')
+        )
+        self.assertIsNot(
+            compile_format('YYYY', 'alternative', 'en'),
+            compile_format('YYYY', 'alternative', 'fr')
+        )
+
+    def test_invalid_formatter(self):
+        self.assertRaises(ValueError, compile_format, '%Y', 'foo')
+
+    def test_parse_classic_fixed_widths(self):
+        f = compile_format('%Y-%m-%d %H:%M:%S.%f%z')
+
+        self.assertEqual(
+            {
+                'year': 1975, 'month': 5, 'day': 21,
+                'hour': 22, 'minute': 32, 'second': 11,
+                'microsecond': 123456, 'offset': -5400
+            },
+            f.parse('1975-05-21 22:32:11.123456-0130')
+        )
+
+    def test_parse_classic_defaults(self):
+        self.assertEqual(
+            {
+                'year': 1900, 'month': 1, 'day': 1,
+                'hour': 22, 'minute': 32, 'second': 0,
+                'microsecond': 0
+            },
+            compile_format('%H:%M').parse('22:32')
+        )
+
+    def test_parse_classic_day_of_year(self):
+        f = compile_format('%y %j')
+
+        self.assertEqual((2016, 2, 29), self._date(f.parse('16 060')))
+        self.assertEqual((1975, 12, 31), self._date(f.parse('75 365')))
+
+    def test_parse_classic_falls_back_to_strptime(self):
+        f = compile_format('%Y-%m-%d')
+
+        self.assertEqual((1975, 5, 2), self._date(f.parse('1975-5-2')))
+        self.assertRaises(ValueError, f.parse, '1975-13-02')
+        self.assertRaises(ValueError, f.parse, '1975-05-02 ')
+
+        f = compile_format('%d %B %Y')
+
+        self.assertEqual((1975, 5, 21), self._date(f.parse('21 May 1975')))
+
+    def test_parse_alternative_fixed_widths(self):
+        f = compile_format('YYYY-MM-DD[T]HH:mm:ss.SSS ZZ', 'alternative')
+
+        self.assertEqual(
+            {
+                'year': 1975, 'month': 5, 'day': 21,
+                'hour': 22, 'minute': 32, 'second': 11,
+                'microsecond': 123000, 'offset': 3600
+            },
+            f.parse('1975-05-21T22:32:11.123 +01:00')
+        )
+        self.assertRaises(ValueError, f.parse, '1975-05-21T22:32:11.123 +0100')
+        self.assertRaises(ValueError, f.parse, '1975-05-32T22:32:11.123 +01:00')
+
+    def test_parse_alternative_variable_widths(self):
+        f = compile_format('MMMM D, YYYY h:mm A', 'alternative')
+
+        parsed = f.parse('May 2, 1975 10:32 pm')
+        self.assertEqual((1975, 5, 2), self._date(parsed))
+        self.assertEqual(22, parsed['hour'])
+        self.assertEqual(0, f.parse('May 2, 1975 12:32 AM')['hour'])
+
+        self.assertRaises(ValueError, f.parse, 'Foo 2, 1975 10:32 PM')
+
+    def test_parse_alternative_localized_names(self):
+        f = compile_format('dddd D MMMM YYYY', 'alternative', 'fr')
+
+        self.assertEqual((1975, 5, 21), self._date(f.parse('mercredi 21 mai 1975')))
+
+    def test_parse_alternative_default_date_formats(self):
+        f = compile_format('LLL', 'alternative', 'en')
+        parsed = f.parse('May 21, 1975 10:32 PM')
+
+        self.assertEqual((1975, 5, 21), self._date(parsed))
+        self.assertEqual(22, parsed['hour'])
+
+    def test_parse_alternative_timezone_and_timestamp(self):
+        f = compile_format('X zz', 'alternative')
+
+        parsed = f.parse('1234567890 Europe/Paris')
+        self.assertEqual(1234567890, parsed['timestamp'])
+        self.assertEqual('Europe/Paris', parsed['timezone'])
+
+    def test_parse_unsupported_token(self):
+        f = compile_format('Do MMMM', 'alternative')
+
+        self.assertRaises(ValueError, f.parse, '1st May')
+
+    def test_format_alternative(self):
+        d = Pendulum(1975, 5, 21, 22, 32, 11, 123456, 'Europe/Paris')
+        f = compile_format('dddd Do MMMM YYYY HH:mm:ss.SSS ZZ [at] zz', 'alternative')
+
+        self.assertEqual(
+            d.format(f.fmt, formatter='alternative'),
+            f.format(d)
+        )
+        self.assertEqual(
+            d.format(f.fmt, 'fr', formatter='alternative'),
+            f.format(d, 'fr')
+        )
+
+    def test_format_classic(self):
+        d = Pendulum(1975, 5, 21, 22, 32, 11)
+        f = compile_format('%A %d %B %Y')
+
+        self.assertEqual('Wednesday 21 May 1975', f.format(d))
+        self.assertEqual('mercredi 21 mai 1975', f.format(d, 'fr'))
+
+    def test_round_trip(self):
+        d = Pendulum(1975, 5, 21, 22, 32, 11, 123456, 3.5)
+
+        for fmt, formatter in [('%Y-%m-%dT%H:%M:%S.%f%z', 'classic'),
+                               ('YYYY-MM-DD HH:mm:ss.SSSSSS Z', 'alternative')]:
+            f = compile_format(fmt, formatter)
+
+            self.assertEqual(
+                d,
+                Pendulum.create_from_format(f.format(d), fmt, formatter=formatter)
+            )
+
+    def test_unsupported_formatter_can_only_format(self):
+        class UpperFormatter(Formatter):
+
+            def format(self, dt, fmt, locale=None):
+                return fmt.upper()
+
+        f = CompiledFormat('foo', UpperFormatter())
+
+        self.assertEqual('FOO', f.format(Pendulum(1975, 5, 21)))
+        self.assertRaises(ValueError, f.parse, 'FOO')
+
+    def _date(self, parsed):
+        return parsed['year'], parsed['month'], parsed['day']
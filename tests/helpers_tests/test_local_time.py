@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from pendulum.helpers import local_time
+from pendulum.helpers import local_time, local_times
 from pendulum import Pendulum
 from .. import AbstractTestCase
 
@@ -30,3 +30,61 @@ class LocalTimeTest(AbstractTestCase):
         self.assertEqual(d.minute, t[4])
         self.assertEqual(d.second, t[5])
         self.assertEqual(d.microsecond, t[6])
+
+    def test_local_time_boundaries(self):
+        self.assertEqual(
+            (1, 1, 1, 0, 0, 0, 0),
+            local_time(-62135596800, 0, 0)
+        )
+        self.assertEqual(
+            (9999, 12, 31, 23, 59, 59, 0),
+            local_time(253402300799, 0, 0)
+        )
+        self.assertEqual(
+            (2016, 2, 29, 23, 0, 0, 0),
+            local_time(1456790400, -3600, 0)
+        )
+        self.assertEqual(
+            (2000, 3, 1, 0, 0, 0, 0),
+            local_time(951865200, 3600, 0)
+        )
+
+    def test_python_local_time_matches(self):
+        from pendulum._extensions.helpers import local_time as py_local_time
+
+        for unix_time in range(-62135596800, 253402300800, 9999991):
+            for utc_offset in (-50400, 0, 19800):
+                self.assertEqual(
+                    local_time(unix_time, utc_offset, 1),
+                    py_local_time(unix_time, utc_offset, 1)
+                )
+
+    def test_local_times(self):
+        unix_times = [-1, 0, 86399, 86400, 951782399, 951782400]
+
+        self.assertEqual(
+            [local_time(t, 3600, 0) for t in unix_times],
+            local_times(unix_times, 3600)
+        )
+        self.assertEqual(
+            [local_time(t, -t % 7, t % 10) for t in unix_times],
+            local_times(
+                unix_times,
+                [-t % 7 for t in unix_times],
+                [t % 10 for t in unix_times]
+            )
+        )
+        self.assertEqual([], local_times([], 0))
+
+    def test_local_times_with_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('NumPy is not installed.')
+
+        unix_times = numpy.array([-1, 0, 1500000000], dtype='int64')
+
+        self.assertEqual(
+            [local_time(t, 0, 5) for t in unix_times.tolist()],
+            local_times(unix_times, numpy.zeros(3, dtype='int64'), numpy.full(3, 5))
+        )
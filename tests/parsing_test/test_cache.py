@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+from pendulum.parsing.cache import ParseCache, CacheInfo
+
+from .. import AbstractTestCase
+
+
+class ParseCacheTest(AbstractTestCase):
+
+    def test_get_and_set(self):
+        cache = ParseCache(2)
+
+        self.assertIsNone(cache.get(('2016-10-16', ())))
+
+        cache.set(('2016-10-16', ()), 1)
+        self.assertEqual(1, cache.get(('2016-10-16', ())))
+        self.assertEqual(1, len(cache))
+
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_least_recently_used_are_discarded(self):
+        cache = ParseCache(2)
+
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+    def test_info(self):
+        cache = ParseCache(10)
+
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('b')
+
+        self.assertEqual(CacheInfo(1, 1, 10, 1), cache.info())
+
+        cache.clear()
+
+        self.assertEqual(CacheInfo(0, 0, 10, 0), cache.info())
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, ParseCache, 0)
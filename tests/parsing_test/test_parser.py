@@ -595,3 +595,127 @@ class ParserTest(AbstractTestCase):
         self.assertEqual(15, parsed['hour'])
         self.assertEqual(45, parsed['minute'])
         self.assertEqual(28, parsed['second'])
+
+    def test_rfc_2822(self):
+        text = 'Fri, 21 Nov 1997 09:55:06 -0600'
+
+        parsed = Parser().parse(text)
+
+        self.assertEqual(1997, parsed['year'])
+        self.assertEqual(11, parsed['month'])
+        self.assertEqual(21, parsed['day'])
+        self.assertEqual(9, parsed['hour'])
+        self.assertEqual(55, parsed['minute'])
+        self.assertEqual(6, parsed['second'])
+        self.assertEqual(0, parsed['subsecond'])
+        self.assertEqual(-21600, parsed['offset'])
+
+        text = '21 Nov 97 09:55 EST (Eastern Standard Time)'
+
+        parsed = Parser().parse(text)
+
+        self.assertEqual(1997, parsed['year'])
+        self.assertEqual(11, parsed['month'])
+        self.assertEqual(21, parsed['day'])
+        self.assertEqual(9, parsed['hour'])
+        self.assertEqual(55, parsed['minute'])
+        self.assertEqual(0, parsed['second'])
+        self.assertEqual(-18000, parsed['offset'])
+
+    def test_rfc_1123(self):
+        text = 'Sun, 06 Nov 1994 08:49:37 GMT'
+
+        parsed = Parser().parse(text)
+
+        self.assertEqual(1994, parsed['year'])
+        self.assertEqual(11, parsed['month'])
+        self.assertEqual(6, parsed['day'])
+        self.assertEqual(8, parsed['hour'])
+        self.assertEqual(49, parsed['minute'])
+        self.assertEqual(37, parsed['second'])
+        self.assertEqual(0, parsed['subsecond'])
+        self.assertEqual(0, parsed['offset'])
+
+    def test_rfc_850(self):
+        text = 'Sunday, 06-Nov-94 08:49:37 GMT'
+
+        parsed = Parser().parse(text)
+
+        self.assertEqual(1994, parsed['year'])
+        self.assertEqual(11, parsed['month'])
+        self.assertEqual(6, parsed['day'])
+        self.assertEqual(8, parsed['hour'])
+        self.assertEqual(49, parsed['minute'])
+        self.assertEqual(37, parsed['second'])
+        self.assertEqual(0, parsed['offset'])
+
+    def test_asctime(self):
+        text = 'Sun Nov  6 08:49:37 1994'
+
+        parsed = Parser().parse(text)
+
+        self.assertEqual(1994, parsed['year'])
+        self.assertEqual(11, parsed['month'])
+        self.assertEqual(6, parsed['day'])
+        self.assertEqual(8, parsed['hour'])
+        self.assertEqual(49, parsed['minute'])
+        self.assertEqual(37, parsed['second'])
+        self.assertEqual(None, parsed['offset'])
+
+    def test_rfc_2822_strict(self):
+        text = 'Sun, 06 Nov 1994 08:49:37 GMT'
+
+        parsed = Parser(strict=True).parse(text)
+
+        self.assertEqual(1994, parsed['year'])
+        self.assertEqual(8, parsed['hour'])
+        self.assertEqual(0, parsed['offset'])
+
+    def test_sniff(self):
+        parser = Parser(sniff=True)
+
+        parsed = parser.parse('21/05/1975 22:32:11')
+        self.assertEqual((1975, 5, 21, 22), (parsed['year'], parsed['month'], parsed['day'], parsed['hour']))
+
+        # The layout of the first string is used for the next ones
+        parsed = parser.parse('01/02/1975 22:32:11')
+        self.assertEqual((1975, 2, 1), (parsed['year'], parsed['month'], parsed['day']))
+
+        parsed = Parser().parse('01/02/1975 22:32:11')
+        self.assertEqual((1975, 1, 2), (parsed['year'], parsed['month'], parsed['day']))
+
+    def test_sniff_falls_back_on_miss(self):
+        parser = Parser(sniff=True)
+
+        parser.parse('21/05/1975 22:32:11')
+        parsed = parser.parse('1975-05-22T22:32:11+01:00')
+
+        self.assertEqual(22, parsed['day'])
+        self.assertEqual(3600, parsed['offset'])
+        self.assertRaises(ParserError, parser.parse, 'foo')
+
+    def test_timezone_abbreviation(self):
+        parsed = Parser().parse('2017-03-01 10:00 CEST')
+
+        self.assertEqual((2017, 3, 1, 10), (parsed['year'], parsed['month'], parsed['day'], parsed['hour']))
+        self.assertEqual(7200, parsed['offset'])
+
+        parsed = Parser().parse('March 1 2017 10:00 PST')
+
+        self.assertEqual(1, parsed['day'])
+        self.assertEqual(-28800, parsed['offset'])
+
+    def test_timezone_abbreviation_region(self):
+        self.assertEqual(-21600, Parser().parse('2017-03-01 10:00 CST')['offset'])
+        self.assertEqual(28800, Parser(region='Asia').parse('2017-03-01 10:00 CST')['offset'])
+
+    def test_timezone_abbreviation_without_date_in_strict_mode(self):
+        self.assertEqual(7200, Parser().parse('10:00 CEST')['offset'])
+        self.assertRaises(ParserError, Parser(strict=True).parse, '10:00 CEST')
+        self.assertIsNone(Parser(strict=True).try_parse('10:00 CEST'))
+
+    def test_timezone_abbreviation_unknown(self):
+        parsed = Parser().parse('2017-03-01 10:00 FOO')
+
+        self.assertEqual(10, parsed['hour'])
+        self.assertIsNone(parsed['offset'])
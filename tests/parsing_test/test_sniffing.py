@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from .. import AbstractTestCase
+from pendulum.parsing.sniffing import guess_format, guess_day_month_order
+
+
+class GuessFormatTest(AbstractTestCase):
+
+    def test_numeric_dates(self):
+        self.assertEqual(
+            '%d/%m/%Y %H:%M:%S',
+            guess_format('21/05/1975 22:32:11', self._parsed(1975, 5, 21, 22, 32, 11))
+        )
+        self.assertEqual(
+            '%m/%d/%y',
+            guess_format('05/21/75', self._parsed(1975, 5, 21))
+        )
+
+    def test_names(self):
+        self.assertEqual(
+            '%a %b %d %H:%M:%S %Y',
+            guess_format('Wed Nov 05 22:32:11 1975', self._parsed(1975, 11, 5, 22, 32, 11))
+        )
+        self.assertEqual(
+            '%B %d, %Y %I:%M %p',
+            guess_format('May 21, 1975 10:32 PM', self._parsed(1975, 5, 21, 22, 32))
+        )
+
+    def test_fraction_and_offset(self):
+        self.assertEqual(
+            '%d.%m.%Y %H:%M:%S,%f %z',
+            guess_format(
+                '21.05.1975 22:32:11,5 +01:30',
+                self._parsed(1975, 5, 21, 22, 32, 11, 500000, 5400)
+            )
+        )
+
+    def test_ambiguous_formats_are_not_guessed(self):
+        self.assertIsNone(guess_format('05/05/1975', self._parsed(1975, 5, 5)))
+        self.assertIsNone(guess_format('01/02/1975', self._parsed(1975, 1, 2)))
+        self.assertIsNone(guess_format('01/02/1975', self._parsed(1975, 2, 1)))
+        self.assertIsNone(guess_format('22:32:11', self._parsed(1975, 5, 21, 22, 32, 11)))
+        self.assertIsNone(guess_format('21st of May 1975', self._parsed(1975, 5, 21)))
+        self.assertIsNone(
+            guess_format('21/05/1975 22:32 UTC', self._parsed(1975, 5, 21, 22, 32, offset=0))
+        )
+
+    def test_day_month_order(self):
+        self.assertEqual('md', guess_day_month_order('01/02/1975', self._parsed(1975, 1, 2)))
+        self.assertEqual('dm', guess_day_month_order('21/05/1975', self._parsed(1975, 5, 21)))
+        self.assertIsNone(guess_day_month_order('05/05/1975', self._parsed(1975, 5, 5)))
+        self.assertIsNone(guess_day_month_order('May 21, 1975', self._parsed(1975, 5, 21)))
+
+    def _parsed(self, year, month, day, hour=0, minute=0, second=0,
+                subsecond=0, offset=None):
+        return {
+            'year': year, 'month': month, 'day': day,
+            'hour': hour, 'minute': minute, 'second': second,
+            'subsecond': subsecond, 'offset': offset
+        }
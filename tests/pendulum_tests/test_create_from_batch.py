@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import types
+
+import pendulum
+from pendulum import Pendulum, timezone
+
+from .. import AbstractTestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class CreateFromBatchTest(AbstractTestCase):
+
+    def test_from_timestamps(self):
+        timestamps = [0, 1.5, -1, 1489896000]
+        instances = Pendulum.from_timestamps(timestamps)
+
+        self.assertEqual(4, len(instances))
+        self.assertIsInstanceOfPendulum(instances[0])
+        self.assertPendulum(instances[0], 1970, 1, 1, 0, 0, 0, 0)
+        self.assertPendulum(instances[1], 1970, 1, 1, 0, 0, 1, 500000)
+        self.assertPendulum(instances[2], 1969, 12, 31, 23, 59, 59, 0)
+        self.assertPendulum(instances[3], 2017, 3, 19, 4, 0, 0, 0)
+        self.assertEqual('UTC', instances[0].timezone_name)
+
+    def test_from_timestamps_with_timezone(self):
+        timestamps = [0, 1489896000, 1500000000]
+        instances = Pendulum.from_timestamps(timestamps, 'America/Toronto')
+
+        for timestamp, d in zip(timestamps, instances):
+            self.assertEqual('America/Toronto', d.timezone_name)
+            self.assertEqual(
+                Pendulum.create_from_timestamp(timestamp, 'America/Toronto'), d
+            )
+            self.assertEqual(
+                Pendulum.create_from_timestamp(timestamp, 'America/Toronto').offset,
+                d.offset
+            )
+
+        self.assertPendulum(instances[0], 1969, 12, 31, 19, 0, 0)
+        self.assertEqual(-5 * 3600, instances[0].offset)
+        self.assertEqual(-4 * 3600, instances[1].offset)
+
+    def test_from_timestamps_with_units(self):
+        d = Pendulum.from_timestamps([1500000000123], unit='ms')[0]
+        self.assertPendulum(d, 2017, 7, 14, 2, 40, 0, 123000)
+
+        d = Pendulum.from_timestamps([1500000000123456], unit='us')[0]
+        self.assertPendulum(d, 2017, 7, 14, 2, 40, 0, 123456)
+
+        d = Pendulum.from_timestamps([-1500], unit='ms')[0]
+        self.assertPendulum(d, 1969, 12, 31, 23, 59, 58, 500000)
+
+    def test_from_timestamps_invalid_unit(self):
+        self.assertRaises(ValueError, Pendulum.from_timestamps, [0], unit='ns')
+
+    def test_from_timestamps_lazy(self):
+        instances = Pendulum.from_timestamps(iter([0, 1]), lazy=True)
+        self.assertIsInstance(instances, types.GeneratorType)
+        self.assertEqual(
+            [Pendulum(1970, 1, 1), Pendulum(1970, 1, 1, 0, 0, 1)],
+            list(instances)
+        )
+
+    def test_from_timestamps_numpy_array(self):
+        if numpy is None:
+            self.skipTest('NumPy is not installed.')
+
+        timestamps = numpy.array([0, 1500], dtype='int64')
+        instances = pendulum.from_timestamps(timestamps, timezone('Europe/Paris'), unit='ms')
+        self.assertPendulum(instances[0], 1970, 1, 1, 1, 0, 0, 0)
+        self.assertPendulum(instances[1], 1970, 1, 1, 1, 0, 1, 500000)
+
+    def test_from_fields(self):
+        instances = Pendulum.from_fields(
+            [(2016, 1, 1), (2016, 7, 1, 12, 30), (2016, 7, 1, 12, 30, 45, 123456)],
+            'Europe/Paris'
+        )
+
+        self.assertPendulum(instances[0], 2016, 1, 1, 0, 0, 0, 0)
+        self.assertEqual(3600, instances[0].offset)
+        self.assertPendulum(instances[1], 2016, 7, 1, 12, 30, 0, 0)
+        self.assertEqual(7200, instances[1].offset)
+        self.assertPendulum(instances[2], 2016, 7, 1, 12, 30, 45, 123456)
+        self.assertEqual('Europe/Paris', instances[2].timezone_name)
+
+    def test_from_fields_normalizes_transitions(self):
+        fields = [(2013, 3, 31, 2, 30), (2013, 10, 27, 2, 30)]
+        instances = Pendulum.from_fields(fields, 'Europe/Paris')
+
+        for f, d in zip(fields, instances):
+            expected = Pendulum(*f, tzinfo='Europe/Paris')
+            self.assertEqual(expected, d)
+            self.assertEqual(expected.offset, d.offset)
+
+        self.assertPendulum(instances[0], 2013, 3, 31, 3, 30, 0, 0)
+
+    def test_from_fields_lazy(self):
+        instances = pendulum.from_fields([(2016, 1, 1)], lazy=True)
+        self.assertIsInstance(instances, types.GeneratorType)
+        self.assertEqual([Pendulum(2016, 1, 1)], list(instances))
+
+    def test_from_fields_invalid(self):
+        self.assertRaises(ValueError, Pendulum.from_fields, [(2016, 2, 30)])
@@ -37,3 +37,49 @@ class CreateFromFormatTest(AbstractTestCase):
         self.assertPendulum(d, 1975, 5, 21, 22, 32, 11)
         self.assertIsInstanceOfPendulum(d)
         self.assertEqual('UTC', d.timezone_name)
+
+    def test_create_from_format_with_offset(self):
+        d = Pendulum.create_from_format(
+            '1975-05-21 22:32:11+0130', '%Y-%m-%d %H:%M:%S%z', 'Europe/London'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 11)
+        self.assertEqual(5400, d.offset)
+
+    def test_create_from_format_with_variable_widths(self):
+        d = Pendulum.create_from_format('1975-5-2 2:32', '%Y-%m-%d %H:%M')
+        self.assertPendulum(d, 1975, 5, 2, 2, 32, 0)
+
+    def test_create_from_format_with_invalid_string(self):
+        self.assertRaises(
+            ValueError,
+            Pendulum.create_from_format, '1975-05-21 22', '%Y-%m-%d %H:%M'
+        )
+
+    def test_create_from_alternative_format(self):
+        d = Pendulum.create_from_format(
+            '1975-05-21 22:32:11 +01:00', 'YYYY-MM-DD HH:mm:ss ZZ',
+            formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 11)
+        self.assertEqual(3600, d.offset)
+
+    def test_create_from_alternative_format_with_timezone_name(self):
+        d = Pendulum.create_from_format(
+            '1975-05-21 22:32 Europe/Paris', 'YYYY-MM-DD HH:mm zz',
+            formatter='alternative'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 22, 32, 0)
+        self.assertEqual('Europe/Paris', d.timezone_name)
+
+    def test_create_from_alternative_format_with_timestamp(self):
+        d = Pendulum.create_from_format(
+            '1234567890', 'X', 'Europe/Paris', formatter='alternative'
+        )
+        self.assertPendulum(d, 2009, 2, 14, 0, 31, 30)
+        self.assertEqual('Europe/Paris', d.timezone_name)
+
+    def test_create_from_alternative_format_with_locale(self):
+        d = Pendulum.create_from_format(
+            '21 mai 1975', 'D MMMM YYYY', formatter='alternative', locale='fr'
+        )
+        self.assertPendulum(d, 1975, 5, 21, 0, 0, 0)
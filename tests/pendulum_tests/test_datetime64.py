@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import pendulum
+from pendulum import Pendulum
+
+from .. import AbstractTestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Datetime64Test(AbstractTestCase):
+
+    def setUp(self):
+        super(Datetime64Test, self).setUp()
+
+        if numpy is None:
+            self.skipTest('NumPy is not installed.')
+
+    def test_from_datetime64(self):
+        values = numpy.array(
+            ['1970-01-01', '2016-07-01T12:30:45.123456', '1969-12-31T23:59:59.5'],
+            dtype='datetime64[us]'
+        )
+        instances = pendulum.from_datetime64(values)
+
+        self.assertEqual(3, len(instances))
+        self.assertIsInstanceOfPendulum(instances[0])
+        self.assertPendulum(instances[0], 1970, 1, 1, 0, 0, 0, 0)
+        self.assertPendulum(instances[1], 2016, 7, 1, 12, 30, 45, 123456)
+        self.assertPendulum(instances[2], 1969, 12, 31, 23, 59, 59, 500000)
+        self.assertEqual('UTC', instances[0].timezone_name)
+
+    def test_from_datetime64_with_timezone(self):
+        values = numpy.array(
+            ['2013-03-31T00:59:59', '2013-03-31T01:00:00', '2013-10-27T00:30:00', '2013-10-27T01:30:00'],
+            dtype='datetime64[s]'
+        )
+        instances = pendulum.from_datetime64(values, 'Europe/Paris')
+
+        self.assertPendulum(instances[0], 2013, 3, 31, 1, 59, 59, 0)
+        self.assertEqual(3600, instances[0].offset)
+        self.assertPendulum(instances[1], 2013, 3, 31, 3, 0, 0, 0)
+        self.assertEqual(7200, instances[1].offset)
+        self.assertPendulum(instances[2], 2013, 10, 27, 2, 30, 0, 0)
+        self.assertEqual(7200, instances[2].offset)
+        self.assertPendulum(instances[3], 2013, 10, 27, 2, 30, 0, 0)
+        self.assertEqual(3600, instances[3].offset)
+        self.assertEqual('Europe/Paris', instances[3].timezone_name)
+
+    def test_from_datetime64_nat(self):
+        values = numpy.array(['NaT', '2016-01-01'], dtype='datetime64[ns]')
+        instances = pendulum.from_datetime64(values, lazy=True)
+
+        self.assertIsNone(next(instances))
+        self.assertPendulum(next(instances), 2016, 1, 1, 0, 0, 0, 0)
+
+    def test_from_datetime64_invalid_dtype(self):
+        self.assertRaises(TypeError, pendulum.from_datetime64, numpy.array([1, 2]))
+
+    def test_to_datetime64(self):
+        d = Pendulum(2016, 7, 1, 12, 30, 45, 123456, tzinfo='Europe/Paris')
+
+        self.assertEqual(
+            numpy.datetime64('2016-07-01T10:30:45.123456'),
+            d.to_datetime64()
+        )
+
+    def test_to_datetime64_sequence(self):
+        values = pendulum.to_datetime64([
+            Pendulum(2016, 7, 1, 12, 30, tzinfo='Europe/Paris'),
+            None,
+            Pendulum(1969, 12, 31, 23, 59, 59, 500000)
+        ])
+
+        self.assertEqual(numpy.dtype('datetime64[us]'), values.dtype)
+        self.assertEqual(numpy.datetime64('2016-07-01T10:30'), values[0])
+        self.assertTrue(numpy.isnat(values[1]))
+        self.assertEqual(numpy.datetime64('1969-12-31T23:59:59.5'), values[2])
+
+    def test_round_trip(self):
+        values = numpy.arange(-10 ** 15, 10 ** 15, 10 ** 13 + 7).view('datetime64[us]')
+        instances = pendulum.from_datetime64(values, 'America/New_York')
+
+        for value, d in zip(values.tolist(), instances):
+            self.assertEqual(Pendulum.instance(value).in_tz('America/New_York'), d)
+            self.assertEqual(
+                Pendulum.instance(value).in_tz('America/New_York').offset,
+                d.offset
+            )
+
+        self.assertTrue((values == pendulum.to_datetime64(instances)).all())
@@ -145,6 +145,13 @@ class DayOfWeekModifiersTest(AbstractTestCase):
 
         self.assertRaises(PendulumException, d.nth_of, 'month', 6, pendulum.MONDAY)
 
+    def test_nth_of_invalid_occurrence(self):
+        d = Pendulum(2016, 3, 15)
+
+        self.assertRaises(PendulumException, d.nth_of, 'month', 0, pendulum.MONDAY)
+        self.assertRaises(PendulumException, d.nth_of, 'quarter', -1, pendulum.MONDAY)
+        self.assertRaises(PendulumException, d.nth_of, 'year', 0, pendulum.MONDAY)
+
     def test_nth_of_month_outside_year(self):
         d = Pendulum.create(1975, 12, 5)
 
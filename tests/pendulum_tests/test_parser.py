@@ -4,6 +4,11 @@ import pendulum
 
 from .. import AbstractTestCase
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class ParserTestCase(AbstractTestCase):
 
@@ -65,3 +70,452 @@ class ParserTestCase(AbstractTestCase):
 
         with pendulum.test(mock_now):
             assert pendulum.parse('now') == mock_now
+
+    def test_parse_many(self):
+        dts = pendulum.parse_many(
+            ['2016-10-16T12:34:56+01:30', '2016-10-17', 'Sun, 06 Nov 1994 08:49:37 GMT'],
+            tz='Europe/Paris'
+        )
+
+        self.assertEqual(3, len(dts))
+        self.assertPendulum(dts[0], 2016, 10, 16, 12, 34, 56)
+        self.assertEqual(5400, dts[0].offset)
+        self.assertPendulum(dts[1], 2016, 10, 17, 0, 0, 0)
+        self.assertEqual('Europe/Paris', dts[1].timezone_name)
+        self.assertPendulum(dts[2], 1994, 11, 6, 8, 49, 37)
+        self.assertEqual(0, dts[2].offset)
+
+    def test_parse_many_lazy(self):
+        dts = pendulum.parse_many(iter(['2016-10-16', '2016-10-17']), lazy=True)
+
+        self.assertNotIsInstance(dts, list)
+        self.assertEqual(
+            [pendulum.create(2016, 10, 16), pendulum.create(2016, 10, 17)],
+            list(dts)
+        )
+
+    def test_parse_many_strict(self):
+        dts = pendulum.parse_many(['2016-10-16', '12:34:56'], strict=True)
+
+        self.assertIsInstanceOfDate(dts[0])
+        self.assertIsInstanceOfTime(dts[1])
+
+    def test_parse_many_with_test_now(self):
+        with self.wrap_with_test_now(pendulum.create(2015, 11, 12)):
+            dts = pendulum.parse_many(['12:34:56'])
+
+        self.assertPendulum(dts[0], 2015, 11, 12, 12, 34, 56)
+
+    def test_try_parse(self):
+        self.assertPendulum(pendulum.try_parse('2016-10-16T12:34:56'), 2016, 10, 16, 12, 34, 56)
+        self.assertPendulum(pendulum.try_parse('Sun, 06 Nov 1994 08:49:37 GMT'), 1994, 11, 6, 8, 49, 37)
+        self.assertPendulum(pendulum.try_parse('May 21 1975'), 1975, 5, 21, 0, 0, 0)
+        self.assertIsInstanceOfTime(pendulum.try_parse('12:34:56', strict=True))
+
+        for text in ['', 'foo', 'n/a', '2016-13-45', '2016-02-30 10:00', '2016-10-16T25:00', 'abc123', None]:
+            self.assertIsNone(pendulum.try_parse(text))
+
+        self.assertEqual(0, pendulum.try_parse('foo', default=0))
+
+    def test_try_parse_with_test_now(self):
+        with self.wrap_with_test_now(pendulum.create(2015, 11, 12)):
+            self.assertPendulum(pendulum.try_parse('12:34:56'), 2015, 11, 12, 12, 34, 56)
+
+    def test_parse_many_sniff(self):
+        texts = ['21/05/1975 22:32', '2016-10-16T12:34:56', '01/02/1975 22:32']
+
+        dts = pendulum.parse_many(texts, sniff=True)
+        self.assertPendulum(dts[0], 1975, 5, 21, 22, 32, 0)
+        self.assertPendulum(dts[1], 2016, 10, 16, 12, 34, 56)
+        self.assertPendulum(dts[2], 1975, 1, 2, 22, 32, 0)
+
+        texts = ['21/05/1975 22:32', '01/02/1975 22:32']
+
+        dts = pendulum.parse_many(texts, sniff=True)
+        self.assertPendulum(dts[1], 1975, 2, 1, 22, 32, 0)
+
+    def test_parse_many_sniff_keeps_day_month_order(self):
+        texts = ['01/02/2016 10:00', '13/02/2016 10:00', '01/02/2016 10:00']
+
+        dts = pendulum.parse_many(texts, sniff=True)
+        self.assertPendulum(dts[0], 2016, 1, 2, 10, 0, 0)
+        self.assertPendulum(dts[1], 2016, 2, 13, 10, 0, 0)
+        self.assertPendulum(dts[2], 2016, 1, 2, 10, 0, 0)
+
+        # A layout learned month first is not swapped on a miss
+        texts = ['12/25/2016 10:00', '25/12/2016 10:00', '01/02/2016 10:00']
+
+        dts = pendulum.parse_many(texts, sniff=True)
+        self.assertPendulum(dts[1], 2016, 12, 25, 10, 0, 0)
+        self.assertPendulum(dts[2], 2016, 1, 2, 10, 0, 0)
+
+    def test_parse_many_errors(self):
+        texts = ['2016-10-16', 'invalid', None, '2016-10-17']
+
+        self.assertRaises(ValueError, pendulum.parse_many, texts)
+
+        dts = pendulum.parse_many(texts, errors='skip')
+        self.assertEqual(
+            [pendulum.create(2016, 10, 16), pendulum.create(2016, 10, 17)],
+            dts
+        )
+
+        dts = pendulum.parse_many(texts, errors='none')
+        self.assertEqual(
+            [pendulum.create(2016, 10, 16), None, None, pendulum.create(2016, 10, 17)],
+            dts
+        )
+
+        self.assertRaises(ValueError, pendulum.parse_many, texts, errors='ignore')
+
+    def test_parse_cache(self):
+        from pendulum.parsing import enable_cache, disable_cache, cache_info
+
+        self.assertIsNone(cache_info())
+
+        enable_cache(max_size=10)
+        try:
+            dt = pendulum.parse('2016-10-16T12:34:56')
+
+            self.assertIs(dt, pendulum.parse('2016-10-16T12:34:56'))
+            self.assertIsNot(dt, pendulum.parse('2016-10-16T12:34:56', tz='Europe/Paris'))
+            self.assertIsInstanceOfPendulum(pendulum.parse('2016-10-16T12:34:56', strict=True))
+            self.assertIsInstanceOfDate(pendulum.parse('2016-10-16', strict=True))
+
+            info = cache_info()
+            self.assertEqual(1, info.hits)
+            self.assertEqual(4, info.misses)
+            self.assertEqual(10, info.max_size)
+            self.assertEqual(4, info.size)
+        finally:
+            disable_cache()
+
+    def test_parse_cache_ignores_strings_without_date(self):
+        from pendulum.parsing import enable_cache, disable_cache, cache_info
+
+        enable_cache()
+        try:
+            pendulum.parse('12:34:56')
+            pendulum.parse('now')
+
+            self.assertEqual(0, cache_info().size)
+
+            with self.wrap_with_test_now(pendulum.create(2015, 11, 12)):
+                dt = pendulum.parse('12:34:56')
+
+                self.assertIs(dt, pendulum.parse('12:34:56'))
+                self.assertPendulum(dt, 2015, 11, 12, 12, 34, 56)
+        finally:
+            disable_cache()
+
+    def test_parse_cache_ignores_strings_parsed_by_dateutil(self):
+        from pendulum.parsing import enable_cache, disable_cache, cache_info
+
+        enable_cache()
+        try:
+            for text in ['10:00 PM', 'Tue 10:00', 'March 2017', 'March 6, 2017 10:00 CET']:
+                pendulum.parse(text)
+                pendulum.parse(text, strict=True)
+
+            self.assertEqual(0, cache_info().size)
+        finally:
+            disable_cache()
+
+    def test_parse_cache_depends_on_transition_rule(self):
+        from pendulum.parsing import enable_cache, disable_cache
+
+        enable_cache()
+        try:
+            dt = pendulum.parse('2013-03-31 02:30:00', tz='Europe/Paris')
+            self.assertPendulum(dt, 2013, 3, 31, 3, 30, 0)
+
+            pendulum.set_transition_rule(pendulum.PRE_TRANSITION)
+            dt = pendulum.parse('2013-03-31 02:30:00', tz='Europe/Paris')
+            self.assertPendulum(dt, 2013, 3, 31, 1, 30, 0)
+            self.assertEqual(3600, dt.offset)
+        finally:
+            pendulum.set_transition_rule(pendulum.POST_TRANSITION)
+            disable_cache()
+
+    def test_parse_timestamp(self):
+        text = '2016-10-16T12:34:56.123456+01:30'
+
+        self.assertEqual(1476615896123456, pendulum.parse_timestamp(text))
+        self.assertEqual(1476615896123, pendulum.parse_timestamp(text, unit='ms'))
+        self.assertEqual(1476615896, pendulum.parse_timestamp(text, unit='s'))
+        self.assertEqual(
+            1476615896123456,
+            pendulum.parse_timestamp(text, tz='Europe/Paris')
+        )
+
+    def test_parse_timestamp_before_epoch(self):
+        self.assertEqual(-500000, pendulum.parse_timestamp('1969-12-31T23:59:59.5'))
+        self.assertEqual(-1, pendulum.parse_timestamp('1969-12-31T23:59:59.5', unit='s'))
+
+    def test_parse_timestamp_matches_parse(self):
+        texts = [
+            '2016-10-16',
+            '2016-10-16 12:34',
+            '2016-W42-7T12:34:56Z',
+            '2016-290T12:34',
+            'Sun, 16 Oct 2016 12:34:56 +0100',
+            'Oct 16 2016 12:34:56',
+            # Skipped and repeated times
+            '2016-03-27T02:30:00',
+            '2016-10-30T02:30:00',
+        ]
+
+        for text in texts:
+            for tz in ['UTC', 'Europe/Paris', 'America/New_York', -3.5]:
+                dt = pendulum.parse(text, tz=tz)
+
+                self.assertEqual(
+                    dt.int_timestamp * 1000000 + dt.microsecond,
+                    pendulum.parse_timestamp(text, tz=tz),
+                    '{} in {}'.format(text, tz)
+                )
+
+    def test_parse_timestamp_without_date(self):
+        with self.wrap_with_test_now(pendulum.create(2015, 11, 12)):
+            self.assertEqual(
+                pendulum.create(2015, 11, 12, 12, 34, 56).int_timestamp,
+                pendulum.parse_timestamp('12:34:56', unit='s')
+            )
+
+    def test_parse_timestamp_invalid(self):
+        self.assertRaises(ValueError, pendulum.parse_timestamp, 'foo')
+        self.assertRaises(ValueError, pendulum.parse_timestamp, '2016-10-16', unit='ns')
+
+    def test_parse_timestamp_invalid_fields(self):
+        texts = [
+            '2016-02-30',
+            '2016-13-01',
+            '2016-00-10',
+            '2016-01-01T24:00',
+            '2016-01-01T25:00',
+            '2016-01-01T12:60',
+            '2016-01-01T12:30:60',
+            '2016-02-30 12:00',
+        ]
+
+        for text in texts:
+            with self.assertRaises(ValueError) as cm:
+                pendulum.parse_timestamp(text)
+
+            # The same error as parse()
+            with self.assertRaises(ValueError) as expected:
+                pendulum.parse(text)
+
+            self.assertEqual(str(expected.exception), str(cm.exception))
+
+    def test_parse_timestamp_day_first(self):
+        self.assertEqual(
+            pendulum.create(1978, 3, 7, 16, 22, 8).int_timestamp,
+            pendulum.parse_timestamp('1978-07-03T16:22:08', unit='s', day_first=True)
+        )
+        self.assertRaises(
+            ValueError,
+            pendulum.parse_timestamp, '1978-07-13T16:22:08', day_first=True
+        )
+
+    def test_parse_timestamps(self):
+        if numpy is None:
+            self.skipTest('NumPy is not installed.')
+
+        texts = [
+            '2016-10-16T12:34:56.123456+01:30',
+            '2016-03-27T02:30:00',
+            '2016-10-30T02:30:00',
+            'Sun, 16 Oct 2016 12:34:56 GMT',
+        ]
+
+        timestamps = pendulum.parse_timestamps(texts, tz='Europe/Paris', unit='ms')
+
+        self.assertEqual('int64', timestamps.dtype)
+        self.assertEqual(
+            [pendulum.parse_timestamp(text, tz='Europe/Paris', unit='ms') for text in texts],
+            timestamps.tolist()
+        )
+
+    def test_parse_timestamps_errors(self):
+        if numpy is None:
+            self.skipTest('NumPy is not installed.')
+
+        texts = ['2016-10-16', 'foo']
+
+        self.assertRaises(ValueError, pendulum.parse_timestamps, texts)
+        self.assertEqual(
+            [1476576000],
+            pendulum.parse_timestamps(texts, unit='s', errors='skip').tolist()
+        )
+
+        timestamps = pendulum.parse_timestamps(texts, unit='s', errors='none')
+        self.assertEqual(1476576000, timestamps[0])
+        self.assertTrue(numpy.isnat(timestamps.view('datetime64[s]')[1]))
+
+        texts = ['2016-10-16', '2016-02-30', '2016-10-16T25:00']
+        self.assertRaises(ValueError, pendulum.parse_timestamps, texts)
+        self.assertEqual(
+            [1476576000],
+            pendulum.parse_timestamps(texts, unit='s', errors='skip').tolist()
+        )
+
+    def test_parse_bytes(self):
+        self.assertPendulum(pendulum.parse(b'2016-10-16T12:34:56'), 2016, 10, 16, 12, 34, 56)
+        self.assertPendulum(pendulum.parse(bytearray(b'Oct 16 2016')), 2016, 10, 16, 0, 0, 0)
+        self.assertPendulum(pendulum.parse(memoryview(b'2016-10-16')), 2016, 10, 16, 0, 0, 0)
+
+    def test_parse_timestamp_from_bytes(self):
+        expected = 1476621296000000
+
+        self.assertEqual(expected, pendulum.parse_timestamp(b'2016-10-16T12:34:56Z'))
+        self.assertEqual(
+            expected,
+            pendulum.parse_timestamp(bytearray(b'[2016-10-16T12:34:56Z] GET'), offset=1, length=20)
+        )
+        self.assertEqual(
+            expected,
+            pendulum.parse_timestamp(memoryview(b'Sun, 16 Oct 2016 12:34:56 GMT'))
+        )
+        self.assertEqual(
+            expected,
+            pendulum.parse_timestamp('[2016-10-16T12:34:56Z] GET', offset=1, length=20)
+        )
+
+    def test_parse_timestamp_from_bytes_out_of_bounds(self):
+        self.assertRaises(
+            ValueError,
+            pendulum.parse_timestamp, b'2016-10-16T12:34:56Z', offset=2, length=20
+        )
+        self.assertRaises(
+            ValueError,
+            pendulum.parse_timestamp, '2016-10-16T12:34:56Z', offset=-1
+        )
+
+    def test_parse_timestamp_column(self):
+        if numpy is None:
+            self.skipTest('NumPy is not installed.')
+
+        lines = [
+            b'2016-10-16T12:34:56 GET /a\n',
+            b'2016-10-30T02:30:00 GET /b\n',
+            b'Oct 16 2016 12:34pm GET /c\n',
+        ]
+        data = bytearray(b''.join(lines))
+        starts = numpy.arange(0, len(data), len(lines[0]))
+
+        timestamps = pendulum.parse_timestamp_column(
+            data, starts, 19, tz='Europe/Paris', unit='s'
+        )
+
+        self.assertEqual('int64', timestamps.dtype)
+        self.assertEqual(
+            [
+                pendulum.parse_timestamp(line[:19], tz='Europe/Paris', unit='s')
+                for line in lines
+            ],
+            timestamps.tolist()
+        )
+
+    def test_parse_timestamp_column_errors(self):
+        if numpy is None:
+            self.skipTest('NumPy is not installed.')
+
+        data = b'2016-10-16T12:34:56\ninvalid............\n2016-10-16'
+        starts = [0, 20, 40]
+
+        self.assertRaises(ValueError, pendulum.parse_timestamp_column, data, starts, 19)
+        self.assertEqual(
+            [1476621296],
+            pendulum.parse_timestamp_column(data, starts, 19, unit='s', errors='skip').tolist()
+        )
+
+        timestamps = pendulum.parse_timestamp_column(data, starts, 19, unit='s', errors='none')
+        self.assertEqual(1476621296, timestamps[0])
+        self.assertTrue(numpy.isnat(timestamps.view('datetime64[s]')[1:]).all())
+
+        data = b'2016-10-16T12:34:56\n2016-02-30T12:34:56\n2016-10-16T24:34:56'
+        self.assertRaises(ValueError, pendulum.parse_timestamp_column, data, starts, 19)
+        self.assertEqual(
+            [1476621296],
+            pendulum.parse_timestamp_column(data, starts, 19, unit='s', errors='skip').tolist()
+        )
+
+    def test_parse_duration(self):
+        interval = pendulum.parse_duration('P1W3DT4H15M30.5S')
+
+        self.assertIsInstance(interval, pendulum.Interval)
+        self.assertEqual(
+            pendulum.Interval(weeks=1, days=3, hours=4, minutes=15, seconds=30, microseconds=500000),
+            interval
+        )
+        self.assertEqual(pendulum.Interval(hours=-1, minutes=-30), pendulum.parse_duration('-PT1.5H'))
+
+        self.assertRaises(ValueError, pendulum.parse_duration, 'P1M')
+        self.assertRaises(ValueError, pendulum.parse_duration, 'PT')
+
+    def test_parse_durations(self):
+        self.assertEqual(
+            [pendulum.Interval(minutes=15), None],
+            pendulum.parse_durations(['PT15M', 'foo'], errors='none')
+        )
+        self.assertEqual(
+            [pendulum.Interval(days=1)],
+            list(pendulum.parse_durations(['P1D', 'foo'], lazy=True, errors='skip'))
+        )
+        self.assertRaises(ValueError, pendulum.parse_durations, ['foo'])
+
+    def test_parse_interval(self):
+        period = pendulum.parse_interval('2017-01-31T00:00Z/P1M')
+        self.assertIsInstance(period, pendulum.Period)
+        self.assertPendulum(period.start, 2017, 1, 31, 0, 0, 0)
+        self.assertPendulum(period.end, 2017, 2, 28, 0, 0, 0)
+
+        period = pendulum.parse_interval('P1DT12H/2017-01-01', tz='Europe/Paris')
+        self.assertPendulum(period.start, 2016, 12, 30, 12, 0, 0)
+        self.assertPendulum(period.end, 2017, 1, 1, 0, 0, 0)
+        self.assertEqual('Europe/Paris', period.start.timezone_name)
+
+        period = pendulum.parse_interval('2017-01-01/2017-02-01')
+        self.assertPendulum(period.start, 2017, 1, 1, 0, 0, 0)
+        self.assertPendulum(period.end, 2017, 2, 1, 0, 0, 0)
+
+        period = pendulum.parse_interval('2017-01-01T10:00/12:30')
+        self.assertPendulum(period.end, 2017, 1, 1, 12, 30, 0)
+
+    def test_parse_interval_abbreviated_end(self):
+        period = pendulum.parse_interval('2008-02-15/03-14')
+        self.assertPendulum(period.end, 2008, 3, 14, 0, 0, 0)
+
+        period = pendulum.parse_interval('2017-01-01/05')
+        self.assertPendulum(period.end, 2017, 1, 5, 0, 0, 0)
+
+        period = pendulum.parse_interval('2017-01-01T10:00/15T12:00')
+        self.assertPendulum(period.end, 2017, 1, 15, 12, 0, 0)
+
+        period = pendulum.parse_interval('20170101/0305')
+        self.assertPendulum(period.end, 2017, 3, 5, 0, 0, 0)
+
+        period = pendulum.parse_interval('20170101T1000/T1230')
+        self.assertPendulum(period.end, 2017, 1, 1, 12, 30, 0)
+
+    def test_parse_interval_end_in_start_timezone(self):
+        period = pendulum.parse_interval('2017-01-01T10:00+05:00/2017-01-02T10:00')
+        self.assertPendulum(period.end, 2017, 1, 2, 10, 0, 0)
+        self.assertEqual(18000, period.end.offset)
+
+        period = pendulum.parse_interval('2017-01-01T10:00+05:00/2017-01-02T10:00Z')
+        self.assertEqual(0, period.end.offset)
+
+    def test_parse_invalid_interval(self):
+        for text in ['2017-01-01', 'P1D/P1D', '2017-01-01/P1D/2017-01-03', 'foo/P1D',
+                     '2017-01-01/', '2017-01-01T10:00/T', '2017-01-01/5',
+                     '2017-01-01/1-05', '2017-01-01/13-01', '2017-01-01/2018']:
+            self.assertRaises(ValueError, pendulum.parse_interval, text)
+
+    def test_parse_intervals(self):
+        periods = pendulum.parse_intervals(['2017-01-01/P1D', 'foo'], tz='Europe/Paris', errors='none')
+
+        self.assertPendulum(periods[0].end, 2017, 1, 2, 0, 0, 0)
+        self.assertEqual('Europe/Paris', periods[0].end.timezone_name)
+        self.assertIsNone(periods[1])
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+import pendulum
+from pendulum import Pendulum
+
+from .. import AbstractTestCase
+
+
+class RoundingTest(AbstractTestCase):
+
+    def test_floor_minute_multiple(self):
+        d = Pendulum(2017, 3, 14, 13, 47, 23, 123456, tzinfo='Europe/Paris')
+        new = d.floor('minute', 15)
+        self.assertIsInstanceOfPendulum(new)
+        self.assertPendulum(new, 2017, 3, 14, 13, 45, 0, 0)
+        self.assertEqual('Europe/Paris', new.timezone_name)
+
+    def test_floor_hour_multiple(self):
+        d = Pendulum(2017, 3, 14, 13, 47, 23, tzinfo='Europe/Paris')
+        self.assertPendulum(d.floor('hour', 6), 2017, 3, 14, 12, 0, 0, 0)
+
+    def test_floor_millisecond(self):
+        d = Pendulum(2017, 3, 14, 13, 47, 23, 123456)
+        self.assertPendulum(d.floor('millisecond', 100), 2017, 3, 14, 13, 47, 23, 100000)
+
+    def test_floor_week(self):
+        d = Pendulum(2017, 3, 16, 13, 47, 23)
+        new = d.floor('week')
+        self.assertPendulum(new, 2017, 3, 13, 0, 0, 0, 0)
+        self.assertEqual(pendulum.MONDAY, new.day_of_week)
+
+    def test_floor_month_multiple(self):
+        d = Pendulum(2017, 8, 16, 13, 47, 23)
+        self.assertPendulum(d.floor('month', 3), 2017, 7, 1, 0, 0, 0, 0)
+
+    def test_floor_year_multiple(self):
+        d = Pendulum(2017, 8, 16, 13, 47, 23)
+        self.assertPendulum(d.floor('year', 10), 2010, 1, 1, 0, 0, 0, 0)
+
+    def test_floor_on_boundary_returns_same_instance(self):
+        d = Pendulum(2017, 3, 14, 13, 45)
+        self.assertIs(d, d.floor('minute', 15))
+        self.assertIs(d, d.ceil('minute', 15))
+        self.assertIs(d, d.round('minute', 15))
+
+    def test_floor_keeps_offset_in_repeated_time(self):
+        d = Pendulum(2013, 11, 3, 5, 30, 0, tzinfo='UTC').in_tz('America/New_York')
+        self.assertEqual(-4 * 3600, d.offset)
+
+        new = d.floor('hour')
+        self.assertPendulum(new, 2013, 11, 3, 1, 0, 0, 0)
+        self.assertEqual(-4 * 3600, new.offset)
+
+        d = Pendulum(2013, 11, 3, 6, 30, 0, tzinfo='UTC').in_tz('America/New_York')
+        self.assertEqual(-5 * 3600, d.offset)
+
+        new = d.floor('hour')
+        self.assertPendulum(new, 2013, 11, 3, 1, 0, 0, 0)
+        self.assertEqual(-5 * 3600, new.offset)
+
+    def test_floor_in_skipped_time(self):
+        d = Pendulum(2013, 3, 10, 3, 10, tzinfo='America/New_York')
+        new = d.floor('hour', 2)
+        self.assertPendulum(new, 2013, 3, 10, 3, 0, 0, 0)
+        self.assertEqual(-4 * 3600, new.offset)
+
+    def test_ceil(self):
+        d = Pendulum(2017, 3, 14, 13, 47, 23, tzinfo='Europe/Paris')
+        self.assertPendulum(d.ceil('minute', 5), 2017, 3, 14, 13, 50, 0, 0)
+        self.assertPendulum(d.ceil('day'), 2017, 3, 15, 0, 0, 0, 0)
+        self.assertPendulum(d.ceil('month', 3), 2017, 4, 1, 0, 0, 0, 0)
+
+    def test_ceil_across_transition(self):
+        d = Pendulum(2013, 3, 10, 1, 30, tzinfo='America/New_York')
+        new = d.ceil('hour')
+        self.assertPendulum(new, 2013, 3, 10, 3, 0, 0, 0)
+        self.assertEqual(-4 * 3600, new.offset)
+
+    def test_round(self):
+        d = Pendulum(2017, 3, 14, 13, 47, 23)
+        self.assertPendulum(d.round('minute', 15), 2017, 3, 14, 13, 45, 0, 0)
+        self.assertPendulum(d.round('hour'), 2017, 3, 14, 14, 0, 0, 0)
+        self.assertPendulum(d.round('day'), 2017, 3, 15, 0, 0, 0, 0)
+
+    def test_round_tie_rounds_up(self):
+        d = Pendulum(2017, 3, 14, 13, 30)
+        self.assertPendulum(d.round('hour'), 2017, 3, 14, 14, 0, 0, 0)
+
+    def test_invalid_unit(self):
+        d = Pendulum(2017, 3, 14, 13, 47, 23)
+        self.assertRaises(ValueError, d.floor, 'quarter')
+        self.assertRaises(ValueError, d.ceil, 'hour', 0)
+
+    def test_floor_timestamps(self):
+        timestamps = [1325418443, 1325419043.5, 1325421000]
+        self.assertEqual(
+            [1325418300, 1325418300, 1325421000],
+            pendulum.floor_timestamps(timestamps, 'minute', 15, tz='Europe/Paris')
+        )
+
+    def test_ceil_timestamps(self):
+        self.assertEqual(
+            [60, 0],
+            pendulum.ceil_timestamps([1, 0], 'minute')
+        )
+        self.assertEqual(
+            [1.3, 2],
+            pendulum.ceil_timestamps([1.25, 1.95], 'millisecond', 100)
+        )
+
+    def test_round_timestamps(self):
+        self.assertEqual(
+            [0, 60, 120],
+            pendulum.round_timestamps([29, 89, 90], 'minute')
+        )
+
+    def test_timestamps_match_instances(self):
+        tz = 'America/New_York'
+        start = Pendulum(2013, 11, 2, 22, 17, tzinfo=tz)
+        instances = [start.add(minutes=37 * i) for i in range(20)]
+        timestamps = [d.timestamp() for d in instances]
+
+        for method in ['floor', 'ceil', 'round']:
+            expected = [getattr(d, method)('hour').timestamp() for d in instances]
+            self.assertEqual(
+                expected,
+                getattr(pendulum, method + '_timestamps')(timestamps, 'hour', tz=tz)
+            )
@@ -64,6 +64,33 @@ class StringsTest(AbstractTestCase):
         d = Pendulum(1975, 12, 25, 14, 15, 16, 123456, tzinfo='local')
         self.assertEqual('1975-12-25T14:15:16.123456-05:00', d.to_iso8601_string(True))
 
+    def test_to_iso8601_string_before_1000(self):
+        d = Pendulum(999, 12, 25, 14, 15, 16, tzinfo='local')
+        self.assertEqual(d.format(d.ISO8601, formatter='classic'), d.to_iso8601_string())
+
+    def test_isoformat(self):
+        d = Pendulum(1975, 12, 25, 14, 15, 16, tzinfo='local')
+        self.assertEqual('1975-12-25T14:15:16-05:00', d.isoformat())
+        self.assertEqual('1975-12-25 14:15:16-05:00', d.isoformat(' '))
+        self.assertEqual(u'1975-12-25\xe914:15:16-05:00', d.isoformat(u'\xe9'))
+
+        d = Pendulum(1975, 12, 25, 14, 15, 16, 123456, tzinfo='Europe/Paris')
+        self.assertEqual('1975-12-25T14:15:16.123456+01:00', d.isoformat())
+
+    def test_isoformat_many(self):
+        dts = [
+            Pendulum(1975, 12, 25, 14, 15, 16, tzinfo='local'),
+            Pendulum(1975, 12, 25, 14, 15, 16, 123456, tzinfo='Europe/Paris')
+        ]
+        self.assertEqual(
+            ['1975-12-25T14:15:16-05:00', '1975-12-25T14:15:16.123456+01:00'],
+            Pendulum.isoformat_many(dts)
+        )
+        self.assertEqual(
+            ['1975-12-25 14:15:16-05:00', '1975-12-25 14:15:16.123456+01:00'],
+            Pendulum.isoformat_many(iter(dts), ' ')
+        )
+
     def test_to_rfc822_string(self):
         d = Pendulum(1975, 12, 25, 14, 15, 16, tzinfo='local')
         self.assertEqual('Thu, 25 Dec 75 14:15:16 -0500', d.to_rfc822_string())
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import pendulum
+from pendulum import Clock, Pendulum, helpers
+from pendulum import clock as clock_module
+
+from . import AbstractTestCase
+
+
+class ClockTest(AbstractTestCase):
+
+    def test_now(self):
+        clock = Clock('Europe/Paris')
+        before = Pendulum.utcnow()
+        now = clock.now()
+        after = Pendulum.utcnow()
+
+        self.assertIsInstanceOfPendulum(now)
+        self.assertEqual('Europe/Paris', now.timezone_name)
+        self.assertTrue(before <= now <= after)
+        self.assertEqual(now.in_tz('Europe/Paris').offset, now.offset)
+
+    def test_now_defaults_to_utc(self):
+        self.assertEqual('UTC', Clock().now().timezone_name)
+
+    def test_timezone_is_resolved_once(self):
+        clock = Clock('Europe/Paris')
+        self.assertIs(pendulum.timezone('Europe/Paris'), clock.timezone)
+        self.assertIs(clock.timezone, clock.tz)
+
+    def test_now_across_transition(self):
+        clock = Clock('Europe/Paris')
+        transition = Pendulum(2013, 3, 31, 1, 0, 0).int_timestamp
+
+        clock._time = lambda: (transition - 1, 123456)
+        now = clock.now()
+        self.assertPendulum(now, 2013, 3, 31, 1, 59, 59, 123456)
+        self.assertEqual(3600, now.offset)
+        self.assertEqual(transition, clock._transition[3])
+
+        clock._time = lambda: (transition, 0)
+        now = clock.now()
+        self.assertPendulum(now, 2013, 3, 31, 3, 0, 0, 0)
+        self.assertEqual(7200, now.offset)
+
+        clock._time = lambda: (transition - 3600, 0)
+        now = clock.now()
+        self.assertPendulum(now, 2013, 3, 31, 1, 0, 0, 0)
+        self.assertEqual(3600, now.offset)
+
+    def test_now_with_test_now(self):
+        clock = Clock('Europe/Paris')
+        test_now = Pendulum(2013, 3, 31, 12, 0, 0)
+
+        with pendulum.test(test_now):
+            now = clock.now()
+
+        self.assertEqual(test_now, now)
+        self.assertEqual('Europe/Paris', now.timezone_name)
+        self.assertPendulum(now, 2013, 3, 31, 14, 0, 0)
+
+    def test_coarse_resolution_reuses_instance(self):
+        clock = Clock('Europe/Paris', resolution='ms')
+
+        clock._time = lambda: (1500000000, 123456)
+        now = clock.now()
+        self.assertPendulum(now, 2017, 7, 14, 4, 40, 0, 123000)
+
+        clock._time = lambda: (1500000000, 123999)
+        self.assertIs(now, clock.now())
+
+        clock._time = lambda: (1500000000, 124000)
+        new = clock.now()
+        self.assertIsNot(now, new)
+        self.assertPendulum(new, 2017, 7, 14, 4, 40, 0, 124000)
+
+    def test_second_resolution(self):
+        clock = Clock(resolution='s')
+
+        clock._time = lambda: (1500000000, 999999)
+        self.assertPendulum(clock.now(), 2017, 7, 14, 2, 40, 0, 0)
+
+    def test_invalid_resolution(self):
+        self.assertRaises(ValueError, Clock, resolution='ns')
+
+    def test_format_is_cached_within_tick(self):
+        clock = Clock(resolution='s')
+
+        clock._time = lambda: (1500000000, 1)
+        self.assertEqual('2017-07-14 02:40:00', clock.format('%Y-%m-%d %H:%M:%S', formatter='classic'))
+        self.assertEqual(1, len(clock._state[2]))
+
+        clock._time = lambda: (1500000000, 2)
+        self.assertEqual('2017-07-14 02:40:00', clock.format('%Y-%m-%d %H:%M:%S', formatter='classic'))
+        self.assertEqual(1, len(clock._state[2]))
+        self.assertEqual('Friday', clock.format('dddd', formatter='alternative'))
+        self.assertEqual('vendredi', clock.format('dddd', 'fr', 'alternative'))
+
+        clock._time = lambda: (1500000001, 0)
+        self.assertEqual('2017-07-14 02:40:01', clock.format('%Y-%m-%d %H:%M:%S', formatter='classic'))
+        self.assertEqual(1, len(clock._state[2]))
+
+    def test_format_with_test_now(self):
+        clock = Clock(resolution='s')
+
+        with pendulum.test(Pendulum(2013, 3, 31, 12, 0, 0)):
+            self.assertEqual('2013-03-31', clock.format('%Y-%m-%d', formatter='classic'))
+
+        self.assertEqual({}, clock._state[2])
+
+    def test_now_is_published_once_built(self):
+        # Another caller getting the time while the instance
+        # of a new tick is being built must not see a partial state
+        clock = Clock('Europe/Paris', resolution='s')
+        clock._time = lambda: (1500000000, 0)
+        concurrent = []
+
+        def local_time(*args):
+            if not concurrent:
+                concurrent.append(None)
+                concurrent[0] = clock.now()
+
+            return helpers.local_time(*args)
+
+        clock_module.local_time = local_time
+        try:
+            now = clock.now()
+        finally:
+            clock_module.local_time = helpers.local_time
+
+        self.assertPendulum(concurrent[0], 2017, 7, 14, 4, 40, 0, 0)
+        self.assertPendulum(now, 2017, 7, 14, 4, 40, 0, 0)
@@ -1,7 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from datetime import datetime, date, time
-from pendulum.helpers import precise_diff, parse_iso8601
+from array import array
+from datetime import datetime, date, time, timedelta
+from pendulum.helpers import (
+    precise_diff, add_duration, parse_iso8601, parse_rfc2822,
+    try_parse_iso8601, try_parse_rfc2822, parse_iso8601_duration, TZFixedOffset,
+    format_iso8601, format_iso8601_many, format_iso8601_column,
+    days_from_civil, civil_from_days, add_months,
+    next_day_of_week, previous_day_of_week,
+    nth_day_of_week, last_day_of_week
+)
+from pendulum.constants import EPOCH_ORDINAL, MONDAY, SUNDAY, FRIDAY
 from pendulum.tz.timezone import FixedTimezone
 
 from . import AbstractTestCase
@@ -48,11 +57,6 @@ class HelpersTestCase(AbstractTestCase):
         )
 
     def test_parse_iso8601(self):
-        if not parse_iso8601:
-            self.skipTest('parse_iso8601 is only supported with C extensions.')
-
-        from pendulum._extensions._helpers import TZFixedOffset
-
         # Date
         self.assertEqual(date(2016, 1, 1), parse_iso8601('2016'))
         self.assertEqual(date(2016, 10, 1), parse_iso8601('2016-10'))
@@ -121,9 +125,6 @@ class HelpersTestCase(AbstractTestCase):
         self.assertEqual(datetime(2008, 9, 27, 9, 0, 0, 0), parse_iso8601('2008-W39-6T09'))
 
     def test_parse_ios8601_invalid(self):
-        if not parse_iso8601:
-            self.skipTest('parse_iso8601 is only supported with C extensions.')
-
         # Invalid month
         self.assertRaises(ValueError, parse_iso8601, '20161306T123456')
 
@@ -175,13 +176,308 @@ class HelpersTestCase(AbstractTestCase):
         self.assertRaises(ValueError, parse_iso8601, '2012W12-3')  # Missing separator
         self.assertRaises(ValueError, parse_iso8601, '2012-W123')  # Missing separator
 
+    def test_days_from_civil(self):
+        self.assertEqual(0, days_from_civil(1970, 1, 1))
+        self.assertEqual(-1, days_from_civil(1969, 12, 31))
+        self.assertEqual(11016, days_from_civil(2000, 2, 29))
+        self.assertEqual(1 - EPOCH_ORDINAL, days_from_civil(1, 1, 1))
+
+        for d in [date(1, 1, 1), date(1600, 3, 1), date(2016, 2, 29), date(9999, 12, 31)]:
+            days = d.toordinal() - EPOCH_ORDINAL
+            self.assertEqual(days, days_from_civil(d.year, d.month, d.day))
+            self.assertEqual((d.year, d.month, d.day), civil_from_days(days))
+
+    def test_civil_from_days_round_trip(self):
+        for days in range(-800000, 3000000, 997):
+            self.assertEqual(days, days_from_civil(*civil_from_days(days)))
+
+    def test_add_months(self):
+        self.assertEqual((2016, 2, 29), add_months(2016, 1, 31, 1))
+        self.assertEqual((2015, 2, 28), add_months(2016, 1, 31, -11))
+        self.assertEqual((2017, 3, 31), add_months(2016, 12, 31, 3))
+        self.assertRaises(ValueError, add_months, 9999, 12, 1, 1)
+
+    def test_next_previous_day_of_week(self):
+        friday = days_from_civil(2016, 7, 1)
+
+        self.assertEqual(friday + 3, next_day_of_week(friday, MONDAY))
+        self.assertEqual(friday + 7, next_day_of_week(friday, FRIDAY))
+        self.assertEqual(friday - 4, previous_day_of_week(friday, MONDAY))
+        self.assertEqual(friday - 7, previous_day_of_week(friday, FRIDAY))
+
+    def test_nth_day_of_week(self):
+        first = days_from_civil(2016, 7, 1)
+        last = days_from_civil(2016, 7, 31)
+
+        self.assertEqual(first + 2, nth_day_of_week(first, last, 1, SUNDAY))
+        self.assertEqual(first + 30, nth_day_of_week(first, last, 5, SUNDAY))
+        self.assertIsNone(nth_day_of_week(first, last, 6, SUNDAY))
+        self.assertIsNone(nth_day_of_week(first, last, 0, SUNDAY))
+        self.assertIsNone(nth_day_of_week(first, last, -1))
+        self.assertEqual(first + 7, nth_day_of_week(first, last, 2))
+        self.assertEqual(last - 6, last_day_of_week(last, MONDAY))
+        self.assertEqual(last, last_day_of_week(last))
+
+    def test_precise_diff_dates(self):
+        diff = precise_diff(date(2016, 1, 31), date(2016, 3, 1))
+        self.assert_diff(diff, months=1, days=1)
+
+        diff = precise_diff(date(2016, 3, 1), date(2016, 1, 31))
+        self.assert_diff(diff, months=-1, days=-1)
+
+        diff = precise_diff(date(2016, 3, 1), date(2016, 3, 1))
+        self.assert_diff(diff)
+
+    def test_add_duration(self):
+        dt = datetime(2016, 1, 31, 12, 30, 45, 123456)
+
+        self.assertEqual(
+            datetime(2016, 2, 29, 12, 30, 45, 123456),
+            add_duration(dt, months=1)
+        )
+        self.assertEqual(
+            datetime(2015, 2, 28, 12, 30, 45, 123456),
+            add_duration(dt, years=-1, months=1)
+        )
+        self.assertEqual(
+            datetime(2016, 2, 8, 14, 31, 46, 123457),
+            add_duration(dt, weeks=1, days=1, hours=2, minutes=1, seconds=1, microseconds=1)
+        )
+        self.assertEqual(
+            datetime(2016, 1, 30, 12, 30, 44, 123456),
+            add_duration(dt, seconds=-86401)
+        )
+        self.assertEqual(
+            datetime(2016, 1, 31, 12, 30, 46, 623456),
+            add_duration(dt, seconds=1.5)
+        )
+        self.assertEqual(date(2016, 2, 1), add_duration(date(2016, 1, 31), hours=24))
+        self.assertEqual(date(2016, 1, 30), add_duration(date(2016, 1, 31), hours=-1))
+
+        dt = datetime(2016, 1, 31, tzinfo=FixedTimezone(3600))
+        self.assertIs(dt.tzinfo, add_duration(dt, days=1).tzinfo)
+
+        self.assertRaises(ValueError, add_duration, datetime(9999, 12, 1), months=1)
+        self.assertRaises(OverflowError, add_duration, datetime(9999, 12, 31), days=1)
+
+    def test_c_and_python_implementations_match(self):
+        try:
+            from pendulum._extensions import _helpers
+        except ImportError:
+            self.skipTest('C extensions are not available.')
+
+        from pendulum._extensions import helpers
+
+        dates = [
+            datetime(2000, 2, 29, 23, 59, 59, 999999),
+            datetime(2001, 1, 31),
+            datetime(2003, 3, 1, 0, 0, 1),
+            datetime(2016, 12, 31, 12),
+            datetime(2017, 2, 28, 0, 0, 0, 1),
+        ]
+
+        for d1 in dates:
+            for d2 in dates:
+                self.assertEqual(
+                    tuple(helpers.precise_diff(d1, d2)),
+                    tuple(_helpers.precise_diff(d1, d2))
+                )
+                self.assertEqual(
+                    tuple(helpers.precise_diff(d1.date(), d2.date())),
+                    tuple(_helpers.precise_diff(d1.date(), d2.date()))
+                )
+
+            for delta in [(1, 1, 1, 1, 1, 1, 1, 1),
+                          (-1, -13, -1, -40, -25, -61, -61, -1000001),
+                          (0, 25, 0, 0, 0, 0, 0, 999999999),
+                          (0, -1, 0, 1, -1, 1, -1, 1)]:
+                self.assertEqual(
+                    helpers.add_duration(d1, *delta),
+                    _helpers.add_duration(d1, *delta)
+                )
+                self.assertEqual(
+                    helpers.add_duration(d1.date(), *delta),
+                    _helpers.add_duration(d1.date(), *delta)
+                )
+
+    def test_parse_rfc2822(self):
+        from pendulum._extensions import helpers
+
+        implementations = [parse_rfc2822, helpers.parse_rfc2822]
+
+        for parse in implementations:
+            self.assertEqual(
+                (1994, 11, 6, 8, 49, 37, 0),
+                parse('Sun, 06 Nov 1994 08:49:37 GMT')
+            )
+            self.assertEqual(
+                (1994, 11, 6, 8, 49, 37, 0),
+                parse('Sunday, 06-Nov-94 08:49:37 GMT')
+            )
+            self.assertEqual(
+                (1994, 11, 6, 8, 49, 37, None),
+                parse('Sun Nov  6 08:49:37 1994')
+            )
+            self.assertEqual(
+                (2049, 11, 6, 8, 49, 0, 19800),
+                parse('6 nov 49 8:49 +0530')
+            )
+            self.assertEqual(
+                (1997, 11, 21, 9, 55, 6, -25200),
+                parse('Fri, 21 Nov 1997 09:55:06 PDT (Pacific Daylight Time)')
+            )
+            self.assertEqual(
+                (1994, 11, 6, 8, 49, 37, None),
+                parse('Sun, 06 Nov 1994 08:49:37')
+            )
+
+            self.assertRaises(ValueError, parse, '2016-10-06')
+            self.assertRaises(ValueError, parse, 'Sun, 06 Nov 1994')
+            self.assertRaises(ValueError, parse, 'Sun, 06 Foo 1994 08:49:37 GMT')
+            self.assertRaises(ValueError, parse, 'Sun, 06 Nov 1994 08:49:37 CET')
+            self.assertRaises(ValueError, parse, 'Sun, 06 Nov 1994 08:49:37 +0560')
+            self.assertRaises(ValueError, parse, 'Sun, 31 Feb 1994 08:49:37 GMT')
+            self.assertRaises(ValueError, parse, 'Sun, 06 Nov 1994 24:49:37 GMT')
+            self.assertRaises(ValueError, parse, 'Sun, 06 Nov 1994 08:49:37 GMT foo')
+
+    def test_parse_iso8601_pure(self):
+        from pendulum._extensions import helpers
+
+        for text in [
+            '2016-10', '201610', '2012-007', '2009-W53-7', '2008-W39-6T09',
+            '20161006 123456,123456-05', '2016-10-06T12:34:56.123456789+05:30'
+        ]:
+            self.assertEqual(parse_iso8601(text), helpers.parse_iso8601(text))
+
+        for text in ['2016-10-00', '20161131T123456', '2009-05-19 14:', '2012-W0a']:
+            self.assertRaises(ValueError, helpers.parse_iso8601, text)
+
+        self.assertEqual(
+            (2016, 10, 6, 12, 34, 56, 123456, 19800, True, False),
+            helpers.scan_iso8601(b'2016-10-06T12:34:56.123456+05:30')
+        )
+        self.assertEqual(
+            (2016, 10, 1, 0, 0, 0, 0, None, False, True),
+            helpers.scan_iso8601('201610')
+        )
+        self.assertIsNone(helpers.scan_iso8601('foo'))
+        self.assertRaises(ValueError, helpers.scan_iso8601, '2016-10-00')
+
+    def test_try_parse_iso8601(self):
+        self.assertEqual(date(2016, 10, 6), try_parse_iso8601('2016-10-06'))
+        self.assertEqual(
+            datetime(2016, 10, 6, 12, 34, 56),
+            try_parse_iso8601(b'2016-10-06T12:34:56')
+        )
+        self.assertIsNone(try_parse_iso8601('20161306T123456'))
+        self.assertIsNone(try_parse_iso8601('2009-05-19 14:'))
+        self.assertIsNone(try_parse_iso8601('foo'))
+        self.assertIsNone(try_parse_iso8601('2016-10-06' * 10))
+
+    def test_try_parse_rfc2822(self):
+        from pendulum._extensions import helpers
+
+        for parse in [try_parse_rfc2822, helpers.try_parse_rfc2822]:
+            self.assertEqual(
+                (1994, 11, 6, 8, 49, 37, 0),
+                parse('Sun, 06 Nov 1994 08:49:37 GMT')
+            )
+            self.assertIsNone(parse('2016-10-06'))
+            self.assertIsNone(parse('Sun, 31 Feb 1994 08:49:37 GMT'))
+
+    def test_parse_iso8601_duration(self):
+        from pendulum._extensions import helpers
+
+        for parse in [parse_iso8601_duration, helpers.parse_iso8601_duration]:
+            self.assertEqual(
+                (1, 2, 3, 4, 5, 6, 7, 0), parse('P1Y2M3W4DT5H6M7S')
+            )
+            self.assertEqual((0, 0, 0, 3, 4, 0, 0, 0), parse('P3DT4H'))
+            self.assertEqual((0, 0, 0, 0, 0, 15, 0, 500000), parse('PT15M0.5S'))
+            self.assertEqual((0, 0, 0, -1, 0, 0, 0, -43200000000), parse('-P1,5D'))
+
+            for text in ['', 'P', 'PT', 'P1DT', 'P1M1Y', 'PT1D', 'P1H', 'PT1.5M2S', '1D']:
+                self.assertRaises(ValueError, parse, text)
+
+            with self.assertRaises(ValueError) as cm:
+                parse('P1.5Y')
+
+            self.assertEqual(
+                'Fractional years and months are not supported',
+                str(cm.exception)
+            )
+
+    def test_format_iso8601(self):
+        from pendulum._extensions import helpers
+
+        dt = datetime(2016, 10, 6, 12, 34, 56, 123456)
+        for fmt in [format_iso8601, helpers.format_iso8601]:
+            self.assertEqual('2016-10-06T12:34:56.123456', fmt(dt, None))
+            self.assertEqual('2016-10-06T12:34:56', fmt(dt, None, 0))
+            self.assertEqual('2016-10-06 12:34:56.123+05:30', fmt(dt, 19800, 3, ' '))
+            self.assertEqual('20161006T123456-0500', fmt(dt, timedelta(hours=-5), 0, 'T', True))
+            self.assertEqual('2016-10-06T12:34:56-00:19:32', fmt(dt, -1172, 0))
+            self.assertEqual('0001-01-01T00:00:00+00:00', fmt(datetime(1, 1, 1), 0))
+
+            for args in [(None, 7), (None, -1, 'TT'), (86400,), (timedelta(microseconds=1),)]:
+                self.assertRaises(ValueError, fmt, dt, *args)
+
+            self.assertRaises(TypeError, fmt, date(2016, 10, 6), None)
+
+    def test_format_iso8601_many(self):
+        from pendulum._extensions import helpers
+
+        dts = [
+            datetime(2016, 10, 6, 12, 34, 56),
+            datetime(2016, 10, 6, 12, 34, 56, 1, tzinfo=FixedTimezone(3600))
+        ]
+        for fmt in [format_iso8601_many, helpers.format_iso8601_many]:
+            self.assertEqual(
+                ['2016-10-06T12:34:56', '2016-10-06T12:34:56.000001+01:00'],
+                fmt(dts)
+            )
+            self.assertEqual(
+                ['20161006 123456', '20161006 123456+0100'],
+                fmt(dts, 0, ' ', True)
+            )
+            self.assertRaises(TypeError, fmt, [date(2016, 10, 6)])
+
+    def test_format_iso8601_column(self):
+        from pendulum._extensions import helpers
+
+        values = array('q', [1475757296123456, -1, -62135596800000000])
+        offsets = array('q', [3600, -3600, -(1 << 63)])
+        for fmt in [format_iso8601_column, helpers.format_iso8601_column]:
+            self.assertEqual(
+                [
+                    '2016-10-06T12:34:56.123456+01:00',
+                    '1969-12-31T23:59:59.999999-01:00',
+                    '0001-01-01T00:00:00'
+                ],
+                fmt(values, offsets)
+            )
+            self.assertEqual(
+                ['2016-10-06T12:34:56', '1969-12-31T23:59:59', '0001-01-01T00:00:00'],
+                fmt(values, None, 0)
+            )
+            self.assertRaises(ValueError, fmt, array('q', [-62135596800000001]), None)
+            self.assertRaises(ValueError, fmt, values, array('q', [0]))
+
+            # Sequences of integers are also accepted
+            self.assertEqual(
+                ['1970-01-01T00:00:00', '2016-10-06T12:34:56.123456+01:00'],
+                fmt([0, 1475757296123456], (-(1 << 63), 3600))
+            )
+            self.assertEqual([], fmt([], None))
+            self.assertRaises(ValueError, fmt, [0, 0], [0])
+
     def assert_diff(self, diff,
                     years=0, months=0, days=0,
                     hours=0, minutes=0, seconds=0, microseconds=0):
-        self.assertEqual(diff['years'], years)
-        self.assertEqual(diff['months'], months)
-        self.assertEqual(diff['days'], days)
-        self.assertEqual(diff['hours'], hours)
-        self.assertEqual(diff['minutes'], minutes)
-        self.assertEqual(diff['seconds'], seconds)
-        self.assertEqual(diff['microseconds'], microseconds)
+        self.assertEqual(diff.years, years)
+        self.assertEqual(diff.months, months)
+        self.assertEqual(diff.days, days)
+        self.assertEqual(diff.hours, hours)
+        self.assertEqual(diff.minutes, minutes)
+        self.assertEqual(diff.seconds, seconds)
+        self.assertEqual(diff.microseconds, microseconds)
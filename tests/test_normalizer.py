@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import shutil
+import tempfile
+
+from pendulum.__main__ import main
+from pendulum.normalizer import (
+    Normalizer, iter_chunks, normalize_files, read_header
+)
+from . import AbstractTestCase
+
+
+CSV = (
+    b'id,ts\n'
+    b'1,2016-10-16T12:34:56+02:00\n'
+    b'2,"1975-05-21 22:32:11"\n'
+    b'3,1975-05-21T22:32:11.123456Z\n'
+)
+
+NORMALIZED_CSV = (
+    b'id,ts\n'
+    b'1,2016-10-16T10:34:56+00:00\n'
+    b'2,1975-05-21T21:32:11+00:00\n'
+    b'3,1975-05-21T22:32:11.123456+00:00\n'
+)
+
+
+class NormalizerTest(AbstractTestCase):
+
+    def test_normalize(self):
+        normalizer = Normalizer(0, tz='Europe/Paris', to='America/Toronto')
+
+        self.assertEqual(
+            '1975-05-21T17:32:11-04:00',
+            normalizer.normalize('1975-05-21 22:32:11')
+        )
+
+    def test_normalize_with_format(self):
+        normalizer = Normalizer(
+            0, fmt='dddd D MMMM YYYY HH:mm', formatter='alternative', locale='fr'
+        )
+
+        self.assertEqual(
+            'mercredi 21 mai 1975 22:32',
+            normalizer.normalize('1975-05-21T22:32:11')
+        )
+
+    def test_normalize_lines_csv(self):
+        normalizer = Normalizer(1, delimiter=';')
+
+        self.assertEqual(
+            '1;2016-10-16T10:34:56+00:00;"a;b"\r\n\n2;1975-05-21T00:00:00+00:00;c',
+            normalizer.normalize_lines(
+                '1;2016-10-16T12:34:56+02:00;"a;b"\r\n\n2;1975-05-21;c'
+            )
+        )
+
+    def test_normalize_lines_ndjson(self):
+        normalizer = Normalizer('a.ts', input_format='ndjson')
+
+        # The rest of the line is left as it is
+        self.assertEqual(
+            '{"a": {"ts": "1975-05-21T22:32:11+00:00"}, "b": 1.10}\n',
+            normalizer.normalize_lines('{"a": {"ts": "1975-05-21 22:32:11"}, "b": 1.10}\n')
+        )
+        self.assertEqual(
+            '{"a":{"ts":1},"a":{"ts":"1975-05-21T22:32:11+00:00"}}',
+            normalizer.normalize_lines('{"a":{"ts":1},"a":{"ts":"1975-05-21 22:32:11"}}')
+        )
+        self.assertRaises(ValueError, normalizer.normalize_lines, '{"a":{"ts":"1975-05-21"}} 1')
+        self.assertRaises(ValueError, normalizer.normalize_lines, '{"a" {"ts":"1975-05-21"}}')
+        self.assertRaises(ValueError, normalizer.normalize_lines, '{"a":{"ts":"1975-05-21"},"a":1}')
+
+    def test_errors(self):
+        with self.assertRaises(ValueError) as cm:
+            Normalizer(1).normalize_lines('1,foo\n2,bar', 10)
+
+        self.assertEqual("Line 10: Invalid timestamp 'foo'", str(cm.exception))
+
+        self.assertEqual(
+            '1,foo\n2,\n',
+            Normalizer(1, errors='keep').normalize_lines('1,foo\n2,\n')
+        )
+        self.assertEqual(
+            '{"ts":null}',
+            Normalizer('ts', 'ndjson', errors='empty').normalize_lines('{"ts":"foo"}')
+        )
+        self.assertRaises(ValueError, Normalizer(2).normalize_lines, '1,foo')
+        self.assertRaises(ValueError, Normalizer(0).normalize_lines, '"1\n2"')
+        self.assertRaises(ValueError, Normalizer(0).normalize_lines, '1975-05-21,"a\n')
+        self.assertRaises(ValueError, Normalizer('foo', 'ndjson').normalize_lines, '{}')
+        self.assertRaises(ValueError, Normalizer, 0, 'xml')
+        self.assertRaises(ValueError, Normalizer, 0, errors='ignore')
+
+    def test_iter_chunks(self):
+        chunks = list(iter_chunks(io.BytesIO(b'a\nbb\nccc\ndddd'), 3))
+
+        self.assertEqual([b'a\n', b'bb\n', b'ccc\n', b'dddd'], chunks)
+
+    def test_normalize_files(self):
+        for jobs in [1, 2]:
+            output = io.BytesIO()
+            normalize_files(
+                [io.BytesIO(CSV), io.BytesIO(CSV)], output,
+                Normalizer(1, tz='Europe/Paris'),
+                header=True, jobs=jobs, chunk_size=8
+            )
+
+            self.assertEqual(
+                NORMALIZED_CSV + NORMALIZED_CSV[6:],
+                output.getvalue()
+            )
+
+    def test_normalize_files_errors_report_line_numbers(self):
+        output = io.BytesIO()
+
+        with self.assertRaises(ValueError) as cm:
+            normalize_files(
+                [io.BytesIO(CSV + b'4,foo\n')], output, Normalizer(1),
+                header=True, jobs=2, chunk_size=8
+            )
+
+        self.assertEqual("Line 5: Invalid timestamp 'foo'", str(cm.exception))
+
+    def test_normalize_files_rejects_multiline_records_across_chunks(self):
+        data = CSV + b'4,1975-05-21,"multi\nline"\n5,1975-05-21,a\n'
+
+        for chunk_size in [8, 1 << 20]:
+            output = io.BytesIO()
+
+            with self.assertRaises(ValueError) as cm:
+                normalize_files(
+                    [io.BytesIO(data)], output, Normalizer(1),
+                    header=True, jobs=1, chunk_size=chunk_size
+                )
+
+            self.assertEqual(
+                'Line 5: Records spanning several lines are not supported',
+                str(cm.exception)
+            )
+            self.assertNotIn(b'multi', output.getvalue())
+
+    def test_read_header_from_stream(self):
+        # Like a pipe, only returning the bytes written so far
+        f = io.BufferedReader(_Stream([b'id,', b'ts\n', CSV[6:]]))
+
+        header_line, columns = read_header(f)
+        self.assertEqual(b'id,ts\n', header_line)
+        self.assertEqual(['id', 'ts'], columns)
+
+        output = io.BytesIO()
+        normalize_files(
+            [f], output, Normalizer(1, tz='Europe/Paris'),
+            header=True, header_line=header_line, jobs=1
+        )
+
+        self.assertEqual(NORMALIZED_CSV, output.getvalue())
+
+
+class _Stream(io.RawIOBase):
+
+    def __init__(self, pieces):
+        self._pieces = list(pieces)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if not self._pieces:
+            return 0
+
+        piece = self._pieces.pop(0)
+        b[:len(piece)] = piece
+
+        return len(piece)
+
+
+class MainTest(AbstractTestCase):
+
+    def setUp(self):
+        super(MainTest, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.input = os.path.join(self.directory, 'input.csv')
+        self.output = os.path.join(self.directory, 'output.csv')
+
+        with open(self.input, 'wb') as f:
+            f.write(CSV)
+
+    def tearDown(self):
+        super(MainTest, self).tearDown()
+
+        shutil.rmtree(self.directory)
+
+    def test_normalize(self):
+        self.assertEqual(0, main([
+            'normalize', self.input, '-c', 'ts', '--tz', 'Europe/Paris',
+            '-j', '1', '-o', self.output
+        ]))
+
+        with open(self.output, 'rb') as f:
+            self.assertEqual(NORMALIZED_CSV, f.read())
+
+    def test_normalize_unknown_column(self):
+        self.assertEqual(1, main([
+            'normalize', self.input, '-c', 'foo', '-o', self.output
+        ]))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+from .. import AbstractTestCase
+from pendulum.tz import abbreviations
+from pendulum.tz.abbreviations import abbreviation_index, resolve_abbreviation
+
+
+class AbbreviationsTest(AbstractTestCase):
+
+    def test_resolve(self):
+        resolved = resolve_abbreviation('CEST')
+
+        self.assertEqual('CEST', resolved.abbreviation)
+        self.assertEqual(7200, resolved.offset)
+        self.assertIn('Europe/Paris', resolved.zones)
+
+    def test_resolve_is_case_insensitive(self):
+        self.assertEqual(-18000, resolve_abbreviation('est').offset)
+
+    def test_resolve_ambiguous(self):
+        self.assertEqual(-21600, resolve_abbreviation('CST').offset)
+        self.assertEqual(28800, resolve_abbreviation('CST', region='Asia').offset)
+        self.assertEqual(-21600, resolve_abbreviation('CST', region='Foo').offset)
+
+    def test_resolve_unknown(self):
+        self.assertIsNone(resolve_abbreviation('FOO'))
+
+    def test_resolutions_are_bounded(self):
+        abbreviations._resolved.clear()
+
+        resolve_abbreviation('FOO')
+        resolve_abbreviation('cest')
+        resolve_abbreviation('CEST')
+        self.assertEqual([('CEST', None)], list(abbreviations._resolved))
+
+        for i in range(abbreviations._MAX_RESOLVED + 1):
+            resolve_abbreviation('CEST', region='Region{}'.format(i))
+
+        self.assertLessEqual(len(abbreviations._resolved), abbreviations._MAX_RESOLVED)
+
+    def test_index_has_no_numeric_abbreviations(self):
+        self.assertTrue(all(abbrev.isalpha() for abbrev in abbreviation_index()))